@@ -34,10 +34,13 @@ from .errors import DatabaseError, DataError, Error, IntegrityError, InterfaceEr
 from .errors import InternalError, NotSupportedError, OperationalError
 from .errors import ProgrammingError, Warning
 from ._column import Column
+from ._multi import execute_many_conns
+from ._queries import query_cache_info, set_query_cache
 from .dbapi20 import BINARY, DATETIME, NUMBER, ROWID, STRING, Binary, Date
 from .dbapi20 import DateFromTicks, Time, TimeFromTicks, Timestamp, TimestampFromTicks
 from .version import __version__ as __version__  # noqa: F401
 from ._pipeline import AsyncPipeline, Pipeline
+from ._preparing import LFUPreparePolicy, PreparePolicy, StatementStats
 from .connection import Connection
 from .raw_cursor import AsyncRawCursor, AsyncRawServerCursor, RawCursor, RawServerCursor
 from .transaction import AsyncTransaction, Rollback, Transaction
@@ -94,14 +97,20 @@ __all__ = [
     "Copy",
     "Cursor",
     "IsolationLevel",
+    "LFUPreparePolicy",
     "Notify",
     "Pipeline",
+    "PreparePolicy",
     "RawCursor",
     "RawServerCursor",
     "Rollback",
     "ServerCursor",
+    "StatementStats",
     "Transaction",
     "Xid",
+    "execute_many_conns",
+    "query_cache_info",
+    "set_query_cache",
     # DBAPI exports
     "connect",
     "apilevel",
@@ -0,0 +1,548 @@
+"""
+Adapt query results and copy data by column rather than by record.
+"""
+
+# Copyright (C) 2025 The Psycopg Team
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING, Any, NamedTuple
+from datetime import date
+from functools import cache
+from collections.abc import Iterator, Sequence
+
+from . import errors as e
+from . import pq
+from .abc import Buffer, LoadFunc, PyFormat
+
+if TYPE_CHECKING:
+    from .abc import Dumper, Loader, Transformer
+    from ._cursor_base import BaseCursor
+
+BINARY = pq.Format.BINARY
+PY_BINARY = PyFormat.BINARY
+
+_unpack_int2 = struct.Struct("!h").unpack_from
+_unpack_int4 = struct.Struct("!i").unpack_from
+
+
+def load_columns(
+    cursor: BaseCursor[Any, Any], *, numpy: bool = False
+) -> dict[str, Any]:
+    """
+    Load the records of the current result, from the cursor position, by column.
+
+    Return a dict mapping column names to lists of values or, if `!numpy` is
+    true, to NumPy arrays. The row factory is not used.
+
+    Raise `~gaussdb.ProgrammingError` if the result has duplicate column names.
+    """
+    res = cursor.pgresult
+    assert res
+    tx = cursor._tx
+    description = cursor.description or ()
+    names = [column.name for column in description]
+    if len(set(names)) != len(names):
+        dups = sorted({n for n in names if names.count(n) > 1})
+        raise e.ProgrammingError(
+            f"cannot fetch by column a result with duplicate column names:"
+            f" {', '.join(dups)}; use aliases in the query to make them unique"
+        )
+
+    rv: dict[str, Any] = {}
+    for col, column in enumerate(description):
+        values = res.get_column(col)
+        if cursor._pos:
+            values = values[cursor._pos :]
+        oid = res.ftype(col)
+        loader = tx.get_loader(oid, res.fformat(col))  # type: ignore[arg-type]
+        if numpy:
+            rv[column.name] = _load_array(values, oid, loader)
+        else:
+            rv[column.name] = _load_list(values, loader.load)
+
+    return rv
+
+
+def _load_list(values: Sequence[Buffer | None], load: LoadFunc) -> list[Any]:
+    return [(load(v) if v is not None else None) for v in values]
+
+
+class _NumpyType(NamedTuple):
+    """How to convert a column of a builtin type to a NumPy array."""
+
+    dtype: str  # the dtype of the array returned
+    text_loader: type[Loader]
+    binary_loader: type[Loader]
+    wire_dtype: str  # the dtype of the binary representation
+    epoch: int = 0  # to add to the binary value to get an UNIX epoch offset
+    infinity: bool = False  # whether min and max binary values are infinity
+
+
+@cache
+def _get_numpy_types() -> dict[int, _NumpyType]:
+    from . import _oids
+    from .types import bool as bool_
+    from .types import datetime as dt
+    from .types import numeric
+
+    Int, Float = numeric.IntLoader, numeric.FloatLoader
+    Date, Ts = dt.DateLoader, dt.TimestampLoader
+
+    # Days and microseconds between the Unix and the GaussDB epoch.
+    epoch_days = dt._pg_date_epoch_days - date(1970, 1, 1).toordinal()
+    epoch_us = epoch_days * 86_400 * 1_000_000
+
+    return {
+        _oids.INT2_OID: _NumpyType("int16", Int, numeric.Int2BinaryLoader, ">i2"),
+        _oids.INT4_OID: _NumpyType("int32", Int, numeric.Int4BinaryLoader, ">i4"),
+        _oids.INT8_OID: _NumpyType("int64", Int, numeric.Int8BinaryLoader, ">i8"),
+        _oids.OID_OID: _NumpyType("uint32", Int, numeric.OidBinaryLoader, ">u4"),
+        _oids.INT1_OID: _NumpyType("uint8", Int, numeric.Int1BinaryLoader, ">u1"),
+        _oids.UINT1_OID: _NumpyType("uint8", Int, numeric.UInt1BinaryLoader, ">u1"),
+        _oids.UINT2_OID: _NumpyType("uint16", Int, numeric.UInt2BinaryLoader, ">u2"),
+        _oids.UINT4_OID: _NumpyType("uint32", Int, numeric.UInt4BinaryLoader, ">u4"),
+        _oids.UINT8_OID: _NumpyType("uint64", Int, numeric.UInt8BinaryLoader, ">u8"),
+        _oids.FLOAT4_OID: _NumpyType(
+            "float32", Float, numeric.Float4BinaryLoader, ">f4"
+        ),
+        _oids.FLOAT8_OID: _NumpyType(
+            "float64", Float, numeric.Float8BinaryLoader, ">f8"
+        ),
+        _oids.BOOL_OID: _NumpyType(
+            "bool", bool_.BoolLoader, bool_.BoolBinaryLoader, "?"
+        ),
+        _oids.DATE_OID: _NumpyType(
+            "datetime64[D]", Date, dt.DateBinaryLoader, ">i4", epoch_days, True
+        ),
+        _oids.TIMESTAMP_OID: _NumpyType(
+            "datetime64[us]", Ts, dt.TimestampBinaryLoader, ">i8", epoch_us, True
+        ),
+    }
+
+
+def _load_array(values: Sequence[Buffer | None], oid: int, loader: Loader) -> Any:
+    np = _import_numpy()
+
+    nt = _get_numpy_types().get(oid)
+    if nt and None not in values:
+        # Don't bypass the loader if it was customised
+        if loader.format == BINARY and type(loader) is nt.binary_loader:
+            if (rv := _load_array_binary(np, values, nt)) is not None:
+                return rv
+        elif type(loader) is nt.text_loader:
+            return np.array(_load_list(values, loader.load), dtype=nt.dtype)
+
+    # Fall back to one Python object per value.
+    return np.fromiter(_load_list(values, loader.load), dtype=object, count=len(values))
+
+
+def _load_array_binary(np: Any, values: Sequence[Buffer | None], nt: _NumpyType) -> Any:
+    wire = np.dtype(nt.wire_dtype)
+    data = b"".join(values)  # type: ignore[arg-type]
+    if len(data) != wire.itemsize * len(values):
+        return None
+
+    return _convert_wire_array(np, np.frombuffer(data, dtype=wire), nt)
+
+
+def _convert_wire_array(np: Any, arr: Any, nt: _NumpyType) -> Any:
+    """
+    Convert an array of binary values to the array returned to the user.
+
+    Return `!None` if the array contains infinity values.
+    """
+    # astype() byteswaps to the native order, and makes the array writable.
+    if not nt.epoch:
+        return arr.astype(nt.dtype)
+
+    if nt.infinity:
+        info = np.iinfo(arr.dtype)
+        if ((arr == info.min) | (arr == info.max)).any():
+            # Let the loader deal with (or complain about) infinity values.
+            return None
+
+    return (arr.astype("int64") + nt.epoch).astype(nt.dtype)
+
+
+class BufferColumn(NamedTuple):
+    """
+    A column of values returned in their raw GaussDB representation.
+
+    The value of the `!i`-th record is ``data[offsets[i]:offsets[i + 1]]``,
+    or `!None` if ``nulls[i]`` is true.
+    """
+
+    data: bytes  #: The values of the column, concatenated.
+    offsets: Any  #: A NumPy array of int64 with the boundaries of the values.
+    nulls: Any  #: A NumPy array of bool, true where the values are NULL.
+
+    def values(self) -> list[bytes | None]:
+        """Return the values of the column as a list of `!bytes` or `!None`."""
+        data = self.data
+        bounds = self.offsets.tolist()
+        return [
+            (data[bounds[i] : bounds[i + 1]] if not null else None)
+            for i, null in enumerate(self.nulls.tolist())
+        ]
+
+
+def load_copy_batch(
+    rows: Sequence[Buffer], types: Sequence[int], tx: Transformer
+) -> list[Any]:
+    """
+    Convert a sequence of binary COPY records into a list of columns.
+
+    The columns whose type is known and fixed-width (e.g. numbers, dates) are
+    returned as NumPy arrays (masked arrays, if they contain NULLs); the other
+    columns are returned as `BufferColumn`.
+    """
+    np = _import_numpy()
+    nrows = len(rows)
+    nfields = _unpack_int2(rows[0], 0)[0]
+    if types and len(types) != nfields:
+        raise e.ProgrammingError(
+            f"cannot load records of {nfields} items:" f" {len(types)} types specified"
+        )
+
+    # Width and converter of the columns that can be returned as arrays
+    numpy_types = _get_numpy_types()
+    widths: list[int] = []
+    converters: list[_NumpyType | None] = []
+    for oid in types:
+        nt = numpy_types.get(oid)
+        if nt and type(tx.get_loader(oid, BINARY)) is nt.binary_loader:
+            converters.append(nt)
+            widths.append(np.dtype(nt.wire_dtype).itemsize)
+        else:
+            converters.append(None)
+            widths.append(-1)
+
+    data = b"".join(rows)
+    buf = np.frombuffer(data, dtype="uint8")
+
+    # Find the position of every value in the data, and its length (-1 for
+    # NULL). Cheap if all the records have the same, known, layout.
+    fields = _find_fixed_fields(np, buf, rows, widths) if types else None
+    if fields is None:
+        fields = _find_fields(np, data, nrows, nfields)
+    starts, lengths = fields
+
+    rv: list[Any] = []
+    for col in range(nfields):
+        nulls = lengths[:, col] < 0
+        nt = converters[col] if types else None
+        if nt:
+            if (lengths[:, col][~nulls] != widths[col]).any():
+                raise e.DataError(
+                    f"unexpected value length in column {col} of binary copy"
+                )
+            wire = _gather_fixed(np, buf, starts[:, col], nulls, widths[col])
+            arr = _convert_wire_array(np, wire.view(nt.wire_dtype), nt)
+            if arr is not None:
+                rv.append(np.ma.masked_array(arr, mask=nulls) if nulls.any() else arr)
+                continue
+
+            # Let the loader deal with the values it can't be bypassed for.
+            load = tx.get_loader(types[col], BINARY).load
+            column = _gather_buffers(np, buf, starts[:, col], lengths[:, col])
+            rv.append(np.array(_load_list(column.values(), load), dtype=object))
+        else:
+            rv.append(_gather_buffers(np, buf, starts[:, col], lengths[:, col]))
+
+    return rv
+
+
+def _find_fields(np: Any, data: bytes, nrows: int, nfields: int) -> tuple[Any, Any]:
+    starts: list[int] = []
+    lengths: list[int] = []
+    pos = 0
+    for _ in range(nrows):
+        if _unpack_int2(data, pos)[0] != nfields:
+            raise e.DataError("binary copy records have different number of fields")
+        pos += 2
+        for _ in range(nfields):
+            length = _unpack_int4(data, pos)[0]
+            pos += 4
+            starts.append(pos)
+            lengths.append(length)
+            if length > 0:
+                pos += length
+
+    if pos != len(data):
+        raise e.DataError("unexpected data found after binary copy records")
+
+    shape = (nrows, nfields)
+    return (
+        np.array(starts, dtype="int64").reshape(shape),
+        np.array(lengths, dtype="int32").reshape(shape),
+    )
+
+
+def _find_fixed_fields(
+    np: Any, buf: Any, rows: Sequence[Buffer], widths: Sequence[int]
+) -> tuple[Any, Any] | None:
+    if min(widths) < 0:
+        return None
+
+    # Each record is the number of fields, then the length and the value of
+    # each field. Without NULLs, all the records have the same size.
+    size = 2 + sum(4 + w for w in widths)
+    if any(len(row) != size for row in rows):
+        return None
+
+    offsets = np.cumsum([2 + 4] + [4 + w for w in widths[:-1]])
+    starts = np.arange(len(rows), dtype="int64")[:, None] * size + offsets
+    lengths = np.broadcast_to(np.array(widths, dtype="int32"), starts.shape)
+
+    # Check that the data really have the expected layout.
+    nulls = np.zeros(len(rows), dtype="bool")
+    nfields = _gather_fixed(np, buf, starts[:, 0] - 6, nulls, 2).view(">i2")
+    if (nfields != len(widths)).any():
+        return None
+    for col, width in enumerate(widths):
+        words = _gather_fixed(np, buf, starts[:, col] - 4, nulls, 4).view(">i4")
+        if (words != width).any():
+            return None
+
+    return starts, lengths
+
+
+def _gather_fixed(np: Any, buf: Any, starts: Any, nulls: Any, width: int) -> Any:
+    """
+    Return an array with `!width` bytes from every position in `!starts`.
+
+    The values in the `!nulls` positions are zeroed.
+    """
+    starts = np.where(nulls, 0, starts)
+    rv = buf[starts[:, None] + np.arange(width)]
+    rv[nulls] = 0
+    return rv.reshape(-1)
+
+
+def _gather_buffers(np: Any, buf: Any, starts: Any, lengths: Any) -> BufferColumn:
+    nulls = lengths < 0
+    lengths = np.where(nulls, 0, lengths).astype("int64")
+    offsets = np.zeros(len(lengths) + 1, dtype="int64")
+    np.cumsum(lengths, out=offsets[1:])
+    index = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+    return BufferColumn(buf[index].tobytes(), offsets, nulls)
+
+
+def dump_copy_columns(
+    columns: Sequence[Any], types: Sequence[int], tx: Transformer, size: int
+) -> Iterator[bytes]:
+    """
+    Convert a sequence of columns into binary COPY records.
+
+    Yield the data for `!size` records at time. Arrays of the types supported
+    by the default binary dumpers are converted in a vectorised way; NULLs can
+    be specified using masked arrays. `BufferColumn` values are sent as they
+    are; other sequences are dumped value by value.
+    """
+    np = _import_numpy()
+    if types and len(types) != len(columns):
+        raise e.ProgrammingError(
+            f"cannot dump {len(columns)} columns: {len(types)} types specified"
+        )
+
+    nrows = len(columns[0]) if columns else 0
+    for col, column in enumerate(columns):
+        if _column_len(column) != nrows:
+            raise e.ProgrammingError(
+                f"column {col} has {_column_len(column)} items, expected {nrows}"
+            )
+
+    # Convert every column into a (fixed-width values, None, nulls) or a
+    # (concatenated values, offsets, nulls) tuple.
+    prepared = [
+        _prepare_column(np, column, types[col] if types else 0, tx)
+        for col, column in enumerate(columns)
+    ]
+
+    for row0 in range(0, nrows, size):
+        row1 = min(row0 + size, nrows)
+        chunk = [
+            (
+                (values[row0:row1], None, nulls[row0:row1])
+                if offsets is None
+                else (values, offsets[row0 : row1 + 1], nulls[row0:row1])
+            )
+            for values, offsets, nulls in prepared
+        ]
+        yield _format_records(np, chunk, row1 - row0)
+
+
+def _column_len(column: Any) -> int:
+    return len(column.nulls) if isinstance(column, BufferColumn) else len(column)
+
+
+def _prepare_column(
+    np: Any, column: Any, oid: int, tx: Transformer
+) -> tuple[Any, Any, Any]:
+    if isinstance(column, BufferColumn):
+        values = np.frombuffer(column.data, dtype="uint8")
+        return values, np.asarray(column.offsets, "int64"), np.asarray(column.nulls)
+
+    if isinstance(column, np.ndarray):
+        nulls = np.ma.getmaskarray(column)
+        data = np.ma.getdata(column)
+        if data.ndim == 1 and len(data):
+            if oid:
+                dumper = tx.get_dumper_by_oid(oid, BINARY)
+            else:
+                dumper = tx.get_dumper(data[0], PY_BINARY)
+            if (oid := _get_numpy_dumpers().get(type(dumper), 0)) and (
+                (wire := _dump_array(np, data, nulls, _get_numpy_types()[oid]))
+                is not None
+            ):
+                return wire, None, nulls
+
+        values = [(v if not null else None) for v, null in zip(data, nulls)]
+    else:
+        values = list(column)
+
+    # Fall back to one dump per value.
+    if oid:
+        dump = tx.get_dumper_by_oid(oid, BINARY).dump
+        dumps = [(dump(v) if v is not None else None) for v in values]
+    else:
+        dumps = [
+            (tx.get_dumper(v, PY_BINARY).dump(v) if v is not None else None)
+            for v in values
+        ]
+    nulls = np.array([d is None for d in dumps], dtype="bool")
+    offsets = np.zeros(len(dumps) + 1, dtype="int64")
+    np.cumsum([(len(d) if d is not None else 0) for d in dumps], out=offsets[1:])
+    data = b"".join(d for d in dumps if d is not None)
+    return np.frombuffer(data, dtype="uint8"), offsets, nulls
+
+
+def _dump_array(np: Any, data: Any, nulls: Any, nt: _NumpyType) -> Any:
+    """
+    Convert an array to the array of its binary representation.
+
+    Return `!None` if the array cannot be converted in a vectorised way.
+    """
+    wire = np.dtype(nt.wire_dtype)
+    kind = data.dtype.kind
+    if nt.epoch:
+        if kind != "M":
+            return None
+        data = data.astype(nt.dtype).astype("int64") - nt.epoch
+    elif kind not in (
+        "b" if wire.kind == "b" else "biu" if wire.kind in "iu" else "biuf"
+    ):
+        return None
+
+    if wire.kind in "iu" and not np.can_cast(
+        data.dtype, wire.newbyteorder("="), "safe"
+    ):
+        info = np.iinfo(wire)
+        valid = data[~nulls]
+        if len(valid) and (valid.min() < info.min or valid.max() > info.max):
+            raise e.DataError(f"values out of range for type {wire.name}")
+
+    return data.astype(wire)
+
+
+@cache
+def _get_numpy_dumpers() -> dict[type[Dumper], int]:
+    """Map the binary dumpers which can be vectorised to the oid they dump."""
+    from . import _oids
+    from .types import bool as bool_
+    from .types import datetime as dt
+    from .types import numeric
+    from .types import numpy as np_
+
+    return {
+        numeric.Int2BinaryDumper: _oids.INT2_OID,
+        numeric.Int4BinaryDumper: _oids.INT4_OID,
+        numeric.Int8BinaryDumper: _oids.INT8_OID,
+        numeric.OidBinaryDumper: _oids.OID_OID,
+        numeric.Int1BinaryDumper: _oids.INT1_OID,
+        numeric.UInt1BinaryDumper: _oids.UINT1_OID,
+        numeric.UInt2BinaryDumper: _oids.UINT2_OID,
+        numeric.UInt4BinaryDumper: _oids.UINT4_OID,
+        numeric.UInt8BinaryDumper: _oids.UINT8_OID,
+        numeric.Float4BinaryDumper: _oids.FLOAT4_OID,
+        numeric.FloatBinaryDumper: _oids.FLOAT8_OID,
+        bool_.BoolBinaryDumper: _oids.BOOL_OID,
+        dt.DateBinaryDumper: _oids.DATE_OID,
+        dt.DatetimeNoTzBinaryDumper: _oids.TIMESTAMP_OID,
+        np_.NPInt16BinaryDumper: _oids.INT2_OID,
+        np_.NPInt32BinaryDumper: _oids.INT4_OID,
+        np_.NPInt64BinaryDumper: _oids.INT8_OID,
+        np_.NPUInt8BinaryDumper: _oids.UINT1_OID,
+        np_.NPUInt16BinaryDumper: _oids.UINT2_OID,
+        np_.NPUInt32BinaryDumper: _oids.UINT4_OID,
+        np_.NPUInt64BinaryDumper: _oids.UINT8_OID,
+    }
+
+
+def _format_records(
+    np: Any, columns: Sequence[tuple[Any, Any, Any]], nrows: int
+) -> bytes:
+    nfields = len(columns)
+    if all(offsets is None and not nulls.any() for _, offsets, nulls in columns):
+        # All the records have the same layout: fill them in one go.
+        fields = [("nfields", ">i2")]
+        for col, (values, _, _) in enumerate(columns):
+            fields.append((f"l{col}", ">i4"))
+            fields.append((f"v{col}", values.dtype))
+        records = np.empty(nrows, dtype=fields)
+        records["nfields"] = nfields
+        for col, (values, _, _) in enumerate(columns):
+            records[f"l{col}"] = values.dtype.itemsize
+            records[f"v{col}"] = values
+        return records.tobytes()  # type: ignore[no-any-return]
+
+    # Size of the values, -1 for NULLs, and position of the fields in the data.
+    lengths = np.empty((nrows, nfields), dtype="int64")
+    for col, (values, offsets, nulls) in enumerate(columns):
+        if offsets is None:
+            lengths[:, col] = values.dtype.itemsize
+        else:
+            lengths[:, col] = np.diff(offsets)
+        lengths[nulls, col] = -1
+
+    sizes = 4 + np.maximum(lengths, 0)
+    ends = np.cumsum(2 + sizes.sum(axis=1))
+    starts = np.concatenate(([0], ends[:-1]))
+    fstarts = starts[:, None] + 2 + np.cumsum(sizes, axis=1) - sizes
+
+    out = np.zeros(ends[-1], dtype="uint8")
+    _scatter(np, out, starts, np.full(nrows, nfields, dtype=">i2"))
+    for col, (values, offsets, nulls) in enumerate(columns):
+        _scatter(np, out, fstarts[:, col], lengths[:, col].astype(">i4"))
+        if offsets is None:
+            _scatter(np, out, fstarts[~nulls, col] + 4, values[~nulls])
+        else:
+            valid = ~nulls
+            lens = lengths[valid, col]
+            # Position of every byte within its value
+            within = np.arange(lens.sum()) - np.repeat(np.cumsum(lens) - lens, lens)
+            dst = np.repeat(fstarts[valid, col] + 4, lens) + within
+            src = np.repeat(offsets[:-1][valid], lens) + within
+            out[dst] = values[src]
+
+    return out.tobytes()  # type: ignore[no-any-return]
+
+
+def _scatter(np: Any, out: Any, starts: Any, values: Any) -> None:
+    """Copy every item of the `!values` array at the `!starts` positions."""
+    width = values.dtype.itemsize
+    index = starts[:, None] + np.arange(width)
+    out[index.reshape(-1)] = values.view("uint8")
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "adapting columns as arrays requires the package 'numpy' to be installed"
+        ) from None
+
+    return numpy
@@ -13,19 +13,21 @@ from weakref import ReferenceType, ref
 from warnings import warn
 from functools import partial
 from collections import deque
+from collections.abc import Sequence
 
 from . import errors as e
 from . import gaussdb_, generators, pq
 from .abc import PQGen, PQGenConn, Query
-from .sql import SQL, Composable
+from .sql import SQL, Compiled, Composable
 from ._tpc import Xid
 from .rows import Row
-from .adapt import AdaptersMap
+from .adapt import AdaptersMap, PyFormat, Transformer
 from ._enums import IsolationLevel
 from ._compat import LiteralString, Self, TypeAlias, TypeVar
 from .pq.misc import connection_summary
+from ._queries import _query2pg_nocache
 from ._pipeline import BasePipeline
-from ._preparing import PrepareManager
+from ._preparing import PrepareManager, PreparePolicy, StatementStats
 from ._capabilities import capabilities
 from ._connection_info import ConnectionInfo
 
@@ -125,6 +127,7 @@ class BaseConnection(Generic[Row]):
         self._pool: BasePool | None
 
         self._pipeline: BasePipeline | None = None
+        self._auto_pipeline = False
 
         # Time after which the connection should be closed
         self._expire_at: float
@@ -385,6 +388,16 @@ class BaseConnection(Generic[Row]):
         for cb in self._notify_handlers:
             cb(n)
 
+    @property
+    def auto_pipeline(self) -> bool:
+        """
+        `!True` if the connection enters :ref:`pipeline mode <auto-pipeline>`
+        automatically on `~Cursor.execute()`.
+
+        The value is set by the `!auto_pipeline` parameter of `connect()`.
+        """
+        return self._auto_pipeline
+
     @property
     def prepare_threshold(self) -> int | None:
         """
@@ -420,6 +433,90 @@ class BaseConnection(Generic[Row]):
             value = sys.maxsize
         self._prepared.prepared_max = value
 
+    @property
+    def prepare_policy(self) -> PreparePolicy:
+        """
+        The policy deciding which statements to prepare and which to deallocate.
+
+        The default policy is a `PreparePolicy` instance.
+        """
+        return self._prepared.policy
+
+    @prepare_policy.setter
+    def prepare_policy(self, value: PreparePolicy) -> None:
+        self._prepared.policy = value
+
+    @property
+    def prepared_timing(self) -> bool:
+        """
+        Measure the time spent executing the statements.
+
+        If `!True`, the time is reported in the `prepared_stats()`. It is
+        `!False` by default, because measuring it has a cost.
+        """
+        return self._prepared.timing
+
+    @prepared_timing.setter
+    def prepared_timing(self, value: bool) -> None:
+        self._prepared.timing = value
+
+    def prepared_stats(self) -> list[StatementStats]:
+        """
+        Return statistics about the statements executed on the connection.
+
+        Only the statements currently tracked by the prepared statements cache
+        are included: the statements prepared and the ones that may be
+        prepared in the future.
+        """
+        return self._prepared.stats()
+
+    def compile(
+        self, query: Query, *, types: Sequence[int | str] | None = None
+    ) -> Compiled:
+        """
+        Parse a query in advance, in order to execute it many times.
+
+        :param query: The query to compile.
+        :param types: The types of the query parameters, as oids or type
+            names (e.g. ``int4``, ``text[]``), in the order of the
+            placeholders. If specified, the dumpers used to adapt the
+            parameters are chosen once for all.
+        """
+        enc = self.pgconn._encoding
+        if isinstance(query, str):
+            bquery = query.encode(enc)
+        elif isinstance(query, Composable):
+            bquery = query.as_bytes(self)
+        else:
+            bquery = query
+
+        converted = _query2pg_nocache(bquery, enc)
+        if types is None:
+            return Compiled(bquery, enc, converted)
+
+        formats = converted[1]
+        if len(types) != len(formats):
+            raise e.ProgrammingError(
+                f"the query has {len(formats)} parameters but {len(types)}"
+                " types were specified"
+            )
+        tx = Transformer(self)
+        registry = self.adapters.types
+        dumpers = []
+        for t, fmt in zip(types, formats):
+            oid = t if isinstance(t, int) else registry.get_oid(t)
+            if fmt == PyFormat.TEXT:
+                dumpers.append(tx.get_dumper_by_oid(oid, TEXT))
+                continue
+            try:
+                dumpers.append(tx.get_dumper_by_oid(oid, BINARY))
+            except e.ProgrammingError:
+                if fmt == PyFormat.BINARY:
+                    raise
+                dumpers.append(tx.get_dumper_by_oid(oid, TEXT))
+
+        return Compiled(bquery, enc, converted, dumpers)
+
     # Generators to perform high-level operations on the connection
     #
     # These operations are expressed in terms of non-blocking generators
@@ -524,6 +621,48 @@ class BaseConnection(Generic[Row]):
                     " from sending closing prepared statement message"
                 )
 
+    def _deallocate_many(self, names: Sequence[bytes]) -> PQGen[None]:
+        """
+        Deallocate several prepared statements in a single round trip.
+
+        Use a pipeline of protocol-level commands if possible; otherwise send
+        all the DEALLOCATE statements in a single query.
+        """
+        if len(names) == 1 or self._pipeline:
+            # In pipeline mode the commands are already sent in batch.
+            for name in names:
+                yield from self._deallocate(name)
+            return
+
+        if not _HAS_SEND_CLOSE:
+            yield from self._exec_command(
+                b"; ".join(b"DEALLOCATE " + name for name in names)
+            )
+            return
+
+        self._check_connection_ok()
+
+        pgconn = self.pgconn
+        results: list[PGresult] = []
+        with generators.pipeline_mode(pgconn):
+            for name in names:
+                pgconn.send_close_prepared(name)
+            pgconn.pipeline_sync()
+            yield from generators.send(pgconn)
+            for name in names:
+                results.extend((yield from generators.fetch_many(pgconn)))
+            yield from generators.fetch_many(pgconn)  # the sync result
+
+        for result in results:
+            if result.status != COMMAND_OK:
+                if result.status == FATAL_ERROR:
+                    raise e.error_from_result(result, encoding=pgconn._encoding)
+                else:
+                    raise e.InterfaceError(
+                        f"unexpected result {pq.ExecStatus(result.status).name}"
+                        " from sending closing prepared statement message"
+                    )
+
     def _check_connection_ok(self) -> None:
         if self.pgconn.status == OK:
             return
@@ -535,6 +674,40 @@ class BaseConnection(Generic[Row]):
             f" in status {self.pgconn.status}"
         )
 
+    def _new_pipeline(self) -> BasePipeline:
+        raise NotImplementedError
+
+    def _enter_auto_pipeline_gen(self) -> PQGen[None]:
+        """Generator to enter the pipeline mode of an `auto_pipeline` connection."""
+        if self._pipeline:
+            return
+
+        pipeline = self._new_pipeline()
+        pipeline._auto = True
+        yield from pipeline._enter_gen()
+        self._pipeline = pipeline
+
+    def _exit_auto_pipeline_gen(self) -> PQGen[None]:
+        """
+        Generator to sync and exit the pipeline entered by `auto_pipeline`.
+
+        Do nothing if the pipeline was entered explicitly or is nested in one
+        entered explicitly.
+        """
+        pipeline = self._pipeline
+        if not (pipeline and pipeline._auto and pipeline.level == 1):
+            return
+
+        self._pipeline = None
+        exc = None
+        try:
+            yield from pipeline._exit_gen()
+        except BaseException as ex:
+            exc = ex
+            raise
+        finally:
+            pipeline._exit(exc)
+
     def _start_query(self) -> PQGen[None]:
         """Generator to start a transaction if necessary."""
         if self._autocommit:
@@ -12,13 +12,14 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from types import TracebackType
 from typing import TYPE_CHECKING, Any
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 
 from . import errors as e
 from . import pq
 from ._compat import Self
 from ._acompat import Queue, Worker, gather, spawn
-from ._copy_base import MAX_BUFFER_SIZE, PREFER_FLUSH, QUEUE_SIZE, BaseCopy
+from ._copy_base import BATCH_SIZE, MAX_BUFFER_SIZE, PREFER_FLUSH, QUEUE_SIZE
+from ._copy_base import BaseCopy
 from .generators import copy_end, copy_to
 
 if TYPE_CHECKING:
@@ -119,6 +120,31 @@ class Copy(BaseCopy["Connection[Any]"]):
         """
         return self.connection.wait(self._read_row_gen())
 
+    def read_batches(self, size: int = BATCH_SIZE) -> Iterator[list[Any]]:
+        """
+        Iterate on the result of a binary :sql:`COPY TO` operation by batches.
+
+        Every batch contains up to `!size` records and is returned by column:
+        see `read_batch()` for details.
+        """
+        while True:
+            batch = self.read_batch(size)
+            if batch is None:
+                break
+            yield batch
+
+    def read_batch(self, size: int = BATCH_SIZE) -> list[Any] | None:
+        """
+        Read up to `!size` records after a binary :sql:`COPY TO` operation.
+
+        Return a list with one item per column: a NumPy array for the
+        fixed-width types specified by `set_types()`, with a mask if the
+        column contains NULLs, otherwise a `~gaussdb.copy.BufferColumn` with
+        the values still in binary format. Return `!None` when the data is
+        finished.
+        """
+        return self.connection.wait(self._read_batch_gen(size))
+
     def write(self, buffer: Buffer | str) -> None:
         """
         Write a block of data to a table after a :sql:`COPY FROM` operation.
@@ -136,6 +162,16 @@ class Copy(BaseCopy["Connection[Any]"]):
         if data:
             self._write(data)
 
+    def write_columns(self, columns: Sequence[Any] | Mapping[Any, Any]) -> None:
+        """
+        Write columns of data to a table after a binary :sql:`COPY FROM`.
+
+        `!columns` is a sequence of columns, or a mapping whose values are
+        the columns, in the same order of the fields in the :sql:`COPY`.
+        """
+        for data in self._write_columns(columns):
+            self._write(data)
+
     def finish(self, exc: BaseException | None) -> None:
         """Terminate the copy operation and free the resources allocated.
 
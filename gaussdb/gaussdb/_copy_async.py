@@ -9,13 +9,14 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from types import TracebackType
 from typing import TYPE_CHECKING, Any
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
 
 from . import errors as e
 from . import pq
 from ._compat import Self
 from ._acompat import AQueue, AWorker, agather, aspawn
-from ._copy_base import MAX_BUFFER_SIZE, PREFER_FLUSH, QUEUE_SIZE, BaseCopy
+from ._copy_base import BATCH_SIZE, MAX_BUFFER_SIZE, PREFER_FLUSH, QUEUE_SIZE
+from ._copy_base import BaseCopy
 from .generators import copy_end, copy_to
 
 if TYPE_CHECKING:
@@ -116,6 +117,31 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
         """
         return await self.connection.wait(self._read_row_gen())
 
+    async def read_batches(self, size: int = BATCH_SIZE) -> AsyncIterator[list[Any]]:
+        """
+        Iterate on the result of a binary :sql:`COPY TO` operation by batches.
+
+        Every batch contains up to `!size` records and is returned by column:
+        see `read_batch()` for details.
+        """
+        while True:
+            batch = await self.read_batch(size)
+            if batch is None:
+                break
+            yield batch
+
+    async def read_batch(self, size: int = BATCH_SIZE) -> list[Any] | None:
+        """
+        Read up to `!size` records after a binary :sql:`COPY TO` operation.
+
+        Return a list with one item per column: a NumPy array for the
+        fixed-width types specified by `set_types()`, with a mask if the
+        column contains NULLs, otherwise a `~gaussdb.copy.BufferColumn` with
+        the values still in binary format. Return `!None` when the data is
+        finished.
+        """
+        return await self.connection.wait(self._read_batch_gen(size))
+
     async def write(self, buffer: Buffer | str) -> None:
         """
         Write a block of data to a table after a :sql:`COPY FROM` operation.
@@ -133,6 +159,16 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
         if data:
             await self._write(data)
 
+    async def write_columns(self, columns: Sequence[Any] | Mapping[Any, Any]) -> None:
+        """
+        Write columns of data to a table after a binary :sql:`COPY FROM`.
+
+        `!columns` is a sequence of columns, or a mapping whose values are
+        the columns, in the same order of the fields in the :sql:`COPY`.
+        """
+        for data in self._write_columns(columns):
+            await self._write(data)
+
     async def finish(self, exc: BaseException | None) -> None:
         """Terminate the copy operation and free the resources allocated.
 
@@ -11,7 +11,7 @@ import sys
 import struct
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, Optional, Tuple
-from collections.abc import Sequence
+from collections.abc import Iterator, Mapping, Sequence
 
 from . import adapt
 from . import errors as e
@@ -19,6 +19,7 @@ from . import pq
 from .abc import Buffer, ConnectionType, PQGen, Transformer
 from .pq.misc import connection_summary
 from ._cmodule import _gaussdb
+from ._columnar import dump_copy_columns, load_copy_batch
 from .generators import copy_from
 
 if TYPE_CHECKING:
@@ -55,6 +56,10 @@ QUEUE_SIZE = 1024
 # more performing than accumulating a larger buffer. See #746 for details.
 PREFER_FLUSH = sys.platform == "darwin"
 
+# Default number of records returned by Copy.read_batch(), and number of
+# records sent at time by Copy.write_columns().
+BATCH_SIZE = 10_000
+
 IS_BINARY_SIGNATURE = "is_binary_signature"
 
 
@@ -105,6 +110,7 @@ class BaseCopy(Generic[ConnectionType]):
         else:
             self.formatter = TextFormatter(tx, encoding=self._pgconn._encoding)
 
+        self._types: list[int] = []
         self._finished = False
 
     def __repr__(self) -> str:
@@ -137,6 +143,7 @@ class BaseCopy(Generic[ConnectionType]):
         """
         registry = self.cursor.adapters.types
         oids = [t if isinstance(t, int) else registry.get_oid(t) for t in types]
+        self._types = oids
 
         if self._direction == COPY_IN:
             self.formatter.transformer.set_dumper_types(oids, self.formatter.format)
@@ -182,6 +189,34 @@ class BaseCopy(Generic[ConnectionType]):
 
         return row
 
+    def _read_batch_gen(self, size: int) -> PQGen[list[Any] | None]:
+        if not isinstance(self.formatter, BinaryFormatter):
+            raise e.NotSupportedError("reading batches requires a binary COPY")
+
+        rows: list[Buffer] = []
+        while len(rows) < size:
+            data = yield from self._read_gen()
+            if not data:
+                break
+            if row := self.formatter.strip_row(data):
+                rows.append(row)
+
+        if not rows:
+            return None
+
+        return load_copy_batch(rows, self._types, self.formatter.transformer)
+
+    def _write_columns(
+        self, columns: Sequence[Any] | Mapping[Any, Any]
+    ) -> Iterator[Buffer]:
+        if not isinstance(self.formatter, BinaryFormatter):
+            raise e.NotSupportedError("writing columns requires a binary COPY")
+
+        if isinstance(columns, Mapping):
+            columns = list(columns.values())
+
+        return self.formatter.write_columns(columns, self._types)
+
     def _end_copy_out_gen(self) -> PQGen[None]:
         try:
             while (yield from self._read_gen()):
@@ -281,6 +316,28 @@ class BinaryFormatter(Formatter):
 
         return None
 
+    def strip_row(self, data: Buffer) -> Buffer:
+        """
+        Return the record contained in a block of binary copy data.
+
+        Return an empty buffer if the block only contains the signature or
+        the trailer.
+        """
+        if not self._signature_sent:
+            if data[: len(_binary_signature_start)] != _binary_signature_start:
+                raise e.DataError(
+                    "binary copy doesn't start with the expected signature"
+                )
+            self._signature_sent = True
+            # The signature is followed by the flags and a header extension.
+            pos = len(_binary_signature_start) + 4
+            data = data[pos + 4 + _unpack_int4(data, pos)[0] :]
+
+        if data == _binary_trailer:
+            return b""
+
+        return data
+
     def write(self, buffer: Buffer | str) -> Buffer:
         data = self._ensure_bytes(buffer)
         self._signature_sent = True
@@ -302,6 +359,21 @@ class BinaryFormatter(Formatter):
         else:
             return b""
 
+    def write_columns(
+        self, columns: Sequence[Any], types: Sequence[int]
+    ) -> Iterator[Buffer]:
+        self._row_mode = True
+
+        if not self._signature_sent:
+            self._write_buffer += _binary_signature
+            self._signature_sent = True
+
+        if self._write_buffer:
+            buffer, self._write_buffer = self._write_buffer, bytearray()
+            yield buffer
+
+        yield from dump_copy_columns(columns, types, self.transformer, BATCH_SIZE)
+
     def end(self) -> Buffer:
         # If we have sent no data we need to send the signature
         # and the trailer
@@ -405,6 +477,7 @@ _binary_signature = (
     b"\x00\x00\x80\x00"  # flags
     b"\x00\x00\x00\x02\x00\x07"  # extra length
 )
+_binary_signature_start = _binary_signature[:11]
 _binary_trailer = b"\xff\xff"
 _binary_null = b"\xff\xff\xff\xff"
 
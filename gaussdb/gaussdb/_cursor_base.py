@@ -6,6 +6,7 @@ GaussDB BaseCursor object
 
 from __future__ import annotations
 
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Generic, NoReturn
 from functools import partial
 from collections.abc import Iterable, Sequence
@@ -14,10 +15,11 @@ from . import adapt
 from . import errors as e
 from . import pq
 from .abc import ConnectionType, Params, PQGen, Query
+from .sql import Composable
 from .rows import Row, RowMaker
 from ._column import Column
 from .pq.misc import connection_summary
-from ._queries import GaussDBClientQuery, GaussDBQuery
+from ._queries import GaussDBClientQuery, GaussDBQuery, batch_values, unnest_values
 from ._preparing import Prepare
 from .generators import execute, fetch, send
 from ._capabilities import capabilities
@@ -191,17 +193,29 @@ class BaseCursor(Generic[ConnectionType, Row]):
         binary: bool | None = None,
     ) -> PQGen[None]:
         """Generator implementing `Cursor.execute()`."""
+        if self._conn._auto_pipeline:
+            yield from self._conn._enter_auto_pipeline_gen()
         yield from self._start_query(query)
         pgq = self._convert_query(query, params)
         yield from self._maybe_prepare_gen(pgq, prepare=prepare, binary=binary)
-        if self._conn._pipeline:
-            yield from self._conn._pipeline._communicate_gen()
+        pipeline = self._conn._pipeline
+        if pipeline:
+            if pipeline._auto and pipeline.level == 1:
+                # Sync after every statement, so that an error doesn't abort
+                # the following ones, as it happens outside pipeline mode.
+                pipeline._enqueue_sync()
+            yield from pipeline._maybe_communicate_gen(pgq)
 
         self._last_query = query
         yield from self._conn._prepared.maintain_gen(self._conn)
 
     def _executemany_gen_pipeline(
-        self, query: Query, params_seq: Iterable[Params], returning: bool
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        returning: bool,
+        batch_size: int | None = None,
+        mode: str | None = None,
     ) -> PQGen[None]:
         """
         Generator implementing `Cursor.executemany()` with pipelines available.
@@ -216,17 +230,17 @@ class BaseCursor(Generic[ConnectionType, Row]):
         assert self._execmany_returning is None
         self._execmany_returning = returning
 
-        first = True
-        for params in params_seq:
-            if first:
-                pgq = self._convert_query(query, params)
+        last_query = None
+        for q, params in self._executemany_items(query, params_seq, batch_size, mode):
+            if q is not last_query:
+                pgq = self._convert_query(q, params)
                 self._query = pgq
-                first = False
+                last_query = q
             else:
                 pgq.dump(params)
 
             yield from self._maybe_prepare_gen(pgq, prepare=True)
-            yield from pipeline._communicate_gen()
+            yield from pipeline._maybe_communicate_gen(pgq)
 
         self._last_query = query
 
@@ -236,7 +250,12 @@ class BaseCursor(Generic[ConnectionType, Row]):
         yield from self._conn._prepared.maintain_gen(self._conn)
 
     def _executemany_gen_no_pipeline(
-        self, query: Query, params_seq: Iterable[Params], returning: bool
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        returning: bool,
+        batch_size: int | None = None,
+        mode: str | None = None,
     ) -> PQGen[None]:
         """
         Generator implementing `Cursor.executemany()` with pipelines not available.
@@ -248,12 +267,12 @@ class BaseCursor(Generic[ConnectionType, Row]):
         assert self._execmany_returning is None
         self._execmany_returning = returning
 
-        first = True
-        for params in params_seq:
-            if first:
-                pgq = self._convert_query(query, params)
+        last_query = None
+        for q, params in self._executemany_items(query, params_seq, batch_size, mode):
+            if q is not last_query:
+                pgq = self._convert_query(q, params)
                 self._query = pgq
-                first = False
+                last_query = q
             else:
                 pgq.dump(params)
 
@@ -262,6 +281,37 @@ class BaseCursor(Generic[ConnectionType, Row]):
         self._last_query = query
         yield from self._conn._prepared.maintain_gen(self._conn)
 
+    def _executemany_items(
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        batch_size: int | None,
+        mode: str | None,
+    ) -> Iterable[tuple[Query, Params]]:
+        """
+        Return the (query, params) pairs to execute in an `!executemany()`.
+
+        If `!batch_size` is specified, group the records in multi-row VALUES
+        statements; with `!mode` "unnest", pass the records as arrays to a
+        single statement. The query object is the same for same-size batches.
+        """
+        if mode is not None and mode != "unnest":
+            raise ValueError(f"executemany mode must be 'unnest', got {mode!r}")
+        if not (batch_size or mode):
+            return ((query, params) for params in params_seq)
+
+        if isinstance(query, str):
+            bquery = query.encode(self._encoding)
+        elif isinstance(query, Composable):
+            bquery = query.as_bytes(self._tx)
+        else:
+            bquery = query
+        if mode:
+            return unnest_values(bquery, params_seq, batch_size, self._encoding)
+        else:
+            assert batch_size
+            return batch_values(bquery, params_seq, batch_size, self._encoding)
+
     def _maybe_prepare_gen(
         self,
         pgq: GaussDBQuery,
@@ -269,6 +319,10 @@ class BaseCursor(Generic[ConnectionType, Row]):
         prepare: bool | None = None,
         binary: bool | None = None,
     ) -> PQGen[None]:
+        # Measure the execution time only if requested: it has a cost.
+        timing = self._conn._prepared.timing
+        t0 = monotonic() if timing else 0.0
+
         # Check if the query is prepared or needs preparing
         prep, name = self._get_prepared(pgq, prepare)
         if prep is Prepare.NO:
@@ -299,6 +353,8 @@ class BaseCursor(Generic[ConnectionType, Row]):
 
         # run the query
         results = yield from execute(self._pgconn)
+        if timing:
+            self._conn._prepared.record_time(pgq, prep, monotonic() - t0)
 
         if key is not None:
             self._conn._prepared.validate(key, prep, name, results)
@@ -382,6 +438,7 @@ class BaseCursor(Generic[ConnectionType, Row]):
 
         # The connection gets in an unrecoverable state if we attempt COPY in
         # pipeline mode. Forbid it explicitly.
+        yield from self._conn._exit_auto_pipeline_gen()
         if self._conn._pipeline:
             raise e.NotSupportedError("COPY cannot be used in pipeline mode")
 
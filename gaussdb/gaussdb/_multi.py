@@ -0,0 +1,88 @@
+"""
+Execution of a query on several connections at once.
+"""
+
+# Copyright (C) 2025 The Psycopg Team
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from contextlib import ExitStack
+from collections.abc import Generator, Sequence
+
+from . import pq
+from . import errors as e
+from . import waiting
+from .abc import Params, PQGen, Query
+from .rows import Row
+
+if TYPE_CHECKING:
+    from .cursor import Cursor
+    from .connection import Connection
+
+ACTIVE = pq.TransactionStatus.ACTIVE
+
+_WAIT_INTERVAL = 0.1
+
+
+def execute_many_conns(
+    conns: Sequence[Connection[Row]],
+    query: Query,
+    params: Params | None = None,
+    *,
+    prepare: bool | None = None,
+    binary: bool | None = None,
+) -> Generator[Cursor[Row], None, None]:
+    """
+    Execute the same query on several connections concurrently.
+
+    The query is sent to all the connections and the results are received in
+    the current thread, multiplexing the connections sockets with
+    `waiting.wait_many()`. Return an iterator of cursors, one per connection,
+    in the order in which the connections complete the query; the connection
+    of each cursor is available as `Cursor.connection`.
+
+    The connections are locked until the iterator is exhausted. If a query
+    fails, the others are still completed and the first error is raised at
+    the end of the iteration. If the iteration is interrupted (on Ctrl-C, or
+    if the iterator is closed before it is exhausted), the queries still
+    running are canceled.
+    """
+    with ExitStack() as stack:
+        curs = []
+        gens = []
+        for conn in conns:
+            stack.enter_context(conn.lock)
+            cur = conn.cursor()
+            curs.append(cur)
+            gen = cur._execute_gen(query, params, prepare=prepare, binary=binary)
+            gens.append((gen, conn.pgconn.socket))
+
+        results = waiting.wait_many(gens, interval=_WAIT_INTERVAL)
+        try:
+            for i, _ in results:
+                yield curs[i]
+        except e._NO_TRACEBACK as ex:
+            raise ex.with_traceback(None)
+        except BaseException:
+            results.close()
+            _cancel_active(conns, gens)
+            raise
+
+
+def _cancel_active(
+    conns: Sequence[Connection[Row]], gens: Sequence[tuple[PQGen[None], int]]
+) -> None:
+    """
+    Cancel the queries still running on the connections and drain their results.
+    """
+    for conn, (gen, _) in zip(conns, gens):
+        # Like on Ctrl-C in `Connection.wait()`: the connections would
+        # otherwise remain stuck in ACTIVE state.
+        if conn.pgconn.transaction_status != ACTIVE:
+            continue
+        conn._try_cancel(timeout=5.0)
+        try:
+            conn.wait(gen)
+        except e.QueryCanceled:
+            pass  # as expected
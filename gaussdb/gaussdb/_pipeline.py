@@ -7,30 +7,38 @@ commands pipeline management
 from __future__ import annotations
 
 import logging
+from time import monotonic
 from types import TracebackType
 from typing import TYPE_CHECKING, Any
+from asyncio import Future, Task, create_task, get_running_loop, wait
 from collections import deque
 
 from . import errors as e
 from . import pq
-from .abc import PipelineCommand, PQGen
+from .abc import Params, PipelineCommand, PQGen, Query
 from ._compat import Self, TypeAlias
 from .pq.misc import connection_summary
+from .waiting import Wait
 from .generators import fetch_many, pipeline_communicate, send
 from ._capabilities import capabilities
 
 if TYPE_CHECKING:
     from .pq.abc import PGresult
+    from ._queries import GaussDBQuery
     from ._preparing import Key, Prepare  # noqa: F401
     from .connection import Connection
     from ._cursor_base import BaseCursor  # noqa: F401
     from ._connection_base import BaseConnection
+    from .cursor_async import AsyncCursor
     from .connection_async import AsyncConnection
 
 
 PendingResult: TypeAlias = (
     "tuple[BaseCursor[Any, Any], tuple[Key, Prepare, bytes] | None] | None"
 )
+_Submission: TypeAlias = (
+    "tuple[Query, Params | None, bool | None, bool | None, Future[AsyncCursor[Any]]]"
+)
 
 FATAL_ERROR = pq.ExecStatus.FATAL_ERROR
 PIPELINE_ABORTED = pq.ExecStatus.PIPELINE_ABORTED
@@ -38,6 +46,8 @@ BAD = pq.ConnStatus.BAD
 
 ACTIVE = pq.TransactionStatus.ACTIVE
 
+WAIT_R = Wait.R
+
 logger = logging.getLogger("gaussdb")
 
 
@@ -51,6 +61,16 @@ class BasePipeline:
         self.command_queue = deque[PipelineCommand]()
         self.result_queue = deque[PendingResult]()
         self.level = 0
+        # Pipeline entered implicitly by an auto_pipeline connection
+        self._auto = False
+
+        # Flush policy: if set, queued commands are sent only when a threshold
+        # is reached or when results are needed.
+        self.max_batch: int | None = None
+        self.max_bytes: int | None = None
+        self.max_delay: float | None = None
+        self._pending_bytes = 0
+        self._pending_since = 0.0
 
     def __repr__(self) -> str:
         cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
@@ -109,10 +129,37 @@ class BasePipeline:
         finally:
             yield from self._fetch_gen(flush=True)
 
+    def _maybe_communicate_gen(self, pgq: GaussDBQuery | None = None) -> PQGen[None]:
+        """Communicate with the pipeline unless the flush policy allows to wait.
+
+        `!pgq` is the query just queued, accounted for the `max_bytes` limit.
+        """
+        if self.max_batch or self.max_bytes or self.max_delay is not None:
+            now = monotonic()
+            if not self._pending_since:
+                self._pending_since = now
+            if self.max_bytes and pgq:
+                self._pending_bytes += len(pgq.query)
+                self._pending_bytes += sum(len(p) for p in pgq.params or () if p)
+
+            if not (
+                (self.max_batch and len(self.command_queue) >= self.max_batch)
+                or (self.max_bytes and self._pending_bytes >= self.max_bytes)
+                or (
+                    self.max_delay is not None
+                    and now - self._pending_since >= self.max_delay
+                )
+            ):
+                return
+
+        yield from self._communicate_gen()
+
     def _communicate_gen(self) -> PQGen[None]:
         """Communicate with pipeline to send commands and possibly fetch
         results, which are then processed.
         """
+        self._pending_bytes = 0
+        self._pending_since = 0.0
         fetched = yield from pipeline_communicate(self.pgconn, self.command_queue)
         exception = None
         for results in fetched:
@@ -137,6 +184,12 @@ class BasePipeline:
         if not self.result_queue:
             return
 
+        if self.command_queue:
+            # Commands retained by the flush policy.
+            yield from self._communicate_gen()
+            if not self.result_queue:
+                return
+
         if flush:
             self.pgconn.send_flush_request()
             yield from send(self.pgconn)
@@ -237,6 +290,11 @@ class AsyncPipeline(BasePipeline):
 
     def __init__(self, conn: AsyncConnection[Any]) -> None:
         super().__init__(conn)
+        # Statements submitted and not sent yet
+        self._submitted = deque[_Submission]()
+        # Futures waiting for the results of the cursors sent
+        self._futures: dict[BaseCursor[Any, Any], Future[AsyncCursor[Any]]] = {}
+        self._driver: Task[None] | None = None
 
     async def sync(self) -> None:
         try:
@@ -245,6 +303,116 @@ class AsyncPipeline(BasePipeline):
         except e._NO_TRACEBACK as ex:
             raise ex.with_traceback(None)
 
+    def submit(
+        self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        prepare: bool | None = None,
+        binary: bool | None = None,
+    ) -> Future[AsyncCursor[Any]]:
+        """
+        Schedule the execution of a query in the pipeline.
+
+        Return a future resolved with a new cursor as soon as the result of the
+        query is received, or with the exception raised by the query.
+
+        The method can be called concurrently by several tasks: the queries
+        are sent and their results received by a single background task,
+        without waiting for the results of the queries sent before.
+        """
+        if not self.level:
+            raise e.ProgrammingError("the pipeline is not active")
+
+        fut: Future[AsyncCursor[Any]] = get_running_loop().create_future()
+        self._submitted.append((query, params, prepare, binary, fut))
+        if not self._driver or self._driver.done():
+            self._driver = create_task(self._drive())
+        else:
+            # The driver may be waiting for a result: wake it up to send.
+            self._conn._waiter.interrupt()
+        return fut
+
+    async def _drive(self) -> None:
+        """
+        Send the submitted queries and receive their results until done.
+        """
+        try:
+            while self._submitted or self._futures:
+                async with self._conn.lock:
+                    if not self.level:
+                        raise e.OperationalError("the pipeline was terminated")
+                    if self._submitted:
+                        await self._conn.wait(self._send_submitted_gen())
+                    elif self._futures:
+                        await self._conn.wait(self._fetch_one_gen())
+        except BaseException as ex:
+            exc = ex if isinstance(ex, Exception) else e.OperationalError(str(ex))
+            for *_, fut in self._submitted:
+                if not fut.done():
+                    fut.set_exception(exc)
+            self._submitted.clear()
+            for fut in self._futures.values():
+                if not fut.done():
+                    fut.set_exception(exc)
+            self._futures.clear()
+            if not isinstance(ex, Exception):
+                raise
+
+    def _send_submitted_gen(self) -> PQGen[None]:
+        while self._submitted:
+            query, params, prepare, binary, fut = self._submitted.popleft()
+            if fut.done():  # cancelled
+                continue
+            cur = self._conn.cursor()
+            self._futures[cur] = fut
+            try:
+                yield from cur._execute_gen(
+                    query, params, prepare=prepare, binary=binary
+                )
+            except e.Error as ex:
+                if self._futures.pop(cur, None) and not fut.done():
+                    fut.set_exception(ex)
+            # Sync after every statement so that an error doesn't abort the
+            # statements submitted by other tasks.
+            self._enqueue_sync()
+        yield from self._communicate_gen()
+
+    def _fetch_one_gen(self) -> PQGen[None]:
+        """
+        Receive and process the next result available.
+
+        Return without processing anything if new queries are submitted while
+        waiting, so that they are sent without waiting for the result.
+        """
+        if self.command_queue:
+            yield from self._communicate_gen()
+        results = []
+        if self.result_queue:
+            while self.pgconn.is_busy():
+                if (yield WAIT_R):
+                    self.pgconn.consume_input()
+                elif self._submitted:
+                    return
+            results = yield from fetch_many(self.pgconn)
+        if not results:
+            raise e.InternalError("no result received for the queries submitted")
+        self._process_results(self.result_queue.popleft(), results)
+
+    def _process_results(self, queued: PendingResult, results: list[PGresult]) -> None:
+        fut = self._futures.pop(queued[0], None) if queued else None
+        if not fut:
+            return super()._process_results(queued, results)
+
+        try:
+            super()._process_results(queued, results)
+        except e.Error as ex:
+            if not fut.done():
+                fut.set_exception(ex)
+        else:
+            if not fut.done():
+                fut.set_result(queued[0])  # type: ignore[index, arg-type]
+
     async def __aenter__(self) -> Self:
         async with self._conn.lock:
             await self._conn.wait(self._enter_gen())
@@ -256,6 +424,9 @@ class AsyncPipeline(BasePipeline):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        if self.level == 1 and self._driver:
+            # Let the submitted queries complete before leaving.
+            await wait([self._driver])
         try:
             async with self._conn.lock:
                 await self._conn.wait(self._exit_gen())
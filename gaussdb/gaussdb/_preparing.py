@@ -6,8 +6,12 @@ Support for prepared statements
 
 from __future__ import annotations
 
+import math
 from enum import IntEnum, auto
+from time import monotonic
 from typing import TYPE_CHECKING, Any
+from threading import Lock
+from dataclasses import dataclass, replace
 from collections import OrderedDict, deque
 from collections.abc import Sequence
 
@@ -15,6 +19,8 @@ from . import pq
 from .abc import PQGen
 from ._compat import TypeAlias
 from ._queries import GaussDBQuery
+from .generators import execute, fetch_many, pipeline_mode, send
+from ._capabilities import capabilities
 
 if TYPE_CHECKING:
     from .pq.abc import PGresult
@@ -32,6 +38,140 @@ class Prepare(IntEnum):
     SHOULD = auto()
 
 
+@dataclass
+class StatementStats:
+    """
+    Statistics about the execution of a statement on a connection.
+    """
+
+    __module__ = "gaussdb"
+
+    query: bytes
+    """The query, as sent to the server."""
+
+    types: tuple[int, ...]
+    """The oids of the query parameters."""
+
+    name: bytes = b""
+    """The name of the statement if prepared, otherwise empty."""
+
+    executions: int = 0
+    """Number of times the statement was executed."""
+
+    prepared_executions: int = 0
+    """Number of times the statement was executed as prepared statement."""
+
+    last_used: float = 0.0
+    """Time of the last execution, as returned by `time.monotonic()`."""
+
+    unprepared_time: float = 0.0
+    """Total time, in seconds, spent in executions not prepared.
+
+    Only measured if `~Connection.prepared_timing` is enabled."""
+
+    prepared_time: float = 0.0
+    """Total time, in seconds, spent in executions prepared, including the
+    preparation.
+
+    Only measured if `~Connection.prepared_timing` is enabled."""
+
+
+class PreparePolicy:
+    """
+    Decide when to prepare statements and which ones to deallocate.
+
+    The default policy prepares a statement after it was executed
+    `~Connection.prepare_threshold` times and deallocates the least recently
+    used statements. Subclass it to implement a different policy.
+    """
+
+    __module__ = "gaussdb"
+
+    def should_prepare(self, stats: StatementStats | None, threshold: int) -> bool:
+        """
+        Return `!True` if the statement should be prepared on its next execution.
+
+        `!stats` is `!None` if the statement was never executed.
+        """
+        return (stats.executions if stats else 0) >= threshold
+
+    def choose_victim(self, stats: Sequence[StatementStats]) -> StatementStats:
+        """
+        Return the prepared statement to deallocate.
+
+        `!stats` contains the prepared statements, from the least recently
+        used to the statement just prepared.
+        """
+        return stats[0]
+
+
+class LFUPreparePolicy(PreparePolicy):
+    """
+    A policy deallocating the least frequently used statements first.
+
+    Statements executed many times are kept prepared even if other statements
+    were executed more recently, which is useful if many different queries are
+    executed only occasionally.
+
+    The executions of a statement count half for every `!half_life` seconds
+    passed since its last execution, so that the statements executed often in
+    the past, but not anymore, are eventually deallocated.
+    """
+
+    __module__ = "gaussdb"
+
+    def __init__(self, half_life: float = 300.0):
+        if half_life <= 0:
+            raise ValueError(f"half_life must be > 0, got {half_life}")
+        self.half_life = half_life
+
+    def choose_victim(self, stats: Sequence[StatementStats]) -> StatementStats:
+        now = monotonic()
+        half_life = self.half_life
+
+        def frequency(s: StatementStats) -> float:
+            return s.executions * math.pow(0.5, (now - s.last_used) / half_life)
+
+        # Never choose the statement just prepared. On par, the least
+        # recently used comes first.
+        return min(stats[:-1] or stats, key=frequency)
+
+
+class SharedStatementCache:
+    """
+    Record the statements prepared by a group of connections.
+
+    When a connection prepares a statement, it records it in the cache. The
+    other connections using the same cache can then prepare it in advance,
+    instead of executing it `prepare_threshold` times unprepared each.
+    """
+
+    def __init__(self, maxsize: int = 100):
+        self.maxsize = maxsize
+        self._keys: OrderedDict[Key, None] = OrderedDict()
+        self._lock = Lock()
+
+        # Incremented when a statement is added, so that the connections can
+        # tell cheaply whether there is anything new to prepare.
+        self.generation = 0
+
+    def add(self, key: Key) -> None:
+        with self._lock:
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                return
+
+            self._keys[key] = None
+            if len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+            self.generation += 1
+
+    def keys(self) -> list[Key]:
+        """Return the statements in the cache, the most recently used first."""
+        with self._lock:
+            return list(reversed(self._keys))
+
+
 class PrepareManager:
     # Number of times a query is executed before it is prepared.
     prepare_threshold: int | None = 5
@@ -46,11 +186,28 @@ class PrepareManager:
         # Map (query, types) to the name of the statement if  prepared.
         self._names: OrderedDict[Key, bytes] = OrderedDict()
 
+        # Map (query, types) of the statements above to their statistics.
+        self._stats: dict[Key, StatementStats] = {}
+
         # Counter to generate prepared statements names
         self._prepared_idx = 0
 
+        self.policy = PreparePolicy()
+
+        # If True, measure the duration of the executions in the statistics.
+        self.timing = False
+
         self._to_flush = deque["bytes | None"]()
 
+        # If True, don't deallocate statements after every query but leave it
+        # to an explicit flush_gen(), e.g. when a connection is returned to
+        # its pool.
+        self.defer_flush = False
+
+        # Cache shared with other connections, e.g. the ones in the same pool.
+        self.shared: SharedStatementCache | None = None
+        self._shared_generation = -1
+
     @staticmethod
     def key(query: GaussDBQuery) -> Key:
         return (query.query, query.types)
@@ -71,16 +228,19 @@ class PrepareManager:
             # The query was already prepared in this session
             return Prepare.YES, name
 
-        count = self._counts.get(key, 0)
-        if count >= self.prepare_threshold or prepare:
+        stats = self._stats.get(key)
+        if prepare or self.policy.should_prepare(stats, self.prepare_threshold):
             # The query has been executed enough times and needs to be prepared
-            name = f"_pg3_{self._prepared_idx}".encode()
-            self._prepared_idx += 1
-            return Prepare.SHOULD, name
+            return Prepare.SHOULD, self._new_name()
         else:
             # The query is not to be prepared yet
             return Prepare.NO, b""
 
+    def _new_name(self) -> bytes:
+        name = f"_pg3_{self._prepared_idx}".encode()
+        self._prepared_idx += 1
+        return name
+
     def _should_discard(self, prep: Prepare, results: Sequence[PGresult]) -> bool:
         """Check if we need to discard our entire state: it should happen on
         rollback or on dropping objects, because the same object may get
@@ -110,16 +270,21 @@ class PrepareManager:
         return True
 
     def _rotate(self) -> None:
-        """Evict an old value from the cache.
+        """Evict the old values exceeding the size of the cache.
 
-        If it was prepared, deallocate it. Do it only once: if the cache was
-        resized, deallocate gradually.
+        If they were prepared, deallocate them. If the cache was resized, all
+        the statements in excess are queued together, so that they can be
+        deallocated in a single round trip.
         """
-        if len(self._counts) > self.prepared_max:
-            self._counts.popitem(last=False)
-
-        if len(self._names) > self.prepared_max:
-            name = self._names.popitem(last=False)[1]
+        while len(self._counts) > self.prepared_max:
+            key = self._counts.popitem(last=False)[0]
+            del self._stats[key]
+
+        while len(self._names) > self.prepared_max:
+            stats = self.policy.choose_victim([self._stats[k] for k in self._names])
+            key = (stats.query, stats.types)
+            name = self._names.pop(key)
+            del self._stats[key]
             self._to_flush.append(name)
 
     def maybe_add_to_cache(
@@ -139,22 +304,52 @@ class PrepareManager:
             if prep is Prepare.SHOULD:
                 del self._counts[key]
                 self._names[key] = name
+                if self.shared:
+                    self.shared.add(key)
             else:
                 self._counts[key] += 1
                 self._counts.move_to_end(key)
+            self._update_stats(key, prep, name)
             return None
 
         elif key in self._names:
             self._names.move_to_end(key)
+            self._update_stats(key, prep, name)
             return None
 
         else:
             if prep is Prepare.SHOULD:
                 self._names[key] = name
+                if self.shared:
+                    self.shared.add(key)
             else:
                 self._counts[key] = 1
+            self._stats[key] = StatementStats(*key)
+            self._update_stats(key, prep, name)
             return key
 
+    def _update_stats(self, key: Key, prep: Prepare, name: bytes) -> None:
+        stats = self._stats[key]
+        stats.executions += 1
+        stats.last_used = monotonic()
+        if prep is not Prepare.NO:
+            stats.name = name
+            stats.prepared_executions += 1
+
+    def record_time(self, query: GaussDBQuery, prep: Prepare, time: float) -> None:
+        """Add the duration of an execution of 'query' to its statistics."""
+        stats = self._stats.get(self.key(query))
+        if not stats:
+            return
+        if prep is Prepare.NO:
+            stats.unprepared_time += time
+        else:
+            stats.prepared_time += time
+
+    def stats(self) -> list[StatementStats]:
+        """Return a copy of the statistics of the statements in the cache."""
+        return [replace(stats) for stats in self._stats.values()]
+
     def validate(
         self,
         key: Key,
@@ -172,6 +367,7 @@ class PrepareManager:
         if not self._check_results(results):
             self._names.pop(key, None)
             self._counts.pop(key, None)
+            self._stats.pop(key, None)
         else:
             self._rotate()
 
@@ -182,6 +378,8 @@ class PrepareManager:
         the server.
         """
         self._counts.clear()
+        self._stats.clear()
+        self._shared_generation = -1
         if self._names:
             self._names.clear()
             self._to_flush.clear()
@@ -196,7 +394,82 @@ class PrepareManager:
 
         Deallocate unneeded command in the server, or flush the prepared
         statements server state entirely if necessary.
+
+        If `defer_flush` is set, the statements to deallocate are left
+        pending (up to `prepared_max` of them), for `flush_gen()` to send later.
         """
-        while self._to_flush:
-            name = self._to_flush.popleft()
-            yield from conn._deallocate(name)
+        if not self._to_flush:
+            return
+        if (
+            self.defer_flush
+            and self._to_flush[0] is not None
+            and len(self._to_flush) < self.prepared_max
+        ):
+            return
+        yield from self.flush_gen(conn)
+
+    def flush_gen(self, conn: BaseConnection[Any]) -> PQGen[None]:
+        """
+        Generator to deallocate the pending statements in a single batch.
+        """
+        if not self._to_flush:
+            return
+        if self._to_flush[0] is None:
+            # clear() was called: DEALLOCATE ALL covers what is queued after.
+            self._to_flush.clear()
+            yield from conn._deallocate(None)
+        else:
+            names = [name for name in self._to_flush if name is not None]
+            self._to_flush.clear()
+            yield from conn._deallocate_many(names)
+
+    def prepare_shared_gen(self, conn: BaseConnection[Any]) -> PQGen[None]:
+        """
+        Generator to prepare the statements recorded in the shared cache.
+
+        Statements already prepared in the session are skipped. Statements
+        failing to prepare (for instance because they refer to temporary
+        objects) are ignored. Use a pipeline, if available, to prepare all the
+        statements in a single round trip.
+        """
+        shared = self.shared
+        if not shared or self.prepare_threshold is None or conn._pipeline:
+            return
+        generation = shared.generation
+        if self._shared_generation == generation:
+            return
+
+        todo: list[tuple[Key, bytes]] = []
+        for key in shared.keys():
+            if len(self._names) + len(todo) >= self.prepared_max:
+                break
+            if key not in self._names:
+                todo.append((key, self._new_name()))
+
+        pgconn = conn.pgconn
+        results: list[list[PGresult]] = []
+        if todo and capabilities.has_pipeline():
+            with pipeline_mode(pgconn):
+                # Sync after every statement, so that a failing one doesn't
+                # abort the ones following.
+                for (query, types), name in todo:
+                    pgconn.send_prepare(name, query, param_types=types)
+                    pgconn.pipeline_sync()
+                yield from send(pgconn)
+                for _ in todo:
+                    results.append((yield from fetch_many(pgconn)))
+                    yield from fetch_many(pgconn)  # the sync result
+        else:
+            for (query, types), name in todo:
+                pgconn.send_prepare(name, query, param_types=types)
+                results.append((yield from execute(pgconn)))
+
+        # Skip the same statements next time only after a complete pass.
+        self._shared_generation = generation
+
+        for (key, name), res in zip(todo, results):
+            if res and res[-1].status == COMMAND_OK:
+                self._counts.pop(key, None)
+                self._names[key] = name
+                stats = self._stats.setdefault(key, StatementStats(*key))
+                stats.name = name
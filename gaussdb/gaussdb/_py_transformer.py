@@ -11,7 +11,8 @@ dependencies problems).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, DefaultDict
+import struct
+from typing import TYPE_CHECKING, Any, DefaultDict, cast
 from collections import defaultdict
 from collections.abc import Sequence
 
@@ -19,12 +20,14 @@ from . import abc
 from . import errors as e
 from . import pq
 from .abc import AdaptContext, Buffer, LoadFunc, NoneType, PyFormat
-from .rows import Row, RowMaker
+from .rows import ResultRowMaker, Row, RowMaker
 from ._oids import INVALID_OID, TEXT_OID
 from ._compat import TypeAlias
 from ._encodings import conn_encoding
 
 if TYPE_CHECKING:
+    from typing import Callable  # noqa: F401
+
     from .abc import DumperKey  # noqa: F401
     from .adapt import AdaptersMap
     from .pq.abc import PGresult
@@ -33,6 +36,7 @@ if TYPE_CHECKING:
 DumperCache: TypeAlias = "dict[DumperKey, abc.Dumper]"
 OidDumperCache: TypeAlias = "dict[int, abc.Dumper]"
 LoaderCache: TypeAlias = "dict[int, abc.Loader]"
+ValuesLoader: TypeAlias = "Callable[[Sequence[Buffer | None]], list[Any]]"
 
 TEXT = pq.Format.TEXT
 PY_TEXT = PyFormat.TEXT
@@ -55,6 +59,7 @@ class Transformer(AdaptContext):
         types formats
         _conn _adapters _pgresult _dumpers _loaders _encoding _none_oid
         _oid_dumpers _oid_types _row_dumpers _row_loaders
+        _load_record _column_loaders
         """.split()
 
     types: tuple[int, ...] | None
@@ -95,6 +100,11 @@ class Transformer(AdaptContext):
         # the length of the result columns
         self._row_loaders: list[LoadFunc] = []
 
+        # functions specialised for the current result columns, to load the
+        # values of a record, and of each column
+        self._load_record: ValuesLoader = _load_empty
+        self._column_loaders: list[ValuesLoader] = []
+
         # mapping oid -> type sql representation
         self._oid_types: dict[int, bytes] = {}
 
@@ -142,7 +152,7 @@ class Transformer(AdaptContext):
         if not result:
             self._nfields = self._ntuples = 0
             if set_loaders:
-                self._row_loaders = []
+                self._set_row_loaders([])
             return
 
         self._ntuples = result.ntuples
@@ -152,14 +162,14 @@ class Transformer(AdaptContext):
             return
 
         if not nf:
-            self._row_loaders = []
+            self._set_row_loaders([])
             return
 
         fmt: pq.Format
         fmt = result.fformat(0) if format is None else format  # type: ignore
-        self._row_loaders = [
-            self.get_loader(result.ftype(i), fmt).load for i in range(nf)
-        ]
+        self._set_row_loaders(
+            [self.get_loader(result.ftype(i), fmt) for i in range(nf)]
+        )
 
     def set_dumper_types(self, types: Sequence[int], format: pq.Format) -> None:
         self._row_dumpers = [self.get_dumper_by_oid(oid, format) for oid in types]
@@ -167,7 +177,16 @@ class Transformer(AdaptContext):
         self.formats = [format] * len(types)
 
     def set_loader_types(self, types: Sequence[int], format: pq.Format) -> None:
-        self._row_loaders = [self.get_loader(oid, format).load for oid in types]
+        self._set_row_loaders([self.get_loader(oid, format) for oid in types])
+
+    def _set_row_loaders(self, loaders: list[abc.Loader]) -> None:
+        self._row_loaders = [loader.load for loader in loaders]
+        codes = [_get_struct_code(loader) for loader in loaders]
+        self._load_record = _make_record_loader(self._row_loaders, codes)
+        self._column_loaders = [
+            _make_column_loader(load, code)
+            for load, code in zip(self._row_loaders, codes)
+        ]
 
     def dump_sequence(
         self, params: Sequence[Any], formats: Sequence[PyFormat]
@@ -308,16 +327,19 @@ class Transformer(AdaptContext):
                 f"rows must be included between 0 and {self._ntuples}"
             )
 
-        records = []
-        for row in range(row0, row1):
-            record: list[Any] = [None] * self._nfields
-            for col in range(self._nfields):
-                val = res.get_value(row, col)
-                if val is not None:
-                    record[col] = self._row_loaders[col](val)
-            records.append(make_row(record))
+        if hasattr(make_row, "from_result"):
+            from_result = cast("ResultRowMaker[Row]", make_row).from_result
+            loaders = self._row_loaders
+            return [from_result(res, row, loaders) for row in range(row0, row1)]
 
-        return records
+        if row0 == 0 and row1 == self._ntuples and self._nfields:
+            # Consuming the whole result: fetch it one column at a time, which
+            # is cheaper than fetching it value by value.
+            return self._load_columns(res, make_row)
+
+        get_row = res.get_row
+        load = self._load_record
+        return [make_row(load(get_row(row))) for row in range(row0, row1)]
 
     def load_row(self, row: int, make_row: RowMaker[Row]) -> Row | None:
         res = self._pgresult
@@ -327,13 +349,19 @@ class Transformer(AdaptContext):
         if not 0 <= row < self._ntuples:
             return None
 
-        record: list[Any] = [None] * self._nfields
-        for col in range(self._nfields):
-            val = res.get_value(row, col)
-            if val is not None:
-                record[col] = self._row_loaders[col](val)
+        if hasattr(make_row, "from_result"):
+            rmaker = cast("ResultRowMaker[Row]", make_row)
+            return rmaker.from_result(res, row, self._row_loaders)
+
+        return make_row(self._load_record(res.get_row(row)))
 
-        return make_row(record)
+    def _load_columns(self, res: PGresult, make_row: RowMaker[Row]) -> list[Row]:
+        columns = [
+            load(res.get_column(col)) for col, load in enumerate(self._column_loaders)
+        ]
+        if make_row is tuple:
+            return list(zip(*columns))  # type: ignore[arg-type]
+        return [make_row(list(record)) for record in zip(*columns)]
 
     def load_sequence(self, record: Sequence[Buffer | None]) -> tuple[Any, ...]:
         if len(self._row_loaders) != len(record):
@@ -360,3 +388,82 @@ class Transformer(AdaptContext):
                 raise e.InterfaceError("unknown oid loader not found")
         loader = self._loaders[format][oid] = loader_cls(oid, self)
         return loader
+
+
+def _get_struct_code(loader: abc.Loader) -> str:
+    """
+    Return the `struct` code to unpack the values loaded by a loader, if any.
+
+    Loaders of fixed-width binary types declare a `!_struct_code` class
+    attribute to allow unpacking several values at once. Only trust the class
+    declaring it: a subclass might override `!load()`.
+    """
+    return str(type(loader).__dict__.get("_struct_code", ""))
+
+
+def _load_empty(values: Sequence[Buffer | None]) -> list[Any]:
+    return []
+
+
+def _make_record_loader(loads: list[LoadFunc], codes: list[str]) -> ValuesLoader:
+    """
+    Return a function to load the values of a record.
+
+    If all the columns have fixed-width binary types, unpack the records
+    without nulls with a single `!struct.Struct`.
+    """
+
+    def load_record(values: Sequence[Buffer | None]) -> list[Any]:
+        return [(load(v) if v is not None else None) for load, v in zip(loads, values)]
+
+    if len(codes) < 2 or not all(codes):
+        return load_record
+
+    unpack = struct.Struct("!" + "".join(codes)).unpack
+    sizes = [struct.calcsize("!" + code) for code in codes]
+
+    def load_fixed(values: Sequence[Buffer | None]) -> list[Any]:
+        # On nulls, or on wrong values, which the loaders will complain about,
+        # fall back to loading value by value.
+        if None in values or list(map(len, values)) != sizes:  # type: ignore
+            return load_record(values)
+        return list(unpack(b"".join(values)))  # type: ignore[arg-type]
+
+    return load_fixed
+
+
+def _make_column_loader(load: LoadFunc, code: str) -> ValuesLoader:
+    """
+    Return a function to load the values of a column.
+
+    If the column has a fixed-width binary type, unpack all its non-null
+    values at once.
+    """
+
+    def load_column(values: Sequence[Buffer | None]) -> list[Any]:
+        return [(load(v) if v is not None else None) for v in values]
+
+    if not code:
+        return load_column
+
+    size = struct.calcsize("!" + code)
+
+    def load_fixed(values: Sequence[Buffer | None]) -> list[Any]:
+        if None in values:
+            nonnull = [v for v in values if v is not None]
+        else:
+            nonnull = values  # type: ignore[assignment]
+        if not nonnull:
+            return list(values)
+        data = b"".join(nonnull)
+        if len(data) != size * len(nonnull) or max(map(len, nonnull)) != size:
+            # Let the loader complain about the wrong value.
+            return load_column(values)
+
+        unpacked = struct.unpack(f"!{len(nonnull)}{code}", data)
+        if nonnull is values:
+            return list(unpacked)
+        it = iter(unpacked)
+        return [(next(it) if v is not None else None) for v in values]
+
+    return load_fixed
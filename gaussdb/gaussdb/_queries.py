@@ -7,16 +7,20 @@ Utility module to manipulate queries
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Generic, NamedTuple, TypeVar
 from functools import lru_cache
-from collections.abc import Mapping, Sequence
+from itertools import chain, islice
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 
 from . import errors as e
 from . import pq
 from .abc import Buffer, Params, Query
-from .sql import Composable
+from .sql import Compiled, Composable
 from ._enums import PyFormat
-from ._compat import TypeAlias, TypeGuard
+from ._compat import TypeGuard
 from ._encodings import conn_encoding
 
 if TYPE_CHECKING:
@@ -24,6 +28,12 @@ if TYPE_CHECKING:
 
 MAX_CACHED_STATEMENT_LENGTH = 4096
 MAX_CACHED_STATEMENT_PARAMS = 50
+QUERY_CACHE_SIZE = 1024
+QUERY_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Maximum number of parameters in a single statement (the Bind message uses
+# a 16 bits counter).
+MAX_STATEMENT_PARAMS = 65535
 
 
 class QueryPart(NamedTuple):
@@ -39,7 +49,7 @@ class GaussDBQuery:
 
     __slots__ = """
         query params types formats
-        _tx _want_formats _parts _encoding _order
+        _tx _want_formats _parts _encoding _order _compiled
         """.split()
 
     def __init__(self, transformer: Transformer):
@@ -57,6 +67,7 @@ class GaussDBQuery:
         self._parts: list[QueryPart]
         self.query = b""
         self._order: list[str] | None = None
+        self._compiled: Compiled | None = None
 
     def convert(self, query: Query, vars: Params | None) -> None:
         """
@@ -65,6 +76,19 @@ class GaussDBQuery:
         The results of this function can be obtained accessing the object
         attributes (`query`, `params`, `types`, `formats`).
         """
+        if (
+            vars is not None
+            and isinstance(query, Compiled)
+            and query._encoding == self._encoding
+        ):
+            # Parsed in advance: skip the conversion.
+            self._compiled = query
+            (self.query, self._want_formats, self._order, self._parts) = (
+                query._converted
+            )
+            self.dump(vars)
+            return
+
         if isinstance(query, str):
             bquery = query.encode(self._encoding)
         elif isinstance(query, Composable):
@@ -72,22 +96,10 @@ class GaussDBQuery:
         else:
             bquery = query
 
+        self._compiled = None
         if vars is not None:
-            # Avoid caching queries extremely long or with a huge number of
-            # parameters. They are usually generated by ORMs and have poor
-            # cacheablility (e.g. INSERT ... VALUES (...), (...) with varying
-            # numbers of tuples.
-            # see https://github.com/gaussdb/gaussdb/discussions/628
-            if (
-                len(bquery) <= MAX_CACHED_STATEMENT_LENGTH
-                and len(vars) <= MAX_CACHED_STATEMENT_PARAMS
-            ):
-                f: _Query2Pg = _query2pg
-            else:
-                f = _query2pg_nocache
-
-            (self.query, self._want_formats, self._order, self._parts) = f(
-                bquery, self._encoding
+            (self.query, self._want_formats, self._order, self._parts) = _query2pg(
+                bquery, self._encoding, len(vars)
             )
         else:
             self.query = bquery
@@ -103,6 +115,16 @@ class GaussDBQuery:
         """
         if vars is not None:
             params = self.validate_and_reorder_params(self._parts, vars, self._order)
+            if self._compiled and self._compiled._dumpers is not None:
+                # Dumpers chosen in advance: skip the transformer.
+                self.params = [
+                    d.dump(p) if p is not None else None
+                    for d, p in zip(self._compiled._dumpers, params)
+                ]
+                self.types = self._compiled._types
+                self.formats = self._compiled._formats
+                return
+
             assert self._want_formats is not None
             self.params = self._tx.dump_sequence(params, self._want_formats)
             self.types = self._tx.types or ()
@@ -167,12 +189,6 @@ class GaussDBQuery:
                 )
 
 
-# The type of the _query2pg() and _query2pg_nocache() methods
-_Query2Pg: TypeAlias = Callable[
-    [bytes, str], "tuple[bytes, list[PyFormat], list[str] | None, list[QueryPart]]"
-]
-
-
 def _query2pg_nocache(
     query: bytes, encoding: str
 ) -> tuple[bytes, list[PyFormat], list[str] | None, list[QueryPart]]:
@@ -223,12 +239,105 @@ def _query2pg_nocache(
     return b"".join(chunks), formats, order, parts
 
 
-# Note: the cache size is 128 items, but someone has reported throwing ~12k
-# queries (of type `INSERT ... VALUES (...), (...)` with a varying amount of
-# records), and the resulting cache size is >100Mb. So, we will avoid to cache
-# large queries or queries with a large number of params. See
-# https://github.com/sqlalchemy/sqlalchemy/discussions/10270
-_query2pg = lru_cache(_query2pg_nocache)
+class QueryCacheInfo(NamedTuple):
+    """Statistics about the query caches, as returned by `query_cache_info()`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+T = TypeVar("T")
+
+
+class QueryCache(Generic[T]):
+    """
+    A LRU cache of the conversion of Python queries into GaussDB queries.
+
+    Queries longer than `!max_length` are cached using a digest of their bytes
+    as key, but the values cached still hold the whole converted query: the
+    cache keeps at most `!maxsize` queries and at most `!max_bytes` bytes of
+    queries, dropping the least recently used ones. Queries with more than
+    `!max_params` parameters, or longer than `!max_bytes`, are not cached at
+    all.
+    """
+
+    def __init__(self, func: Callable[[bytes, str], T]):
+        self._func = func
+        self._cache: OrderedDict[tuple[Any, ...], tuple[T, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self.maxsize = QUERY_CACHE_SIZE
+        self.max_bytes = QUERY_CACHE_MAX_BYTES
+        self.max_length = MAX_CACHED_STATEMENT_LENGTH
+        self.max_params = MAX_CACHED_STATEMENT_PARAMS
+        self.hits = self.misses = 0
+
+    def __call__(self, query: bytes, encoding: str, nparams: int = 0) -> T:
+        # Avoid caching queries with a huge number of parameters. They are
+        # usually generated by ORMs and have poor cacheablility (e.g. INSERT
+        # ... VALUES (...), (...) with varying numbers of tuples), and someone
+        # has reported throwing ~12k of them, with a resulting cache >100Mb. See
+        # https://github.com/sqlalchemy/sqlalchemy/discussions/10270
+        #
+        # The values cached hold the converted query and its parts, about
+        # twice the length of the query, even if the key is only a digest:
+        # count them against max_bytes.
+        nbytes = 2 * len(query)
+        if nparams > self.max_params or not self.maxsize or nbytes > self.max_bytes:
+            return self._func(query, encoding)
+
+        key: tuple[Any, ...]
+        if len(query) <= self.max_length:
+            key = (query, encoding)
+        else:
+            digest = hashlib.blake2b(query, digest_size=16).digest()
+            key = (digest, encoding, len(query))
+
+        with self._lock:
+            if (item := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return item[0]
+            self.misses += 1
+
+        rv = self._func(query, encoding)
+        with self._lock:
+            if (old := self._cache.get(key)) is not None:
+                self._nbytes -= old[1]
+            self._cache[key] = (rv, nbytes)
+            self._nbytes += nbytes
+            self._shrink()
+        return rv
+
+    def cache_info(self) -> QueryCacheInfo:
+        with self._lock:
+            return QueryCacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._cache)
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._nbytes = 0
+            self.hits = self.misses = 0
+
+    def resize(self, maxsize: int | None = None, max_bytes: int | None = None) -> None:
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._shrink()
+
+    def _shrink(self) -> None:
+        # Must be called with the lock held.
+        while len(self._cache) > self.maxsize or self._nbytes > self.max_bytes:
+            self._nbytes -= self._cache.popitem(last=False)[1][1]
+
+
+_query2pg = QueryCache(_query2pg_nocache)
 
 
 class GaussDBClientQuery(GaussDBQuery):
@@ -253,15 +362,9 @@ class GaussDBClientQuery(GaussDBQuery):
             bquery = query
 
         if vars is not None:
-            if (
-                len(bquery) <= MAX_CACHED_STATEMENT_LENGTH
-                and len(vars) <= MAX_CACHED_STATEMENT_PARAMS
-            ):
-                f: _Query2PgClient = _query2pg_client
-            else:
-                f = _query2pg_client_nocache
-
-            (self.template, self._order, self._parts) = f(bquery, self._encoding)
+            (self.template, self._order, self._parts) = _query2pg_client(
+                bquery, self._encoding, len(vars)
+            )
         else:
             self.query = bquery
             self._order = None
@@ -284,11 +387,6 @@ class GaussDBClientQuery(GaussDBQuery):
             self.params = None
 
 
-_Query2PgClient: TypeAlias = Callable[
-    [bytes, str], "tuple[bytes, list[str] | None, list[QueryPart]]"
-]
-
-
 def _query2pg_client_nocache(
     query: bytes, encoding: str
 ) -> tuple[bytes, list[str] | None, list[QueryPart]]:
@@ -326,7 +424,275 @@ def _query2pg_client_nocache(
     return b"".join(chunks), order, parts
 
 
-_query2pg_client = lru_cache(_query2pg_client_nocache)
+_query2pg_client = QueryCache(_query2pg_client_nocache)
+_query_caches = (_query2pg, _query2pg_client)
+
+
+def set_query_cache(
+    *,
+    maxsize: int | None = None,
+    max_bytes: int | None = None,
+    max_length: int | None = None,
+    max_params: int | None = None,
+) -> None:
+    """
+    Configure the caches of the queries converted to the GaussDB format.
+
+    :param maxsize: The number of queries to keep in every cache; 0 disables
+        the caches.
+    :param max_bytes: The total length of the queries, in bytes, to keep in
+        every cache. The least recently used queries are dropped above it.
+    :param max_length: The length of the queries, in bytes, above which the
+        queries are cached by a digest of their content.
+    :param max_params: The number of parameters above which the queries are
+        not cached.
+
+    The parameters not specified are left unchanged. The settings affect all
+    the connections in the process.
+    """
+    for name, value in (
+        ("maxsize", maxsize),
+        ("max_bytes", max_bytes),
+        ("max_length", max_length),
+        ("max_params", max_params),
+    ):
+        if value is not None and value < 0:
+            raise ValueError(f"{name} must be >= 0, got {value}")
+
+    for cache in _query_caches:
+        if maxsize is not None or max_bytes is not None:
+            cache.resize(maxsize, max_bytes)
+        if max_length is not None:
+            cache.max_length = max_length
+        if max_params is not None:
+            cache.max_params = max_params
+
+
+def query_cache_info() -> QueryCacheInfo:
+    """
+    Return statistics about the caches of the queries converted.
+
+    The `!hits`, `!misses`, `!currsize` statistics are summed up across the
+    caches used by client-side and server-side binding cursors; `!maxsize` is
+    the size of every cache, as set by `set_query_cache()`.
+    """
+    infos = [cache.cache_info() for cache in _query_caches]
+    return QueryCacheInfo(
+        hits=sum(info.hits for info in infos),
+        misses=sum(info.misses for info in infos),
+        maxsize=infos[0].maxsize,
+        currsize=sum(info.currsize for info in infos),
+    )
+
+
+def batch_values(
+    query: bytes, params_seq: Iterable[Params], batch_size: int, encoding: str
+) -> Iterator[tuple[bytes, list[Any]]]:
+    """
+    Group the records of an `!executemany()` in multi-row VALUES statements.
+
+    Rewrite an ``INSERT ... VALUES (%s, ...)`` statement into statements
+    inserting ``batch_size`` records each; generate pairs of (query, params)
+    with the params of every record of the batch in a flat list.
+
+    The records exceeding the last full batch are sent in batches of
+    decreasing powers of two, so that only a few distinct statements are
+    generated and they can be found again in the prepared statements cache.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+
+    prefix, group, suffix, parts, order = _split_values(query, encoding)
+    if (nparams := len(parts) - 1) * batch_size > MAX_STATEMENT_PARAMS:
+        raise e.ProgrammingError(
+            f"batch_size {batch_size} too large: the query has {nparams}"
+            f" placeholders and a statement can have at most"
+            f" {MAX_STATEMENT_PARAMS} parameters"
+        )
+
+    queries: dict[int, bytes] = {}
+    it = iter(params_seq)
+    while batch := list(islice(it, batch_size)):
+        # Split an incomplete batch in chunks of decreasing powers of two
+        sizes = [batch_size] if len(batch) == batch_size else _pow2_sizes(len(batch))
+        start = 0
+        for size in sizes:
+            if not (bquery := queries.get(size)):
+                bquery = queries[size] = b"".join(
+                    (prefix, b", ".join([group] * size), suffix)
+                )
+            records = batch[start : start + size]
+            start += size
+            params = chain.from_iterable(
+                GaussDBQuery.validate_and_reorder_params(parts, rec, order)
+                for rec in records
+            )
+            yield bquery, list(params)
+
+
+def unnest_values(
+    query: bytes,
+    params_seq: Iterable[Params],
+    batch_size: int | None,
+    encoding: str,
+) -> Iterator[tuple[bytes, list[Any]]]:
+    """
+    Execute the records of an `!executemany()` as columns of arrays.
+
+    Rewrite an ``INSERT ... VALUES (%s, ...)`` statement into ``INSERT ...
+    SELECT * FROM unnest(%b, ...)``; generate pairs of (query, params) with
+    every param a list of the values of a column in the records.
+
+    All the records are inserted in one statement, or in groups of
+    ``batch_size`` records if specified. The query is the same object for all
+    the groups, so that it can be prepared.
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+
+    bquery, parts, order = _unnest_query(query, encoding)
+    it = iter(params_seq)
+    while records := list(islice(it, batch_size)):
+        rows = (
+            GaussDBQuery.validate_and_reorder_params(parts, rec, order)
+            for rec in records
+        )
+        yield bquery, [list(col) for col in zip(*rows)]
+
+
+@lru_cache
+def _unnest_query(
+    query: bytes, encoding: str
+) -> tuple[bytes, list[QueryPart], list[str] | None]:
+    """
+    Convert an ``INSERT ... VALUES`` query into an ``INSERT ... SELECT``.
+
+    The VALUES record can only contain placeholders, optionally cast: the
+    casts are converted to array casts (e.g. ``%s::int`` to ``%b::int[]``).
+    Return the query, the original query parts and the order of the names,
+    as `_split_values()`.
+    """
+    prefix, group, suffix, parts, order = _split_values(query, encoding)
+    gparts = _split_query(group, encoding, collapse_double_percent=False)
+    if gparts[0].pre.strip() != b"(":
+        raise e.ProgrammingError(_UNNEST_ERROR)
+
+    cols = []
+    for i, part in enumerate(gparts[:-1]):
+        sep = _re_unnest_sep if i < len(gparts) - 2 else _re_unnest_end
+        if not (m := sep.fullmatch(gparts[i + 1].pre)):
+            raise e.ProgrammingError(_UNNEST_ERROR)
+        # Lists are dumped in binary unless text is requested explicitly
+        fmt = PyFormat.BINARY if part.format == PyFormat.AUTO else part.format
+        col = b"%" + _fmt_to_ph[fmt]
+        if m.group(1):
+            col += b"::%s[]" % m.group(1)
+        cols.append(col)
+
+    prefix = _re_values_end.sub(b"", prefix)
+    bquery = b"".join(
+        (prefix, b"select * from unnest(", b", ".join(cols), b")", suffix)
+    )
+    return bquery, parts, order
+
+
+_UNNEST_ERROR = (
+    "mode='unnest' requires a VALUES record containing only placeholders,"
+    " optionally cast, e.g. VALUES (%s::int, %s)"
+)
+
+_re_cast = rb"""(?x)
+    (?: \s* :: \s*
+        (                           # the type name: words, optionally
+            [\w."]+ (?: \s+ [\w."]+ )*  # separated by spaces
+            (?: \s* \( [\d\s,]* \) )?   # with an optional modifier
+        )
+    )?
+    \s*
+"""
+_re_unnest_sep = re.compile(_re_cast + rb",\s*")
+_re_unnest_end = re.compile(_re_cast + rb"\)")
+_re_values_end = re.compile(rb"(?i)\bvalues\s*$")
+
+
+def _pow2_sizes(n: int) -> list[int]:
+    return [1 << i for i in range(n.bit_length() - 1, -1, -1) if n & (1 << i)]
+
+
+@lru_cache
+def _split_values(
+    query: bytes, encoding: str
+) -> tuple[bytes, bytes, bytes, list[QueryPart], list[str] | None]:
+    """
+    Split a query in the parts before, inside, and after its VALUES record.
+
+    Return the ``prefix`` up to the parenthesis opening the record, the
+    ``group`` containing the record, with positional placeholders, the
+    ``suffix`` after the record, the query ``parts`` and, if the query uses
+    named placeholders, the ``order`` in which the params are used.
+    """
+    parts = _split_query(query, encoding, collapse_double_percent=False)
+    if len(parts) < 2:
+        raise e.ProgrammingError("batch_size requires a query with placeholders")
+
+    # The record must be the last VALUES clause before the first placeholder
+    # and must be closed after the last one.
+    matches = list(_re_values.finditer(parts[0].pre))
+    if not matches:
+        raise e.ProgrammingError(
+            "batch_size requires an INSERT ... VALUES (...) query, with all"
+            " the placeholders in the VALUES record"
+        )
+    start = matches[-1].end() - 1
+
+    chunks = [parts[0].pre[start:]]
+    order: list[str] | None = [] if isinstance(parts[0].item, str) else None
+    for i, part in enumerate(parts[:-1]):
+        if i:
+            chunks.append(part.pre)
+        chunks.append(b"%" + _fmt_to_ph[part.format])
+        if order is not None:
+            assert isinstance(part.item, str)
+            order.append(part.item)
+
+    end, depth, quote = _scan_parens(b"".join(chunks))
+    if end >= 0:
+        raise e.ProgrammingError(
+            "batch_size requires all the query placeholders in the VALUES record"
+        )
+    last = parts[-1].pre
+    end, depth, quote = _scan_parens(last, depth, quote)
+    if end < 0:
+        raise e.ProgrammingError("the VALUES record in the query is not closed")
+
+    chunks.append(last[: end + 1])
+    return (parts[0].pre[:start], b"".join(chunks), last[end + 1 :], parts, order)
+
+
+def _scan_parens(data: bytes, depth: int = 0, quote: int = 0) -> tuple[int, int, int]:
+    """
+    Look for the parenthesis closing the one open at the start of `!data`.
+
+    Return the position of the closing parenthesis, or -1 if not found, and
+    the parenthesis depth and the open quote char, to continue the scan.
+    """
+    for i, c in enumerate(data):
+        if quote:
+            if c == quote:
+                quote = 0
+        elif c == _QUOTE or c == _DQUOTE:
+            quote = c
+        elif c == _LPAREN:
+            depth += 1
+        elif c == _RPAREN:
+            depth -= 1
+            if not depth:
+                return i, depth, quote
+    return -1, depth, quote
+
+
+_re_values = re.compile(rb"(?i)\bvalues\s*\(")
+_QUOTE, _DQUOTE, _LPAREN, _RPAREN = b"'\"()"
 
 
 _re_placeholder = re.compile(
@@ -423,3 +789,5 @@ _ph_to_fmt = {
     b"t": PyFormat.TEXT,
     b"b": PyFormat.BINARY,
 }
+
+_fmt_to_ph = {v: k for k, v in _ph_to_fmt.items()}
@@ -23,19 +23,23 @@ class UnpackLen(Protocol):
     def __call__(self, data: Buffer, start: int | None) -> tuple[int]: ...
 
 
+pack_uint1 = cast(PackInt, struct.Struct("!B").pack)
 pack_int2 = cast(PackInt, struct.Struct("!h").pack)
 pack_uint2 = cast(PackInt, struct.Struct("!H").pack)
 pack_int4 = cast(PackInt, struct.Struct("!i").pack)
 pack_uint4 = cast(PackInt, struct.Struct("!I").pack)
 pack_int8 = cast(PackInt, struct.Struct("!q").pack)
+pack_uint8 = cast(PackInt, struct.Struct("!Q").pack)
 pack_float4 = cast(PackFloat, struct.Struct("!f").pack)
 pack_float8 = cast(PackFloat, struct.Struct("!d").pack)
 
+unpack_uint1 = cast(UnpackInt, struct.Struct("!B").unpack)
 unpack_int2 = cast(UnpackInt, struct.Struct("!h").unpack)
 unpack_uint2 = cast(UnpackInt, struct.Struct("!H").unpack)
 unpack_int4 = cast(UnpackInt, struct.Struct("!i").unpack)
 unpack_uint4 = cast(UnpackInt, struct.Struct("!I").unpack)
 unpack_int8 = cast(UnpackInt, struct.Struct("!q").unpack)
+unpack_uint8 = cast(UnpackInt, struct.Struct("!Q").unpack)
 unpack_float4 = cast(UnpackFloat, struct.Struct("!f").unpack)
 unpack_float8 = cast(UnpackFloat, struct.Struct("!d").unpack)
 
@@ -26,7 +26,9 @@ NoneType: type = type(None)
 # An object implementing the buffer protocol
 Buffer: TypeAlias = Union[bytes, bytearray, memoryview]
 
-Query: TypeAlias = Union[LiteralString, bytes, "sql.SQL", "sql.Composed"]
+Query: TypeAlias = Union[
+    LiteralString, bytes, "sql.SQL", "sql.Composed", "sql.Compiled"
+]
 Params: TypeAlias = Union[Sequence[Any], Mapping[str, Any]]
 ConnectionType = TypeVar("ConnectionType", bound="BaseConnection[Any]")
 PipelineCommand: TypeAlias = Callable[[], None]
@@ -241,6 +243,8 @@ class Transformer(Protocol):
 
     def get_dumper(self, obj: Any, format: PyFormat) -> Dumper: ...
 
+    def get_dumper_by_oid(self, oid: int, format: pq.Format) -> Dumper: ...
+
     def load_rows(self, row0: int, row1: int, make_row: RowMaker[Row]) -> list[Row]: ...
 
     def load_row(self, row: int, make_row: RowMaker[Row]) -> Row | None: ...
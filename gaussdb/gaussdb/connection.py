@@ -74,6 +74,8 @@ class Connection(BaseConnection[Row]):
         self.lock = Lock()
         self.cursor_factory = Cursor
         self.server_cursor_factory = ServerCursor
+        # Keep the socket registered on the poller across the waits.
+        self._waiter = waiting.Waiter()
 
     @classmethod
     def connect(
@@ -85,12 +87,16 @@ class Connection(BaseConnection[Row]):
         context: AdaptContext | None = None,
         row_factory: RowFactory[Row] | None = None,
         cursor_factory: type[Cursor[Row]] | None = None,
+        auto_pipeline: bool = False,
         **kwargs: ConnParam,
     ) -> Self:
         """
         Connect to a database server and return a new `Connection` instance.
         """
 
+        if auto_pipeline:
+            capabilities.has_pipeline(check=True)
+
         params = cls._get_connection_params(conninfo, **kwargs)
         timeout = timeout_from_conninfo(params)
         rv = None
@@ -125,6 +131,7 @@ class Connection(BaseConnection[Row]):
         if context:
             rv._adapters = AdaptersMap(context.adapters)
         rv.prepare_threshold = prepare_threshold
+        rv._auto_pipeline = auto_pipeline
         return rv
 
     def __enter__(self) -> Self:
@@ -161,11 +168,30 @@ class Connection(BaseConnection[Row]):
     def close(self) -> None:
         """Close the database connection."""
         if self.closed:
+            self._waiter.close()
             return
+
+        if self._pipeline and self._auto_pipeline:
+            # Don't lose the statements not synced yet. Don't wait for the
+            # lock though: the connection may be busy in another thread or task.
+            acquired = self.lock.acquire(blocking=False)
+            if acquired:
+                try:
+                    self.wait(self._exit_auto_pipeline_gen())
+                except Exception as ex:
+                    logger.warning("error syncing the pipeline on close: %s", ex)
+                finally:
+                    self.lock.release()
+            else:
+                logger.warning("connection busy: pipeline not synced on close")
+
         self._closed = True
 
         # TODO: maybe send a cancel on close, if the connection is ACTIVE?
 
+        # Unregister the socket only now: syncing the pipeline may have
+        # registered it again, and its number may be reused after finish().
+        self._waiter.close()
         self.pgconn.finish()
 
     @overload
@@ -324,6 +350,8 @@ class Connection(BaseConnection[Row]):
             You might actually receive more than this number if more than one
             notifications arrives in the same packet.
         """
+        self._exit_auto_pipeline()
+
         # Allow interrupting the wait with a signal by reducing a long timeout
         # into shorter intervals.
         if timeout is not None:
@@ -378,8 +406,25 @@ class Connection(BaseConnection[Row]):
                 self._notifies_backlog = d
 
     @contextmanager
-    def pipeline(self) -> Iterator[Pipeline]:
-        """Context manager to switch the connection into pipeline mode."""
+    def pipeline(
+        self,
+        *,
+        max_batch: int | None = None,
+        max_bytes: int | None = None,
+        max_delay: float | None = None,
+    ) -> Iterator[Pipeline]:
+        """Context manager to switch the connection into pipeline mode.
+
+        :param max_batch: if set, send the queued commands only when their
+            number reaches this value.
+        :param max_bytes: if set, send the queued queries only when the size
+            of their text and parameters reaches this value.
+        :param max_delay: if set, send the queued commands only when the
+            oldest one was queued at least these many seconds ago.
+
+        The commands are always sent when their results are needed. The
+        limits are set on the `Pipeline` for the duration of the block.
+        """
         with self.lock:
             self._check_connection_ok()
 
@@ -388,15 +433,33 @@ class Connection(BaseConnection[Row]):
                 # WARNING: reference loop, broken ahead.
                 pipeline = self._pipeline = Pipeline(self)
 
+            policy = (pipeline.max_batch, pipeline.max_bytes, pipeline.max_delay)
+            if max_batch is not None or max_bytes is not None or max_delay is not None:
+                pipeline.max_batch = max_batch
+                pipeline.max_bytes = max_bytes
+                pipeline.max_delay = max_delay
+
         try:
             with pipeline:
                 yield pipeline
         finally:
+            pipeline.max_batch, pipeline.max_bytes, pipeline.max_delay = policy
             if pipeline.level == 0:
                 with self.lock:
                     assert pipeline is self._pipeline
                     self._pipeline = None
 
+    def _new_pipeline(self) -> Pipeline:
+        return Pipeline(self)
+
+    def _exit_auto_pipeline(self) -> None:
+        """
+        Sync and exit the pipeline entered automatically, if any.
+        """
+        if self._pipeline and self._auto_pipeline:
+            with self.lock:
+                self.wait(self._exit_auto_pipeline_gen())
+
     def wait(self, gen: PQGen[RV], interval: float | None = _WAIT_INTERVAL) -> RV:
         """
         Consume a generator operating on the connection.
@@ -405,18 +468,26 @@ class Connection(BaseConnection[Row]):
         fd (i.e. not on connect and reset).
         """
         try:
-            return waiting.wait(gen, self.pgconn.socket, interval=interval)
+            return self._waiter.wait(gen, self.pgconn.socket, interval=interval)
         except _INTERRUPTED:
             if self.pgconn.transaction_status == ACTIVE:
                 # On Ctrl-C, try to cancel the query in the server, otherwise
                 # the connection will remain stuck in ACTIVE state.
                 self._try_cancel(timeout=5.0)
                 try:
-                    waiting.wait(gen, self.pgconn.socket, interval=interval)
+                    self._waiter.wait(gen, self.pgconn.socket, interval=interval)
                 except e.QueryCanceled:
                     pass  # as expected
             raise
 
+    def _maintain_prepared(self) -> None:
+        """
+        Deallocate the statements pending and prepare the shared ones.
+        """
+        with self.lock:
+            self.wait(self._prepared.flush_gen(self))
+            self.wait(self._prepared.prepare_shared_gen(self))
+
     def _set_autocommit(self, value: bool) -> None:
         self.set_autocommit(value)
 
@@ -34,6 +34,7 @@ from ._connection_base import BaseConnection, CursorRow, Notify
 if True:  # ASYNC
     import sys
     import asyncio
+    import weakref
     from asyncio import Lock, to_thread
 else:
     from threading import Lock
@@ -80,6 +81,10 @@ class AsyncConnection(BaseConnection[Row]):
         self.lock = Lock()
         self.cursor_factory = AsyncCursor
         self.server_cursor_factory = AsyncServerCursor
+        # Keep the socket registered on the poller across the waits.
+        self._waiter = waiting.AsyncWaiter()
+        if True:  # ASYNC
+            weakref.finalize(self, self._waiter.close_threadsafe).atexit = False
 
     @classmethod
     async def connect(
@@ -91,6 +96,7 @@ class AsyncConnection(BaseConnection[Row]):
         context: AdaptContext | None = None,
         row_factory: AsyncRowFactory[Row] | None = None,
         cursor_factory: type[AsyncCursor[Row]] | None = None,
+        auto_pipeline: bool = False,
         **kwargs: ConnParam,
     ) -> Self:
         """
@@ -107,6 +113,9 @@ class AsyncConnection(BaseConnection[Row]):
                         "(WindowsSelectorEventLoopPolicy())'"
                     )
 
+        if auto_pipeline:
+            capabilities.has_pipeline(check=True)
+
         params = await cls._get_connection_params(conninfo, **kwargs)
         timeout = timeout_from_conninfo(params)
         rv = None
@@ -141,6 +150,7 @@ class AsyncConnection(BaseConnection[Row]):
         if context:
             rv._adapters = AdaptersMap(context.adapters)
         rv.prepare_threshold = prepare_threshold
+        rv._auto_pipeline = auto_pipeline
         return rv
 
     async def __aenter__(self) -> Self:
@@ -177,11 +187,34 @@ class AsyncConnection(BaseConnection[Row]):
     async def close(self) -> None:
         """Close the database connection."""
         if self.closed:
+            self._waiter.close()
             return
+
+        if self._pipeline and self._auto_pipeline:
+            # Don't lose the statements not synced yet. Don't wait for the
+            # lock though: the connection may be busy in another thread or task.
+            if True:  # ASYNC
+                if acquired := not self.lock.locked():
+                    await self.lock.acquire()
+            else:
+                acquired = self.lock.acquire(blocking=False)
+            if acquired:
+                try:
+                    await self.wait(self._exit_auto_pipeline_gen())
+                except Exception as ex:
+                    logger.warning("error syncing the pipeline on close: %s", ex)
+                finally:
+                    self.lock.release()
+            else:
+                logger.warning("connection busy: pipeline not synced on close")
+
         self._closed = True
 
         # TODO: maybe send a cancel on close, if the connection is ACTIVE?
 
+        # Unregister the socket only now: syncing the pipeline may have
+        # registered it again, and its number may be reused after finish().
+        self._waiter.close()
         self.pgconn.finish()
 
     @overload
@@ -344,6 +377,8 @@ class AsyncConnection(BaseConnection[Row]):
             You might actually receive more than this number if more than one
             notifications arrives in the same packet.
         """
+        await self._exit_auto_pipeline()
+
         # Allow interrupting the wait with a signal by reducing a long timeout
         # into shorter intervals.
         if timeout is not None:
@@ -401,8 +436,25 @@ class AsyncConnection(BaseConnection[Row]):
                 self._notifies_backlog = d
 
     @asynccontextmanager
-    async def pipeline(self) -> AsyncIterator[AsyncPipeline]:
-        """Context manager to switch the connection into pipeline mode."""
+    async def pipeline(
+        self,
+        *,
+        max_batch: int | None = None,
+        max_bytes: int | None = None,
+        max_delay: float | None = None,
+    ) -> AsyncIterator[AsyncPipeline]:
+        """Context manager to switch the connection into pipeline mode.
+
+        :param max_batch: if set, send the queued commands only when their
+            number reaches this value.
+        :param max_bytes: if set, send the queued queries only when the size
+            of their text and parameters reaches this value.
+        :param max_delay: if set, send the queued commands only when the
+            oldest one was queued at least these many seconds ago.
+
+        The commands are always sent when their results are needed. The
+        limits are set on the `AsyncPipeline` for the duration of the block.
+        """
         async with self.lock:
             self._check_connection_ok()
 
@@ -411,15 +463,33 @@ class AsyncConnection(BaseConnection[Row]):
                 # WARNING: reference loop, broken ahead.
                 pipeline = self._pipeline = AsyncPipeline(self)
 
+            policy = (pipeline.max_batch, pipeline.max_bytes, pipeline.max_delay)
+            if max_batch is not None or max_bytes is not None or max_delay is not None:
+                pipeline.max_batch = max_batch
+                pipeline.max_bytes = max_bytes
+                pipeline.max_delay = max_delay
+
         try:
             async with pipeline:
                 yield pipeline
         finally:
+            pipeline.max_batch, pipeline.max_bytes, pipeline.max_delay = policy
             if pipeline.level == 0:
                 async with self.lock:
                     assert pipeline is self._pipeline
                     self._pipeline = None
 
+    def _new_pipeline(self) -> AsyncPipeline:
+        return AsyncPipeline(self)
+
+    async def _exit_auto_pipeline(self) -> None:
+        """
+        Sync and exit the pipeline entered automatically, if any.
+        """
+        if self._pipeline and self._auto_pipeline:
+            async with self.lock:
+                await self.wait(self._exit_auto_pipeline_gen())
+
     async def wait(self, gen: PQGen[RV], interval: float | None = _WAIT_INTERVAL) -> RV:
         """
         Consume a generator operating on the connection.
@@ -428,18 +498,26 @@ class AsyncConnection(BaseConnection[Row]):
         fd (i.e. not on connect and reset).
         """
         try:
-            return await waiting.wait_async(gen, self.pgconn.socket, interval=interval)
+            return await self._waiter.wait(gen, self.pgconn.socket, interval=interval)
         except _INTERRUPTED:
             if self.pgconn.transaction_status == ACTIVE:
                 # On Ctrl-C, try to cancel the query in the server, otherwise
                 # the connection will remain stuck in ACTIVE state.
                 await self._try_cancel(timeout=5.0)
                 try:
-                    await waiting.wait_async(gen, self.pgconn.socket, interval=interval)
+                    await self._waiter.wait(gen, self.pgconn.socket, interval=interval)
                 except e.QueryCanceled:
                     pass  # as expected
             raise
 
+    async def _maintain_prepared(self) -> None:
+        """
+        Deallocate the statements pending and prepare the shared ones.
+        """
+        async with self.lock:
+            await self.wait(self._prepared.flush_gen(self))
+            await self.wait(self._prepared.prepare_shared_gen(self))
+
     def _set_autocommit(self, value: bool) -> None:
         if True:  # ASYNC
             self._no_set_async("autocommit")
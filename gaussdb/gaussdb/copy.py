@@ -4,7 +4,7 @@ Module gathering the various parts of the copy subsystem.
 
 from typing import IO
 
-from . import _copy, _copy_async
+from . import _columnar, _copy, _copy_async
 from .abc import Buffer
 
 # re-exports
@@ -19,6 +19,8 @@ Writer = _copy.Writer
 LibpqWriter = _copy.LibpqWriter
 QueuedLibpqWriter = _copy.QueuedLibpqWriter
 
+BufferColumn = _columnar.BufferColumn
+
 
 class FileWriter(Writer):
     """
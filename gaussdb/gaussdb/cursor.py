@@ -20,6 +20,7 @@ from .abc import Params, Query
 from .copy import Copy, Writer
 from .rows import Row, RowFactory, RowMaker
 from ._compat import Self
+from ._columnar import load_columns
 from ._pipeline import Pipeline
 from ._cursor_base import BaseCursor
 
@@ -99,7 +100,13 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
         return self
 
     def executemany(
-        self, query: Query, params_seq: Iterable[Params], *, returning: bool = False
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = False,
+        batch_size: int | None = None,
+        mode: str | None = None,
     ) -> None:
         """
         Execute the same command with a sequence of input data.
@@ -112,18 +119,24 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
                     p = self._conn._pipeline
                     if p:
                         self._conn.wait(
-                            self._executemany_gen_pipeline(query, params_seq, returning)
+                            self._executemany_gen_pipeline(
+                                query, params_seq, returning, batch_size, mode
+                            )
                         )
                 # Otherwise, make a new one
                 if not p:
                     with self._conn.pipeline(), self._conn.lock:
                         self._conn.wait(
-                            self._executemany_gen_pipeline(query, params_seq, returning)
+                            self._executemany_gen_pipeline(
+                                query, params_seq, returning, batch_size, mode
+                            )
                         )
             else:
                 with self._conn.lock:
                     self._conn.wait(
-                        self._executemany_gen_no_pipeline(query, params_seq, returning)
+                        self._executemany_gen_no_pipeline(
+                            query, params_seq, returning, batch_size, mode
+                        )
                     )
         except e._NO_TRACEBACK as ex:
             raise ex.with_traceback(None)
@@ -143,6 +156,7 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
             this size from the server (but still yielded row-by-row); this is only
             available from version 17 of the libpq.
         """
+        self._conn._exit_auto_pipeline()
         if self._pgconn.pipeline_status:
             raise e.ProgrammingError("stream() cannot be used in pipeline mode")
 
@@ -227,6 +241,23 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
         self._pos = self.pgresult.ntuples
         return records
 
+    def fetch_columns(self, *, numpy: bool = False) -> dict[str, Any]:
+        """
+        Return all the remaining records from the current recordset by column.
+
+        :param numpy: if `!True` return NumPy arrays instead of lists.
+        :return: a dict mapping every column name to the values of the column.
+
+        The `row_factory` is not used. Columns of fixed size types received in
+        binary format are converted to NumPy arrays in bulk.
+        """
+        self._fetch_pipeline()
+        self._check_result_for_fetch()
+        assert self.pgresult
+        columns = load_columns(self, numpy=numpy)
+        self._pos = self.pgresult.ntuples
+        return columns
+
     def __iter__(self) -> Iterator[Row]:
         self._fetch_pipeline()
         self._check_result_for_fetch()
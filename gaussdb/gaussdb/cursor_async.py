@@ -17,6 +17,7 @@ from .abc import Params, Query
 from .copy import AsyncCopy, AsyncWriter
 from .rows import AsyncRowFactory, Row, RowMaker
 from ._compat import Self
+from ._columnar import load_columns
 from ._pipeline import Pipeline
 from ._cursor_base import BaseCursor
 
@@ -104,6 +105,8 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         params_seq: Iterable[Params],
         *,
         returning: bool = False,
+        batch_size: int | None = None,
+        mode: str | None = None,
     ) -> None:
         """
         Execute the same command with a sequence of input data.
@@ -116,18 +119,24 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
                     p = self._conn._pipeline
                     if p:
                         await self._conn.wait(
-                            self._executemany_gen_pipeline(query, params_seq, returning)
+                            self._executemany_gen_pipeline(
+                                query, params_seq, returning, batch_size, mode
+                            )
                         )
                 # Otherwise, make a new one
                 if not p:
                     async with self._conn.pipeline(), self._conn.lock:
                         await self._conn.wait(
-                            self._executemany_gen_pipeline(query, params_seq, returning)
+                            self._executemany_gen_pipeline(
+                                query, params_seq, returning, batch_size, mode
+                            )
                         )
             else:
                 async with self._conn.lock:
                     await self._conn.wait(
-                        self._executemany_gen_no_pipeline(query, params_seq, returning)
+                        self._executemany_gen_no_pipeline(
+                            query, params_seq, returning, batch_size, mode
+                        )
                     )
         except e._NO_TRACEBACK as ex:
             raise ex.with_traceback(None)
@@ -147,6 +156,7 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
             this size from the server (but still yielded row-by-row); this is only
             available from version 17 of the libpq.
         """
+        await self._conn._exit_auto_pipeline()
         if self._pgconn.pipeline_status:
             raise e.ProgrammingError("stream() cannot be used in pipeline mode")
 
@@ -237,6 +247,23 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         self._pos = self.pgresult.ntuples
         return records
 
+    async def fetch_columns(self, *, numpy: bool = False) -> dict[str, Any]:
+        """
+        Return all the remaining records from the current recordset by column.
+
+        :param numpy: if `!True` return NumPy arrays instead of lists.
+        :return: a dict mapping every column name to the values of the column.
+
+        The `row_factory` is not used. Columns of fixed size types received in
+        binary format are converted to NumPy arrays in bulk.
+        """
+        await self._fetch_pipeline()
+        self._check_result_for_fetch()
+        assert self.pgresult
+        columns = load_columns(self, numpy=numpy)
+        self._pos = self.pgresult.ntuples
+        return columns
+
     async def __aiter__(self) -> AsyncIterator[Row]:
         await self._fetch_pipeline()
         self._check_result_for_fetch()
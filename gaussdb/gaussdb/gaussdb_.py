@@ -160,7 +160,7 @@ def register_default_types(types: TypesRegistry) -> None:
 
 def register_default_adapters(context: AdaptContext) -> None:
     from .types import array, bool, composite, datetime, enum, json, multirange, net
-    from .types import none, numeric, numpy, range, string, uuid
+    from .types import none, numeric, numpy, range, string, uuid, vector
 
     array.register_default_adapters(context)
     composite.register_default_adapters(context)
@@ -173,12 +173,12 @@ def register_default_adapters(context: AdaptContext) -> None:
     range.register_default_adapters(context)
     string.register_default_adapters(context)
     uuid.register_default_adapters(context)
+    vector.register_default_adapters(context)
 
-    # Both numpy Decimal and uint64 dumpers use the numeric oid, but the former
-    # covers the entire numeric domain, whereas the latter only deals with
-    # integers. For this reason, if we specify dumpers by oid, we want to make
-    # sure to get the Decimal dumper. We enforce that by registering the
-    # numeric dumpers last.
+    # The numpy dumpers use the same oids of the bool, int and float dumpers.
+    # If we specify dumpers by oid, we want to get the dumpers of the Python
+    # types, which accept any object of the domain. We enforce that by
+    # registering the bool and numeric dumpers last.
     numpy.register_default_adapters(context)
     bool.register_default_adapters(context)
     numeric.register_default_adapters(context)
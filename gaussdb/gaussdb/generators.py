@@ -24,7 +24,9 @@ from __future__ import annotations
 
 import logging
 from time import monotonic
+from contextlib import contextmanager
 from collections import deque
+from collections.abc import Iterator
 
 from . import errors as e
 from . import pq
@@ -403,6 +405,29 @@ def copy_end(pgconn: PGconn, error: bytes | None) -> PQGen[PGresult]:
 
 
 # Override functions with fast versions if available
+@contextmanager
+def pipeline_mode(pgconn: PGconn) -> Iterator[None]:
+    """
+    Context to send a batch of commands in pipeline mode.
+
+    The pipeline mode is left on exit, even in case of error. If the batch was
+    interrupted with results still pending (for instance by a network error,
+    or by a cancelled wait) the libpq refuses to leave it: in this case the
+    original exception is raised.
+    """
+    pgconn.enter_pipeline_mode()
+    try:
+        yield
+    except BaseException:
+        try:
+            pgconn.exit_pipeline_mode()
+        except e.OperationalError as ex:
+            logger.warning("couldn't exit pipeline mode: %s", ex)
+        raise
+    else:
+        pgconn.exit_pipeline_mode()
+
+
 if _gaussdb:
     connect = _gaussdb.connect
     cancel = _gaussdb.cancel
@@ -5,7 +5,7 @@ types stub for ctypes functions
 # Copyright (C) 2020 The Psycopg Team
 
 from ctypes import Array, _Pointer, c_char, c_char_p, c_int, c_ubyte, c_uint, c_ulong
-from ctypes import pointer
+from ctypes import c_void_p, pointer
 from typing import Any, Callable, Sequence
 
 class FILE: ...
@@ -65,6 +65,10 @@ def PQprepare(
 def PQgetvalue(
     arg1: PGresult_struct | None, arg2: int, arg3: int
 ) -> _Pointer[c_char]: ...
+def PQgetvalue_unchecked(arg1: c_void_p, arg2: int, arg3: int) -> int | None: ...
+def PQgetisnull_unchecked(arg1: c_void_p, arg2: int, arg3: int) -> int: ...
+def PQgetlength_unchecked(arg1: c_void_p, arg2: int, arg3: int) -> int: ...
+def PQgetvalue_text_unchecked(arg1: c_void_p, arg2: int, arg3: int) -> bytes: ...
 def PQcmdTuples(arg1: PGresult_struct | None) -> bytes: ...
 def PQescapeStringConn(
     arg1: PGconn_struct | None,
@@ -265,6 +265,12 @@ class PGresult(Protocol):
 
     def get_value(self, row_number: int, column_number: int) -> bytes | None: ...
 
+    def get_column(self, column_number: int) -> list[bytes | None]: ...
+
+    def get_row(self, row_number: int) -> list[bytes | None]: ...
+
+    def get_columns(self) -> list[list[bytes | None]]: ...
+
     @property
     def nparams(self) -> int: ...
 
@@ -944,6 +944,83 @@ class PGresult:
             else:
                 return b""
 
+    def get_column(self, column_number: int) -> list[bytes | None]:
+        """
+        Return the values of a column for all the rows of the result.
+
+        Every value is returned as `get_value()` would, but the column is
+        scanned in a single pass, which is considerably cheaper.
+        """
+        rv: list[bytes | None] = []
+        if not self._pgresult_ptr:
+            return rv
+
+        ptr = c_void_p(addressof(self._pgresult_ptr.contents))
+        getisnull = impl.PQgetisnull_unchecked
+        nrows = impl.PQntuples(self._pgresult_ptr)
+
+        if impl.PQfformat(self._pgresult_ptr, column_number) == Format.TEXT:
+            # Fetch the text values with a single call each; only the empty
+            # ones need another call to tell them from the NULLs.
+            gettext = impl.PQgetvalue_text_unchecked
+            rv = [gettext(ptr, row, column_number) for row in range(nrows)]
+            for row, value in enumerate(rv):
+                if not value and getisnull(ptr, row, column_number):
+                    rv[row] = None
+            return rv
+
+        getlength = impl.PQgetlength_unchecked
+        getvalue = impl.PQgetvalue_unchecked
+
+        append = rv.append
+        for row in range(nrows):
+            length = getlength(ptr, row, column_number)
+            if length:
+                append(string_at(getvalue(ptr, row, column_number), length))
+            elif getisnull(ptr, row, column_number):
+                append(None)
+            else:
+                append(b"")
+
+        return rv
+
+    def get_row(self, row_number: int) -> list[bytes | None]:
+        """
+        Return the values of all the columns of a row of the result.
+
+        Every value is returned as `get_value()` would, but the row is
+        scanned in a single pass, which is considerably cheaper.
+        """
+        rv: list[bytes | None] = []
+        if not self._pgresult_ptr:
+            return rv
+
+        ptr = c_void_p(addressof(self._pgresult_ptr.contents))
+        getlength = impl.PQgetlength_unchecked
+        getvalue = impl.PQgetvalue_unchecked
+        getisnull = impl.PQgetisnull_unchecked
+
+        append = rv.append
+        for col in range(impl.PQnfields(self._pgresult_ptr)):
+            length = getlength(ptr, row_number, col)
+            if length:
+                append(string_at(getvalue(ptr, row_number, col), length))
+            elif getisnull(ptr, row_number, col):
+                append(None)
+            else:
+                append(b"")
+
+        return rv
+
+    def get_columns(self) -> list[list[bytes | None]]:
+        """
+        Return the values of all the columns of the result.
+
+        The result is a list of columns, each one as returned by `get_column()`.
+        """
+        nfields = impl.PQnfields(self._pgresult_ptr)
+        return [self.get_column(i) for i in range(nfields)]
+
     @property
     def nparams(self) -> int:
         return impl.PQnparams(self._pgresult_ptr)
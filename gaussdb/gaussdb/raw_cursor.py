@@ -7,7 +7,9 @@ gaussdb raw queries cursors
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from collections.abc import Iterable
 
+from . import errors as e
 from .abc import ConnectionType, Params, Query
 from .sql import Composable
 from .rows import Row
@@ -56,6 +58,19 @@ class GaussDBRawQuery(GaussDBQuery):
 class RawCursorMixin(BaseCursor[ConnectionType, Row]):
     _query_cls = GaussDBRawQuery
 
+    def _executemany_items(
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        batch_size: int | None,
+        mode: str | None,
+    ) -> Iterable[tuple[Query, Params]]:
+        if batch_size or mode:
+            raise e.NotSupportedError(
+                "batch_size and mode are not supported by raw cursors"
+            )
+        return super()._executemany_items(query, params_seq, batch_size, mode)
+
 
 class RawCursor(RawCursorMixin["Connection[Any]", Row], Cursor[Row]):
     __module__ = "gaussdb"
@@ -6,14 +6,17 @@ gaussdb row factories
 
 from __future__ import annotations
 
+import keyword
 import functools
-from typing import TYPE_CHECKING, Any, Callable, NamedTuple, NoReturn, Protocol
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, NamedTuple, NoReturn
+from typing import Protocol
 from collections import namedtuple
-from collections.abc import Sequence
+from collections.abc import Iterator, Mapping, Sequence
 
 from . import errors as e
 from . import pq
-from ._compat import TypeAlias, TypeVar
+from .abc import Buffer, LoadFunc
+from ._compat import Self, TypeAlias, TypeVar
 from ._encodings import _as_python_identifier
 
 if TYPE_CHECKING:
@@ -49,6 +52,21 @@ class RowMaker(Protocol[Row]):
     def __call__(self, __values: Sequence[Any]) -> Row: ...
 
 
+class ResultRowMaker(RowMaker[Row], Protocol[Row]):
+    """
+    A `RowMaker` which can also create a row from the query result directly.
+
+    If a row maker has a `!from_result()` method, the values of the records
+    are not converted before creating the rows: the method is called instead,
+    with the loaders of the result columns, and the row can convert the
+    values when it prefers.
+    """
+
+    def from_result(
+        self, __pgresult: PGresult, __row: int, __loaders: Sequence[LoadFunc]
+    ) -> Row: ...
+
+
 class RowFactory(Protocol[Row]):
     """
     Callable protocol taking a `~gaussdb.Cursor` and returning a `RowMaker`.
@@ -149,6 +167,93 @@ def _make_nt(enc: str, *names: bytes) -> type[NamedTuple]:
     return namedtuple("Row", snames)  # type: ignore[return-value]
 
 
+def slots_row(cursor: BaseCursor[Any, Any]) -> RowMaker[SlotsRow]:
+    """Row factory to represent rows as compact objects with `!__slots__`.
+
+    Every column value is available both as an attribute, with the same
+    mangling of `namedtuple_row()`, and as a mapping item, by column name.
+    The classes are cached and shared by the results with the same columns.
+    """
+    res = cursor.pgresult
+    if not res:
+        return no_result
+
+    nfields = _get_nfields(res)
+    if nfields is None:
+        return no_result
+
+    return _make_slots_row(cursor._encoding, *(res.fname(i) for i in range(nfields)))
+
+
+class SlotsRow(Mapping[str, Any]):
+    """
+    Base class of the rows returned by `slots_row()`.
+
+    The subclasses store every value of the row in a slot, so they are much
+    smaller than a dictionary, and can be used as a read-only mapping from the
+    column names to the values.
+    """
+
+    __slots__ = ()
+
+    _fields: ClassVar[tuple[str, ...]] = ()
+    _keys: ClassVar[dict[str, str]] = {}
+
+    if TYPE_CHECKING:
+
+        def __init__(self, values: Sequence[Any]): ...
+
+        # The fields are only known at runtime.
+        def __getattr__(self, name: str) -> Any: ...
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, self._keys[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({args})"
+
+
+@functools.lru_cache(512)
+def _make_slots_row(enc: str, *names: bytes) -> type[SlotsRow]:
+    keys = [n.decode(enc) for n in names]
+    fields: list[str] = []
+    for key in keys:
+        field = _as_python_identifier(key)
+        # Don't hide the keywords and the mapping methods; with duplicate
+        # names, the mapping returns the last value, as in dict_row().
+        if keyword.iskeyword(field) or hasattr(SlotsRow, field):
+            field += "_"
+        while field in fields:
+            field += "_"
+        fields.append(field)
+
+    # Assign all the slots at once: the class itself is the RowMaker.
+    if fields:
+        body = f"{', '.join('self.' + f for f in fields)}, = values"
+    else:
+        body = "pass"
+    ns: dict[str, Any] = {}
+    exec(f"def __init__(self, values):\n    {body}\n", ns)
+
+    return type(
+        "Row",
+        (SlotsRow,),
+        {
+            "__slots__": tuple(fields),
+            "__init__": ns["__init__"],
+            "_fields": tuple(fields),
+            "_keys": dict(zip(keys, fields)),
+        },
+    )
+
+
 def class_row(cls: type[T]) -> BaseRowFactory[T]:
     r"""Generate a row factory to represent rows as instances of the class `!cls`.
 
@@ -230,6 +335,101 @@ def scalar_row(cursor: BaseCursor[Any, Any]) -> RowMaker[Any]:
     return scalar_row_
 
 
+def lazy_row(cursor: BaseCursor[Any, Any]) -> RowMaker[LazyRow]:
+    """Row factory to represent rows as `LazyRow`, converting values on access.
+
+    The values of a row are converted to Python only when they are accessed,
+    which saves the conversion of the columns that are never read.
+    """
+    res = cursor.pgresult
+    if not res:
+        return no_result
+
+    nfields = _get_nfields(res)
+    if nfields is None:
+        return no_result
+
+    return make_lazy_row
+
+
+_UNSET: Any = object()
+
+
+class LazyRow(Sequence[Any]):
+    """
+    A sequence of the values of a record, converted to Python on first access.
+
+    Every value is converted by the loader of its column the first time it is
+    accessed, and the result is memoized. The row keeps a reference to the
+    query result, which stays in memory as long as any of its rows is alive.
+
+    The row compares equal to a tuple of the same values.
+    """
+
+    __slots__ = ("_pgresult", "_row", "_loaders", "_values")
+
+    def __init__(
+        self, pgresult: PGresult | None, row: int, loaders: Sequence[LoadFunc]
+    ):
+        self._pgresult = pgresult
+        self._row = row
+        self._loaders = loaders
+        self._values = [_UNSET] * len(loaders)
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> Self:
+        rv = cls(None, 0, ())
+        rv._values = list(values)
+        return rv
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self._values))))
+
+        if (value := self._values[index]) is _UNSET:
+            if index < 0:
+                index += len(self._values)
+            value = self._values[index] = self._load(index)
+        return value
+
+    def _load(self, col: int) -> Any:
+        assert self._pgresult
+        data: Buffer | None = self._pgresult.get_value(self._row, col)
+        return self._loaders[col](data) if data is not None else None
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (LazyRow, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{tuple(self)!r}"
+
+
+class _LazyRowMaker:
+    def __call__(self, values: Sequence[Any]) -> LazyRow:
+        return LazyRow._from_values(values)
+
+    def from_result(
+        self, pgresult: PGresult, row: int, loaders: Sequence[LoadFunc]
+    ) -> LazyRow:
+        return LazyRow(pgresult, row, loaders)
+
+
+make_lazy_row: ResultRowMaker[LazyRow] = _LazyRowMaker()
+"""
+The `ResultRowMaker` returned by `lazy_row()`.
+
+Calling it creates a `LazyRow` from values already converted to Python.
+"""
+
+
 def no_result(values: Sequence[Any]) -> NoReturn:
     """A `RowMaker` that always fail.
 
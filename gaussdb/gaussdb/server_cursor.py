@@ -282,6 +282,7 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         """
         if kwargs:
             raise TypeError(f"keyword not supported: {list(kwargs)[0]}")
+        self._conn._exit_auto_pipeline()
         if self._pgconn.pipeline_status:
             raise e.NotSupportedError(
                 "server-side cursors not supported in pipeline mode"
@@ -301,6 +302,8 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         params_seq: Iterable[Params],
         *,
         returning: bool = True,
+        batch_size: int | None = None,
+        mode: str | None = None,
     ) -> None:
         """Method not implemented for server-side cursors."""
         raise e.NotSupportedError("executemany not supported on server-side cursors")
@@ -328,6 +331,10 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         self._pos += len(recs)
         return recs
 
+    def fetch_columns(self, *, numpy: bool = False) -> dict[str, Any]:
+        """Method not implemented for server-side cursors."""
+        raise e.NotSupportedError("fetch_columns not supported on server-side cursors")
+
     def __iter__(self) -> Iterator[Row]:
         while True:
             with self._conn.lock:
@@ -415,6 +422,7 @@ class AsyncServerCursor(
     ) -> Self:
         if kwargs:
             raise TypeError(f"keyword not supported: {list(kwargs)[0]}")
+        await self._conn._exit_auto_pipeline()
         if self._pgconn.pipeline_status:
             raise e.NotSupportedError(
                 "server-side cursors not supported in pipeline mode"
@@ -434,6 +442,8 @@ class AsyncServerCursor(
         params_seq: Iterable[Params],
         *,
         returning: bool = True,
+        batch_size: int | None = None,
+        mode: str | None = None,
     ) -> None:
         raise e.NotSupportedError("executemany not supported on server-side cursors")
 
@@ -460,6 +470,9 @@ class AsyncServerCursor(
         self._pos += len(recs)
         return recs
 
+    async def fetch_columns(self, *, numpy: bool = False) -> dict[str, Any]:
+        raise e.NotSupportedError("fetch_columns not supported on server-side cursors")
+
     async def __aiter__(self) -> AsyncIterator[Row]:
         while True:
             async with self._conn.lock:
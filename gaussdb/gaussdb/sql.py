@@ -9,16 +9,20 @@ from __future__ import annotations
 import codecs
 import string
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from collections.abc import Iterable, Iterator, Sequence
 
 from .pq import Escaping
-from .abc import AdaptContext
+from .abc import AdaptContext, Dumper
 from ._enums import PyFormat
 from ._compat import LiteralString
 from ._encodings import conn_encoding
 from ._transformer import Transformer
 
+if TYPE_CHECKING:
+    from .pq import Format
+    from ._queries import QueryPart
+
 
 def quote(obj: Any, context: AdaptContext | None = None) -> str:
     """
@@ -480,6 +484,51 @@ class Placeholder(Composable):
         return self.as_string(context).encode(enc)
 
 
+class Compiled(Composable):
+    """
+    A query parsed in advance, to be executed many times.
+
+    `!Compiled` objects are created by `~gaussdb.Connection.compile()` and can
+    be passed to `~gaussdb.Cursor.execute()` and
+    `~gaussdb.Cursor.executemany()` in place of the query string. The query
+    is converted to the GaussDB format only once and, if the types of the
+    parameters were specified, the dumpers to adapt them are chosen only once
+    too.
+
+    Example::
+
+        >>> query = conn.compile(
+        ...     "INSERT INTO t VALUES (%s, %s)", types=["int4", "text"])
+        >>> for i in range(1_000_000):
+        ...     conn.execute(query, (i, str(i)))
+    """
+
+    _obj: bytes
+
+    def __init__(
+        self,
+        query: bytes,
+        encoding: str,
+        converted: tuple[bytes, list[PyFormat], list[str] | None, list[QueryPart]],
+        dumpers: Sequence[Dumper] | None = None,
+    ):
+        super().__init__(query)
+        self._encoding = encoding
+        self._converted = converted
+        self._dumpers = dumpers
+        self._types: tuple[int, ...] = ()
+        self._formats: list[Format] | None = None
+        if dumpers is not None:
+            self._types = tuple(d.oid for d in dumpers)
+            self._formats = [d.format for d in dumpers]
+
+    def as_bytes(self, context: AdaptContext | None = None) -> bytes:
+        enc = conn_encoding(context.connection if context else None)
+        if enc == self._encoding:
+            return self._obj
+        return self._obj.decode(self._encoding).encode(enc)
+
+
 # Literals
 NULL = SQL("NULL")
 DEFAULT = SQL("DEFAULT")
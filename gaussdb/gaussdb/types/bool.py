@@ -37,6 +37,7 @@ class BoolLoader(Loader):
 
 class BoolBinaryLoader(Loader):
     format = Format.BINARY
+    _struct_code = "?"
 
     def load(self, data: Buffer) -> bool:
         return data != b"\x00"
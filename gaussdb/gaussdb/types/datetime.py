@@ -7,6 +7,7 @@ Adapters for date/time types.
 from __future__ import annotations
 
 import re
+import sys
 import struct
 from typing import TYPE_CHECKING, Any, Callable, cast
 from datetime import date, datetime, time, timedelta, timezone
@@ -17,7 +18,7 @@ from .._tz import get_tzinfo
 from ..abc import AdaptContext, DumperKey
 from ..adapt import Buffer, Dumper, Loader, PyFormat
 from ..errors import DataError, InterfaceError
-from .._struct import pack_int4, pack_int8, unpack_int4, unpack_int8
+from .._struct import pack_int4, pack_int8, unpack_int2, unpack_int4, unpack_int8
 
 if TYPE_CHECKING:
     from .._connection_base import BaseConnection
@@ -38,6 +39,10 @@ _pg_datetime_epoch = datetime(2000, 1, 1)
 _pg_datetimetz_epoch = datetime(2000, 1, 1, tzinfo=utc)
 _py_date_min_days = date.min.toordinal()
 
+# Since Python 3.11 fromisoformat() parses all the timestamps returned by the
+# server with ISO DateStyle (e.g. fractions of any length, offsets as +02).
+_fromisoformat_pg = sys.version_info >= (3, 11)
+
 
 class DateDumper(Dumper):
     oid = _oids.DATE_OID
@@ -237,7 +242,8 @@ class DateLoader(Loader):
     def __init__(self, oid: int, context: AdaptContext | None = None):
         super().__init__(oid, context)
         ds = _get_datestyle(self.connection)
-        if ds.startswith(b"I"):  # ISO
+        self._iso = ds.startswith(b"I")
+        if self._iso:  # ISO
             self._order = self._ORDER_YMD
         elif ds.startswith(b"G"):  # German
             self._order = self._ORDER_DMY
@@ -247,6 +253,13 @@ class DateLoader(Loader):
             raise InterfaceError(f"unexpected DateStyle: {ds.decode('ascii')}")
 
     def load(self, data: Buffer) -> date:
+        if self._iso:
+            # Fast path for the common case; leave the errors to the slow one.
+            try:
+                return date.fromisoformat(str(data, "ascii"))
+            except ValueError:
+                pass
+
         if self._order == self._ORDER_YMD:
             ye = data[:4]
             mo = data[5:7]
@@ -417,6 +430,7 @@ class TimestampLoader(Loader):
         super().__init__(oid, context)
 
         ds = _get_datestyle(self.connection)
+        self._iso = _fromisoformat_pg and ds.startswith(b"I")
         if ds.startswith(b"I"):  # ISO
             self._order = self._ORDER_YMD
         elif ds.startswith(b"G"):  # German
@@ -430,6 +444,13 @@ class TimestampLoader(Loader):
             raise InterfaceError(f"unexpected DateStyle: {ds.decode('ascii')}")
 
     def load(self, data: Buffer) -> datetime:
+        if self._iso:
+            # Fast path for the common case; leave the errors to the slow one.
+            try:
+                return datetime.fromisoformat(str(data, "ascii"))
+            except ValueError:
+                pass
+
         m = self._re_format.match(data)
         if not m:
             raise _get_timestamp_load_error(self.connection, data) from None
@@ -510,6 +531,16 @@ class TimestamptzLoader(Loader):
 
     @staticmethod
     def _load_iso(self: TimestamptzLoader, data: Buffer) -> datetime:
+        if _fromisoformat_pg:
+            # Fast path for the common case; leave the errors and the
+            # overflows to the slow one.
+            try:
+                rv = datetime.fromisoformat(str(data, "ascii"))
+                if rv.tzinfo:
+                    return rv.astimezone(self._timezone)
+            except (ValueError, OverflowError):
+                pass
+
         m = self._re_format.match(data)
         if not m:
             raise _get_timestamp_load_error(self.connection, data) from None
@@ -678,6 +709,18 @@ class IntervalBinaryLoader(Loader):
             raise DataError(f"can't parse interval: {e}") from None
 
 
+class YearLoader(Loader):
+    def load(self, data: Buffer) -> int:
+        return int(data)
+
+
+class YearBinaryLoader(Loader):
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> int:
+        return unpack_int2(data)[0]
+
+
 def _get_datestyle(conn: BaseConnection[Any] | None) -> bytes:
     if conn:
         ds = conn.pgconn.parameter_status(b"DateStyle")
@@ -757,6 +800,12 @@ def register_default_adapters(context: AdaptContext) -> None:
     adapters.register_loader("timetz", TimetzBinaryLoader)
     adapters.register_loader("timestamp", TimestampLoader)
     adapters.register_loader("timestamp", TimestampBinaryLoader)
+    # smalldatetime has the same representation of timestamp, rounded to the
+    # minute.
+    adapters.register_loader(_oids.SMALLDATETIME_OID, TimestampLoader)
+    adapters.register_loader(_oids.SMALLDATETIME_OID, TimestampBinaryLoader)
+    adapters.register_loader(_oids.YEAR_OID, YearLoader)
+    adapters.register_loader(_oids.YEAR_OID, YearBinaryLoader)
     adapters.register_loader("timestamptz", TimestamptzLoader)
     adapters.register_loader("timestamptz", TimestamptzBinaryLoader)
     adapters.register_loader("interval", IntervalLoader)
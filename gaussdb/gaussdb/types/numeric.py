@@ -11,7 +11,7 @@ import struct
 from abc import ABC, abstractmethod
 from math import log
 from typing import TYPE_CHECKING, Any, Callable, DefaultDict, cast
-from decimal import Context, Decimal, DefaultContext
+from decimal import Decimal
 
 from .. import _oids
 from .. import errors as e
@@ -19,17 +19,24 @@ from ..pq import Format
 from ..abc import AdaptContext
 from ..adapt import Buffer, Dumper, Loader, PyFormat
 from .._struct import pack_float4, pack_float8, pack_int2, pack_int4, pack_int8
-from .._struct import pack_uint2, pack_uint4, unpack_float4, unpack_float8, unpack_int2
-from .._struct import unpack_int4, unpack_int8, unpack_uint4
+from .._struct import pack_uint1, pack_uint2, pack_uint4, pack_uint8, unpack_float4
+from .._struct import unpack_float8, unpack_int2, unpack_int4, unpack_int8
+from .._struct import unpack_uint1, unpack_uint2, unpack_uint4, unpack_uint8
 
 # Exposed here
 from .._wrappers import Float4 as Float4
 from .._wrappers import Float8 as Float8
+from .._wrappers import Int1 as Int1
 from .._wrappers import Int2 as Int2
 from .._wrappers import Int4 as Int4
 from .._wrappers import Int8 as Int8
+from .._wrappers import Int16 as Int16
 from .._wrappers import IntNumeric as IntNumeric
 from .._wrappers import Oid as Oid
+from .._wrappers import UInt1 as UInt1
+from .._wrappers import UInt2 as UInt2
+from .._wrappers import UInt4 as UInt4
+from .._wrappers import UInt8 as UInt8
 
 if TYPE_CHECKING:
     import numpy
@@ -137,6 +144,33 @@ class OidDumper(_IntOrSubclassDumper):
     oid = _oids.OID_OID
 
 
+# GaussDB-specific integer types
+
+
+class Int1Dumper(_IntOrSubclassDumper):
+    oid = _oids.INT1_OID
+
+
+class Int16Dumper(_IntOrSubclassDumper):
+    oid = _oids.INT16_OID
+
+
+class UInt1Dumper(_IntOrSubclassDumper):
+    oid = _oids.UINT1_OID
+
+
+class UInt2Dumper(_IntOrSubclassDumper):
+    oid = _oids.UINT2_OID
+
+
+class UInt4Dumper(_IntOrSubclassDumper):
+    oid = _oids.UINT4_OID
+
+
+class UInt8Dumper(_IntOrSubclassDumper):
+    oid = _oids.UINT8_OID
+
+
 class IntDumper(Dumper):
     def dump(self, obj: Any) -> Buffer | None:
         raise TypeError(
@@ -205,6 +239,49 @@ class OidBinaryDumper(OidDumper):
         return pack_uint4(obj)
 
 
+class Int1BinaryDumper(Int1Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: int) -> Buffer | None:
+        # int1 is unsigned in GaussDB (0 to 255).
+        return pack_uint1(obj)
+
+
+class Int16BinaryDumper(Int16Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: int) -> Buffer | None:
+        return int(obj).to_bytes(16, "big", signed=True)
+
+
+class UInt1BinaryDumper(UInt1Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: int) -> Buffer | None:
+        return pack_uint1(obj)
+
+
+class UInt2BinaryDumper(UInt2Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: int) -> Buffer | None:
+        return pack_uint2(obj)
+
+
+class UInt4BinaryDumper(UInt4Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: int) -> Buffer | None:
+        return pack_uint4(obj)
+
+
+class UInt8BinaryDumper(UInt8Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: int) -> Buffer | None:
+        return pack_uint8(obj)
+
+
 class IntBinaryDumper(IntDumper):
     format = Format.BINARY
 
@@ -222,6 +299,7 @@ class IntLoader(Loader):
 
 class Int2BinaryLoader(Loader):
     format = Format.BINARY
+    _struct_code = "h"
 
     def load(self, data: Buffer) -> int:
         return unpack_int2(data)[0]
@@ -229,6 +307,7 @@ class Int2BinaryLoader(Loader):
 
 class Int4BinaryLoader(Loader):
     format = Format.BINARY
+    _struct_code = "i"
 
     def load(self, data: Buffer) -> int:
         return unpack_int4(data)[0]
@@ -236,6 +315,7 @@ class Int4BinaryLoader(Loader):
 
 class Int8BinaryLoader(Loader):
     format = Format.BINARY
+    _struct_code = "q"
 
     def load(self, data: Buffer) -> int:
         return unpack_int8(data)[0]
@@ -243,11 +323,60 @@ class Int8BinaryLoader(Loader):
 
 class OidBinaryLoader(Loader):
     format = Format.BINARY
+    _struct_code = "I"
 
     def load(self, data: Buffer) -> int:
         return unpack_uint4(data)[0]
 
 
+class Int1BinaryLoader(Loader):
+    format = Format.BINARY
+    _struct_code = "B"
+
+    def load(self, data: Buffer) -> int:
+        # int1 is unsigned in GaussDB (0 to 255).
+        return unpack_uint1(data)[0]
+
+
+class Int16BinaryLoader(Loader):
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> int:
+        return int.from_bytes(data, "big", signed=True)
+
+
+class UInt1BinaryLoader(Loader):
+    format = Format.BINARY
+    _struct_code = "B"
+
+    def load(self, data: Buffer) -> int:
+        return unpack_uint1(data)[0]
+
+
+class UInt2BinaryLoader(Loader):
+    format = Format.BINARY
+    _struct_code = "H"
+
+    def load(self, data: Buffer) -> int:
+        return unpack_uint2(data)[0]
+
+
+class UInt4BinaryLoader(Loader):
+    format = Format.BINARY
+    _struct_code = "I"
+
+    def load(self, data: Buffer) -> int:
+        return unpack_uint4(data)[0]
+
+
+class UInt8BinaryLoader(Loader):
+    format = Format.BINARY
+    _struct_code = "Q"
+
+    def load(self, data: Buffer) -> int:
+        return unpack_uint8(data)[0]
+
+
 class FloatLoader(Loader):
     def load(self, data: Buffer) -> float:
         # it supports bytes directly
@@ -256,6 +385,7 @@ class FloatLoader(Loader):
 
 class Float4BinaryLoader(Loader):
     format = Format.BINARY
+    _struct_code = "f"
 
     def load(self, data: Buffer) -> float:
         return unpack_float4(data)[0]
@@ -263,6 +393,7 @@ class Float4BinaryLoader(Loader):
 
 class Float8BinaryLoader(Loader):
     format = Format.BINARY
+    _struct_code = "d"
 
     def load(self, data: Buffer) -> float:
         return unpack_float8(data)[0]
@@ -289,27 +420,25 @@ _decimal_special = {
 }
 
 
-class _ContextMap(DefaultDict[int, Context]):
-    """
-    Cache for decimal contexts to use when the precision requires it.
+_float_special = {
+    NUMERIC_NAN: float("nan"),
+    NUMERIC_PINF: float("inf"),
+    NUMERIC_NINF: float("-inf"),
+}
 
-    Note: if the default context is used (prec=28) you can get an invalid
-    operation or a rounding to 0:
 
-    - Decimal(1000).shift(24) = Decimal('1000000000000000000000000000')
-    - Decimal(1000).shift(25) = Decimal('0')
-    - Decimal(1000).shift(30) raises InvalidOperation
+class _UnpackDigitsMap(DefaultDict[int, Callable[[Buffer, int], "tuple[int, ...]"]]):
+    """
+    Cache for the functions to unpack a number of numeric digits at once.
     """
 
-    def __missing__(self, key: int) -> Context:
-        val = Context(prec=key)
+    def __missing__(self, key: int) -> Callable[[Buffer, int], tuple[int, ...]]:
+        val = struct.Struct(f"!{key}H").unpack_from
         self[key] = val
         return val
 
 
-_contexts = _ContextMap()
-for i in range(DefaultContext.prec):
-    _contexts[i] = DefaultContext
+_unpack_digits = _UnpackDigitsMap()
 
 _unpack_numeric_head = cast(
     Callable[[Buffer], "tuple[int, int, int, int]"],
@@ -321,23 +450,34 @@ _pack_numeric_head = cast(
 )
 
 
+def _load_numeric_coeff(data: Buffer, ndigits: int, weight: int, dscale: int) -> int:
+    """
+    Return the absolute value of a binary numeric multiplied by 10 ** dscale.
+    """
+    val = 0
+    for digit in _unpack_digits[ndigits](data, 8):
+        val = val * 10_000 + digit
+
+    # Align the last digit to the display scale: the last base 10000 digit
+    # may be padded with zeros, or trailing zero digits may be omitted.
+    shift = dscale - (ndigits - weight - 1) * DEC_DIGITS
+    if shift > 0:
+        val *= 10**shift
+    elif shift < 0:
+        val //= 10**-shift
+    return val
+
+
 class NumericBinaryLoader(Loader):
     format = Format.BINARY
 
     def load(self, data: Buffer) -> Decimal:
         ndigits, weight, sign, dscale = _unpack_numeric_head(data)
         if sign == NUMERIC_POS or sign == NUMERIC_NEG:
-            val = 0
-            for i in range(8, len(data), 2):
-                val = val * 10_000 + data[i] * 0x100 + data[i + 1]
-
-            shift = dscale - (ndigits - weight - 1) * DEC_DIGITS
-            ctx = _contexts[(weight + 2) * DEC_DIGITS + dscale]
-            return (
-                Decimal(val if sign == NUMERIC_POS else -val)
-                .scaleb(-dscale, ctx)
-                .shift(shift, ctx)
-            )
+            val = _load_numeric_coeff(data, ndigits, weight, dscale)
+            # Parsing a string is faster than any Decimal arithmetic, and
+            # it preserves the scale without the need of a context.
+            return Decimal(f"-{val}E-{dscale}" if sign else f"{val}E-{dscale}")
         else:
             try:
                 return _decimal_special[sign]
@@ -345,6 +485,67 @@ class NumericBinaryLoader(Loader):
                 raise e.DataError(f"bad value for numeric sign: 0x{sign:X}") from None
 
 
+class NumericIntLoader(Loader):
+    """
+    Load numeric values without fractional digits as `!int`.
+
+    Meant for columns with scale 0, such as :sql:`numeric(18, 0)`: the other
+    values are loaded as `!Decimal`.
+    """
+
+    def load(self, data: Buffer) -> int | Decimal:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        try:
+            return int(data)
+        except ValueError:
+            return Decimal(data.decode())
+
+
+class NumericIntBinaryLoader(NumericBinaryLoader):
+    """
+    Load numeric values without fractional digits as `!int`.
+
+    Meant for columns with scale 0, such as :sql:`numeric(18, 0)`: the other
+    values are loaded as `!Decimal`.
+    """
+
+    def load(self, data: Buffer) -> int | Decimal:  # type: ignore[override]
+        ndigits, weight, sign, dscale = _unpack_numeric_head(data)
+        if dscale or not (sign == NUMERIC_POS or sign == NUMERIC_NEG):
+            return super().load(data)
+
+        val = _load_numeric_coeff(data, ndigits, weight, 0)
+        return -val if sign else val
+
+
+class NumericFloatBinaryLoader(Loader):
+    """
+    Load numeric values as `!float`, with a possible loss of precision.
+
+    The text equivalent is `FloatLoader`.
+    """
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> float:
+        ndigits, weight, sign, dscale = _unpack_numeric_head(data)
+        if sign == NUMERIC_POS or sign == NUMERIC_NEG:
+            val = _load_numeric_coeff(data, ndigits, weight, dscale)
+            rv: float
+            try:
+                # The int division is correctly rounded
+                rv = val / 10**dscale
+            except OverflowError:
+                rv = float("inf")
+            return -rv if sign else rv
+        else:
+            try:
+                return _float_special[sign]
+            except KeyError:
+                raise e.DataError(f"bad value for numeric sign: 0x{sign:X}") from None
+
+
 NUMERIC_NAN_BIN = _pack_numeric_head(0, 0, NUMERIC_NAN, 0)
 NUMERIC_PINF_BIN = _pack_numeric_head(0, 0, NUMERIC_PINF, 0)
 NUMERIC_NINF_BIN = _pack_numeric_head(0, 0, NUMERIC_NINF, 0)
@@ -513,6 +714,12 @@ def register_default_adapters(context: AdaptContext) -> None:
     adapters.register_dumper(Int8, Int8Dumper)
     adapters.register_dumper(IntNumeric, IntNumericDumper)
     adapters.register_dumper(Oid, OidDumper)
+    adapters.register_dumper(Int1, Int1Dumper)
+    adapters.register_dumper(Int16, Int16Dumper)
+    adapters.register_dumper(UInt1, UInt1Dumper)
+    adapters.register_dumper(UInt2, UInt2Dumper)
+    adapters.register_dumper(UInt4, UInt4Dumper)
+    adapters.register_dumper(UInt8, UInt8Dumper)
 
     # The binary dumper is currently some 30% slower, so default to text
     # (see tests/scripts/testdec.py for a rough benchmark)
@@ -530,6 +737,12 @@ def register_default_adapters(context: AdaptContext) -> None:
     adapters.register_dumper(Int4, Int4BinaryDumper)
     adapters.register_dumper(Int8, Int8BinaryDumper)
     adapters.register_dumper(Oid, OidBinaryDumper)
+    adapters.register_dumper(Int1, Int1BinaryDumper)
+    adapters.register_dumper(Int16, Int16BinaryDumper)
+    adapters.register_dumper(UInt1, UInt1BinaryDumper)
+    adapters.register_dumper(UInt2, UInt2BinaryDumper)
+    adapters.register_dumper(UInt4, UInt4BinaryDumper)
+    adapters.register_dumper(UInt8, UInt8BinaryDumper)
     adapters.register_dumper(Float4, Float4BinaryDumper)
     adapters.register_dumper(Float8, FloatBinaryDumper)
     adapters.register_loader("int2", IntLoader)
@@ -540,6 +753,18 @@ def register_default_adapters(context: AdaptContext) -> None:
     adapters.register_loader("int4", Int4BinaryLoader)
     adapters.register_loader("int8", Int8BinaryLoader)
     adapters.register_loader("oid", OidBinaryLoader)
+    adapters.register_loader(_oids.INT1_OID, IntLoader)
+    adapters.register_loader(_oids.INT16_OID, IntLoader)
+    adapters.register_loader(_oids.UINT1_OID, IntLoader)
+    adapters.register_loader(_oids.UINT2_OID, IntLoader)
+    adapters.register_loader(_oids.UINT4_OID, IntLoader)
+    adapters.register_loader(_oids.UINT8_OID, IntLoader)
+    adapters.register_loader(_oids.INT1_OID, Int1BinaryLoader)
+    adapters.register_loader(_oids.INT16_OID, Int16BinaryLoader)
+    adapters.register_loader(_oids.UINT1_OID, UInt1BinaryLoader)
+    adapters.register_loader(_oids.UINT2_OID, UInt2BinaryLoader)
+    adapters.register_loader(_oids.UINT4_OID, UInt4BinaryLoader)
+    adapters.register_loader(_oids.UINT8_OID, UInt8BinaryLoader)
     adapters.register_loader("float4", FloatLoader)
     adapters.register_loader("float8", FloatLoader)
     adapters.register_loader("float4", Float4BinaryLoader)
@@ -9,10 +9,13 @@ from typing import Any
 from .. import _oids
 from ..pq import Format
 from ..abc import AdaptContext, Buffer
+from ..adapt import Loader
 from .bool import BoolBinaryDumper, BoolDumper
 from .numeric import Float4BinaryDumper, Float4Dumper, FloatBinaryDumper, FloatDumper
-from .numeric import _IntDumper, dump_int_to_numeric_binary
-from .._struct import pack_int2, pack_int4, pack_int8
+from .numeric import _IntDumper
+from .vector import _HEADER_SIZE, _check_vector_binary, _split_text
+from .._struct import pack_int2, pack_int4, pack_int8, pack_uint1, pack_uint2
+from .._struct import pack_uint4, pack_uint8
 
 
 class NPInt16Dumper(_IntDumper):
@@ -27,8 +30,20 @@ class NPInt64Dumper(_IntDumper):
     oid = _oids.INT8_OID
 
 
-class NPNumericDumper(_IntDumper):
-    oid = _oids.NUMERIC_OID
+class NPUInt8Dumper(_IntDumper):
+    oid = _oids.UINT1_OID
+
+
+class NPUInt16Dumper(_IntDumper):
+    oid = _oids.UINT2_OID
+
+
+class NPUInt32Dumper(_IntDumper):
+    oid = _oids.UINT4_OID
+
+
+class NPUInt64Dumper(_IntDumper):
+    oid = _oids.UINT8_OID
 
 
 # Binary Dumpers
@@ -55,11 +70,103 @@ class NPInt64BinaryDumper(NPInt64Dumper):
         return pack_int8(int(obj))
 
 
-class NPNumericBinaryDumper(NPNumericDumper):
+class NPUInt8BinaryDumper(NPUInt8Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: Any) -> bytes:
+        return pack_uint1(int(obj))
+
+
+class NPUInt16BinaryDumper(NPUInt16Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: Any) -> bytes:
+        return pack_uint2(int(obj))
+
+
+class NPUInt32BinaryDumper(NPUInt32Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: Any) -> bytes:
+        return pack_uint4(int(obj))
+
+
+class NPUInt64BinaryDumper(NPUInt64Dumper):
     format = Format.BINARY
 
-    def dump(self, obj: Any) -> Buffer:
-        return dump_int_to_numeric_binary(int(obj))
+    def dump(self, obj: Any) -> bytes:
+        return pack_uint8(int(obj))
+
+
+# Loaders
+#
+# They are not registered by default, because they require NumPy. They can
+# be registered on a context, e.g. ``conn.adapters.register_loader(
+# "floatvector", NPFloatVectorBinaryLoader)``.
+
+
+class _NPVectorLoader(Loader):
+    dtype = ""
+    elem_oid = 0
+
+    def __init__(self, oid: int, context: AdaptContext | None = None):
+        super().__init__(oid, context)
+        import numpy
+
+        self._np = numpy
+
+
+class NPFloatVectorLoader(_NPVectorLoader):
+    """Load a :sql:`floatvector` as a NumPy float32 array."""
+
+    dtype = "float32"
+
+    def load(self, data: Buffer) -> Any:
+        return self._np.array(_split_text(data), dtype=self.dtype)
+
+
+class NPBoolVectorLoader(_NPVectorLoader):
+    """Load a :sql:`boolvector` as a NumPy bool array."""
+
+    dtype = "bool"
+
+    def load(self, data: Buffer) -> Any:
+        return self._np.array([x == b"t" for x in _split_text(data)], dtype="bool")
+
+
+class _NPVectorBinaryLoader(_NPVectorLoader):
+    format = Format.BINARY
+    wire_dtype = ""
+
+    def load(self, data: Buffer) -> Any:
+        if not (nelems := _check_vector_binary(data, self.elem_oid)):
+            return self._np.empty(0, dtype=self.dtype)
+
+        # Every element is preceded by its length: view the values in the
+        # data without copying them, then convert them to the native order.
+        items = self._np.frombuffer(
+            data,
+            dtype=[("size", ">i4"), ("value", self.wire_dtype)],
+            count=nelems,
+            offset=_HEADER_SIZE,
+        )
+        return items["value"].astype(self.dtype)
+
+
+class NPFloatVectorBinaryLoader(_NPVectorBinaryLoader):
+    """Load a binary :sql:`floatvector` as a NumPy float32 array."""
+
+    dtype = "float32"
+    wire_dtype = ">f4"
+    elem_oid = _oids.FLOAT4_OID
+
+
+class NPBoolVectorBinaryLoader(_NPVectorBinaryLoader):
+    """Load a binary :sql:`boolvector` as a NumPy bool array."""
+
+    dtype = "bool"
+    wire_dtype = "?"
+    elem_oid = _oids.BOOL_OID
 
 
 def register_default_adapters(context: AdaptContext) -> None:
@@ -72,11 +179,11 @@ def register_default_adapters(context: AdaptContext) -> None:
     adapters.register_dumper("numpy.longlong", NPInt64Dumper)
     adapters.register_dumper("numpy.bool", BoolDumper)
     adapters.register_dumper("numpy.bool_", BoolDumper)
-    adapters.register_dumper("numpy.uint8", NPInt16Dumper)
-    adapters.register_dumper("numpy.uint16", NPInt32Dumper)
-    adapters.register_dumper("numpy.uint32", NPInt64Dumper)
-    adapters.register_dumper("numpy.uint64", NPNumericDumper)
-    adapters.register_dumper("numpy.ulonglong", NPNumericDumper)
+    adapters.register_dumper("numpy.uint8", NPUInt8Dumper)
+    adapters.register_dumper("numpy.uint16", NPUInt16Dumper)
+    adapters.register_dumper("numpy.uint32", NPUInt32Dumper)
+    adapters.register_dumper("numpy.uint64", NPUInt64Dumper)
+    adapters.register_dumper("numpy.ulonglong", NPUInt64Dumper)
     adapters.register_dumper("numpy.float16", Float4Dumper)
     adapters.register_dumper("numpy.float32", Float4Dumper)
     adapters.register_dumper("numpy.float64", FloatDumper)
@@ -88,11 +195,11 @@ def register_default_adapters(context: AdaptContext) -> None:
     adapters.register_dumper("numpy.longlong", NPInt64BinaryDumper)
     adapters.register_dumper("numpy.bool", BoolBinaryDumper)
     adapters.register_dumper("numpy.bool_", BoolBinaryDumper)
-    adapters.register_dumper("numpy.uint8", NPInt16BinaryDumper)
-    adapters.register_dumper("numpy.uint16", NPInt32BinaryDumper)
-    adapters.register_dumper("numpy.uint32", NPInt64BinaryDumper)
-    adapters.register_dumper("numpy.uint64", NPNumericBinaryDumper)
-    adapters.register_dumper("numpy.ulonglong", NPNumericBinaryDumper)
+    adapters.register_dumper("numpy.uint8", NPUInt8BinaryDumper)
+    adapters.register_dumper("numpy.uint16", NPUInt16BinaryDumper)
+    adapters.register_dumper("numpy.uint32", NPUInt32BinaryDumper)
+    adapters.register_dumper("numpy.uint64", NPUInt64BinaryDumper)
+    adapters.register_dumper("numpy.ulonglong", NPUInt64BinaryDumper)
     adapters.register_dumper("numpy.float16", Float4BinaryDumper)
     adapters.register_dumper("numpy.float32", Float4BinaryDumper)
     adapters.register_dumper("numpy.float64", FloatBinaryDumper)
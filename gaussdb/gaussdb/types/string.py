@@ -6,7 +6,7 @@ Adapters for textual types.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .. import _oids
 from ..pq import Escaping, Format
@@ -192,6 +192,130 @@ class ByteaBinaryLoader(Loader):
         return data
 
 
+class RawLoader(Loader):
+    def load(self, data: Buffer) -> bytes:
+        return _unhex(data)
+
+
+class Blob:
+    """
+    The value of a :sql:`blob` column, converted only when accessed.
+
+    The object keeps a reference to the data received from the server, which
+    is already whole in memory: use `view` to access it without copying it or
+    `!bytes()` to obtain a copy. If the value was received in text format, its
+    hex digits are decoded on first access.
+    """
+
+    __slots__ = ("_data", "_hex")
+
+    def __init__(self, data: Buffer, *, hex: bool = False):
+        self._data = data
+        self._hex = hex
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__} {len(self)} bytes>"
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def __bytes__(self) -> bytes:
+        view = self.view
+        return self._data if isinstance(self._data, bytes) else view.tobytes()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Blob):
+            other = other.view
+        return bool(self.view == other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def view(self) -> memoryview:
+        """A `!memoryview` on the blob data."""
+        if self._hex:
+            # Data loaded in text format: decode it only once.
+            self._data = _unhex(self._data)
+            self._hex = False
+        return memoryview(self._data)
+
+
+class Clob:
+    """
+    The value of a :sql:`clob` column, decoded only when accessed.
+
+    The object keeps a reference to the data received from the server, which
+    is already whole in memory. `view` gives access to the data as encoded by
+    the server; the string is decoded on first use of `!str()` and then cached.
+    """
+
+    __slots__ = ("_data", "_encoding", "_str")
+
+    def __init__(self, data: Buffer, encoding: str = "utf-8"):
+        self._data = data
+        self._encoding = encoding
+        self._str: str | None = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__} {len(self._data)} bytes>"
+
+    def __str__(self) -> str:
+        if self._str is None:
+            self._str = self.view.tobytes().decode(self._encoding)
+        return self._str
+
+    def __len__(self) -> int:
+        return len(str(self))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (str, Clob)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def view(self) -> memoryview:
+        """A `!memoryview` on the clob data, encoded in the connection encoding."""
+        return memoryview(self._data)
+
+
+class BlobLoader(Loader):
+    def load(self, data: Buffer) -> Blob:
+        return Blob(data, hex=True)
+
+
+class BlobBinaryLoader(Loader):
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> Blob:
+        return Blob(data)
+
+
+class ClobLoader(Loader):
+    def __init__(self, oid: int, context: AdaptContext | None = None):
+        super().__init__(oid, context)
+        enc = conn_encoding(self.connection)
+        self._encoding = enc if enc != "ascii" else "utf-8"
+
+    def load(self, data: Buffer) -> Clob:
+        return Clob(data, self._encoding)
+
+
+class ClobBinaryLoader(ClobLoader):
+    format = Format.BINARY
+
+
+def _unhex(data: Buffer) -> bytes:
+    # raw and blob are output as hex digits: accept a bytea-style prefix too.
+    if data[:2] == b"\\x":
+        data = data[2:]
+    try:
+        return bytes.fromhex(bytes(data).decode("ascii"))
+    except ValueError as ex:
+        raise DataError(f"bad hex representation: {ex}") from None
+
+
 def register_default_adapters(context: AdaptContext) -> None:
     adapters = context.adapters
 
@@ -231,3 +355,10 @@ def register_default_adapters(context: AdaptContext) -> None:
     adapters.register_loader("bytea", ByteaLoader)
     adapters.register_loader(_oids.INVALID_OID, ByteaBinaryLoader)
     adapters.register_loader("bytea", ByteaBinaryLoader)
+
+    adapters.register_loader(_oids.RAW_OID, RawLoader)
+    adapters.register_loader(_oids.RAW_OID, ByteaBinaryLoader)
+    adapters.register_loader(_oids.BLOB_OID, BlobLoader)
+    adapters.register_loader(_oids.BLOB_OID, BlobBinaryLoader)
+    adapters.register_loader(_oids.CLOB_OID, ClobLoader)
+    adapters.register_loader(_oids.CLOB_OID, ClobBinaryLoader)
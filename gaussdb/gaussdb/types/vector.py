@@ -0,0 +1,162 @@
+"""
+Adapters for the GaussDB floatvector and boolvector types.
+"""
+
+# Copyright (C) 2025 The Psycopg Team
+
+from __future__ import annotations
+
+import struct
+from array import array
+from typing import Any
+from itertools import chain, repeat
+
+from .. import _oids
+from .. import errors as e
+from ..pq import Format
+from ..abc import AdaptContext, Buffer
+from ..adapt import Dumper, Loader
+
+# The binary representation is the one of a one-dimensional array:
+# ndim, has null, element oid, dimension length, lower bound, then every
+# element preceded by its length.
+_unpack_head = struct.Struct("!iii").unpack_from
+_unpack_dim = struct.Struct("!ii").unpack_from
+_pack_head = struct.Struct("!iiiii").pack
+_pack_empty = struct.Struct("!iii").pack
+
+_HEADER_SIZE = 20
+
+
+class _VectorWrapper:
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __repr__(self) -> str:
+        sobj = repr(self.obj)
+        if len(sobj) > 40:
+            sobj = f"{sobj[:35]} ... ({len(sobj)} chars)"
+        return f"{self.__class__.__name__}({sobj})"
+
+
+class FloatVector(_VectorWrapper):
+    """
+    Wrapper to dump a sequence of numbers (e.g. a list, an `!array`, a NumPy
+    array) as a :sql:`floatvector`.
+    """
+
+    __slots__ = ()
+
+
+class BoolVector(_VectorWrapper):
+    """
+    Wrapper to dump a sequence of booleans as a :sql:`boolvector`.
+    """
+
+    __slots__ = ()
+
+
+class FloatVectorDumper(Dumper):
+    oid = _oids.FLOATVECTOR_OID
+
+    def dump(self, obj: FloatVector) -> Buffer | None:
+        return b"{%s}" % b",".join(repr(float(x)).encode() for x in obj.obj)
+
+
+class FloatVectorBinaryDumper(FloatVectorDumper):
+    format = Format.BINARY
+
+    def dump(self, obj: FloatVector) -> Buffer | None:
+        return _dump_vector_binary(obj.obj, _oids.FLOAT4_OID, "f", ">f4")
+
+
+class BoolVectorDumper(Dumper):
+    oid = _oids.BOOLVECTOR_OID
+
+    def dump(self, obj: BoolVector) -> Buffer | None:
+        return b"{%s}" % b",".join((b"t" if x else b"f") for x in obj.obj)
+
+
+class BoolVectorBinaryDumper(BoolVectorDumper):
+    format = Format.BINARY
+
+    def dump(self, obj: BoolVector) -> Buffer | None:
+        return _dump_vector_binary(obj.obj, _oids.BOOL_OID, "?", "?")
+
+
+def _dump_vector_binary(obj: Any, elem_oid: int, fmt: str, dtype: str) -> bytes:
+    nelems = len(obj)
+    if not nelems:
+        return _pack_empty(0, 0, elem_oid)
+
+    head = _pack_head(1, 0, elem_oid, nelems, 1)
+    size = struct.calcsize(fmt)
+    if hasattr(obj, "dtype"):
+        # A NumPy array: fill the elements in one go.
+        import numpy
+
+        records = numpy.empty(nelems, dtype=[("size", ">i4"), ("value", dtype)])
+        records["size"] = size
+        records["value"] = obj
+        return head + records.tobytes()
+
+    items = chain.from_iterable(zip(repeat(size), obj))
+    return head + struct.pack("!" + ("i" + fmt) * nelems, *items)
+
+
+class FloatVectorLoader(Loader):
+    def load(self, data: Buffer) -> array[float]:
+        return array("f", map(float, _split_text(data)))
+
+
+class FloatVectorBinaryLoader(Loader):
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> array[float]:
+        if not (nelems := _check_vector_binary(data, _oids.FLOAT4_OID)):
+            return array("f")
+        return array("f", struct.unpack_from("!" + "4xf" * nelems, data, _HEADER_SIZE))
+
+
+class BoolVectorLoader(Loader):
+    def load(self, data: Buffer) -> list[bool]:
+        return [item == b"t" for item in _split_text(data)]
+
+
+class BoolVectorBinaryLoader(Loader):
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> list[bool]:
+        if not (nelems := _check_vector_binary(data, _oids.BOOL_OID)):
+            return []
+        return list(struct.unpack_from("!" + "4x?" * nelems, data, _HEADER_SIZE))
+
+
+def _split_text(data: Buffer) -> list[bytes]:
+    # Accept both the array-like {...} and the [...] representations.
+    data = bytes(data).strip()[1:-1].strip()
+    return [item.strip() for item in data.split(b",")] if data else []
+
+
+def _check_vector_binary(data: Buffer, elem_oid: int) -> int:
+    """Validate the header of a binary vector; return the number of elements."""
+    ndim, hasnull, oid = _unpack_head(data)
+    if not ndim:
+        return 0
+    if ndim != 1 or hasnull or oid != elem_oid:
+        raise e.DataError("unexpected binary vector format")
+    return int(_unpack_dim(data, 12)[0])
+
+
+def register_default_adapters(context: AdaptContext) -> None:
+    adapters = context.adapters
+    adapters.register_dumper(FloatVector, FloatVectorDumper)
+    adapters.register_dumper(FloatVector, FloatVectorBinaryDumper)
+    adapters.register_dumper(BoolVector, BoolVectorDumper)
+    adapters.register_dumper(BoolVector, BoolVectorBinaryDumper)
+    adapters.register_loader("floatvector", FloatVectorLoader)
+    adapters.register_loader("floatvector", FloatVectorBinaryLoader)
+    adapters.register_loader("boolvector", BoolVectorLoader)
+    adapters.register_loader("boolvector", BoolVectorBinaryLoader)
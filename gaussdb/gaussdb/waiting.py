@@ -15,8 +15,9 @@ import sys
 import select
 import logging
 import selectors
-from asyncio import Event, TimeoutError, get_event_loop, wait_for
+from asyncio import AbstractEventLoop, Future, get_running_loop
 from selectors import DefaultSelector
+from collections.abc import Generator, Iterable
 
 from . import errors as e
 from .abc import RV, PQGen, PQGenConn, WaitFunc
@@ -104,6 +105,263 @@ def wait_conn(gen: PQGenConn[RV], interval: float | None = None) -> RV:
         return rv
 
 
+def wait_many(
+    gens: Iterable[tuple[PQGen[RV], int]], interval: float | None = None
+) -> Generator[tuple[int, RV], None, None]:
+    """
+    Wait for several generators, each on its own file descriptor, at once.
+
+    :param gens: pairs (generator, file descriptor). Every generator must use
+        a different file descriptor.
+    :param interval: interval (in seconds) to check for other interrupt, e.g.
+        to allow Ctrl-C. If zero or None, wait indefinitely.
+    :return: an iterator of (position, value) pairs, where position is the
+        index of a generator in `!gens` and value is what it returned. The
+        pairs are returned as soon as each generator completes.
+
+    All the generators are consumed in the current thread using a single
+    selector. If a generator fails, the others are still consumed until
+    completion and the first error is raised at the end.
+    """
+    if not interval:
+        interval = None
+    error: BaseException | None = None
+    with DefaultSelector() as sel:
+        for i, (gen, fileno) in enumerate(gens):
+            try:
+                sel.register(fileno, next(gen), (i, gen))
+            except StopIteration as ex:
+                yield i, ex.value
+            except Exception as ex:
+                error = error or ex
+
+        while sel.get_map():
+            for key, ready in sel.select(timeout=interval):
+                i, gen = key.data
+                try:
+                    sel.modify(key.fd, gen.send(ready), key.data)
+                    continue
+                except StopIteration as ex:
+                    sel.unregister(key.fd)
+                    yield i, ex.value
+                except Exception as ex:
+                    sel.unregister(key.fd)
+                    error = error or ex
+
+    if error:
+        raise error
+
+
+class AsyncWaiter:
+    """
+    Object waiting for generators on a file descriptor in an asyncio loop.
+
+    The file descriptor is registered on the loop the first time it is needed
+    and it stays registered across the generator steps and the following
+    waits: the registration changes only if the direction to wait for
+    changes. A readiness notification received when nobody is waiting removes
+    the registration, to avoid busy looping on an idle socket.
+
+    The file descriptor number may be reused by another connection after the
+    socket is closed, so the registration is only changed after checking on
+    the loop selector that it is still ours. If the loop doesn't expose its
+    selector, the registration is removed at the end of every wait.
+
+    The object is used by `~gaussdb.AsyncConnection` to wait for all the
+    operations on its socket.
+    """
+
+    __slots__ = (
+        "_loop",
+        "_selector",
+        "_fileno",
+        "_reading",
+        "_writing",
+        "_fut",
+        "_ready",
+    )
+
+    def __init__(self) -> None:
+        self._loop: AbstractEventLoop | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._fileno = -1
+        self._reading = self._writing = False
+        self._fut: Future[None] | None = None
+        self._ready: int = READY_NONE
+
+    async def wait(
+        self, gen: PQGen[RV], fileno: int, interval: float | None = None
+    ) -> RV:
+        """
+        Consume `!gen` waiting on `!fileno`; return what `!gen` returns.
+
+        The parameters are the same of `wait_async()`.
+        """
+        try:
+            s = next(gen)
+            while True:
+                self._bind(fileno)
+                s = gen.send(await self._wait(s, interval))
+
+        except StopIteration as ex:
+            rv: RV = ex.value
+            return rv
+        except OSError as ex:
+            # Assume the connection was closed
+            self.close()
+            raise e.OperationalError(str(ex))
+        except BaseException:
+            self.close()
+            raise
+
+    async def wait_conn(self, gen: PQGenConn[RV], interval: float | None = None) -> RV:
+        """
+        Consume a connection generator; return what `!gen` returns.
+
+        The parameters are the same of `wait_conn_async()`.
+        """
+        try:
+            fileno, s = next(gen)
+            if not interval:
+                interval = None
+            while True:
+                self._bind(fileno)
+                fileno, s = gen.send(await self._wait(s, interval))
+
+        except StopIteration as ex:
+            rv: RV = ex.value
+            return rv
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """
+        Remove the file descriptor from the loop, if registered.
+
+        Must be called in the loop thread: use `close_threadsafe()` otherwise.
+        """
+        loop = self._loop
+        if loop and not loop.is_closed():
+            if self._reading and self._owns(READY_R):
+                loop.remove_reader(self._fileno)
+            if self._writing and self._owns(READY_W):
+                loop.remove_writer(self._fileno)
+        self._reading = self._writing = False
+        self._loop = self._selector = None
+        self._fut = None
+
+    def close_threadsafe(self) -> None:
+        """
+        Schedule `close()` in the loop thread; usable from any thread.
+        """
+        if loop := self._loop:
+            try:
+                loop.call_soon_threadsafe(self.close)
+            except RuntimeError:
+                pass  # the loop is closed: nothing to clean up
+
+    def interrupt(self) -> None:
+        """
+        Resume the generator being waited for as if the wait timed out.
+
+        The generator receives no ready state and can check if it has other
+        things to do before waiting again.
+        """
+        if (fut := self._fut) and not fut.done():
+            fut.set_result(None)
+
+    def _bind(self, fileno: int) -> None:
+        loop = get_running_loop()
+        if loop is not self._loop or fileno != self._fileno:
+            self.close()
+            self._loop = loop
+            self._selector = getattr(loop, "_selector", None)
+            self._fileno = fileno
+
+    def _owns(self, state: Ready) -> bool:
+        """
+        Return True if the registration for `!state` on the fd is this one's.
+
+        If the loop selector is not known, trust the registration flags.
+        """
+        if (selector := self._selector) is None:
+            return self._reading if state == READY_R else self._writing
+        try:
+            key = selector.get_key(self._fileno)
+        except (KeyError, ValueError):
+            return False
+        reader, writer = key.data
+        handle = reader if state == READY_R else writer
+        return bool(
+            handle
+            and not handle.cancelled()
+            and getattr(handle, "_callback", None) == self._wakeup
+        )
+
+    async def _wait(self, s: Wait, interval: float | None) -> int:
+        if not s & WAIT_RW:
+            raise e.InternalError(f"bad poll status: {s}")
+
+        loop = self._loop
+        assert loop
+        fileno = self._fileno
+        if s & WAIT_R:
+            if not (self._reading and self._owns(READY_R)):
+                loop.add_reader(fileno, self._wakeup, READY_R)
+                self._reading = True
+        elif self._reading:
+            if self._owns(READY_R):
+                loop.remove_reader(fileno)
+            self._reading = False
+        if s & WAIT_W:
+            if not (self._writing and self._owns(READY_W)):
+                loop.add_writer(fileno, self._wakeup, READY_W)
+                self._writing = True
+        elif self._writing:
+            if self._owns(READY_W):
+                loop.remove_writer(fileno)
+            self._writing = False
+
+        self._ready = READY_NONE
+        self._fut = fut = loop.create_future()
+        timer = None
+        if interval is not None:
+            timer = loop.call_later(interval, self._timeout, fut)
+        try:
+            await fut
+        finally:
+            self._fut = None
+            if timer:
+                timer.cancel()
+            if self._selector is None:
+                # Can't tell later if the registration is still ours.
+                self.close()
+
+        return self._ready
+
+    def _wakeup(self, state: Ready) -> None:
+        fut = self._fut
+        if fut is None:
+            # Nobody waiting: stop watching until needed again.
+            if self._loop and state == READY_R:
+                self._loop.remove_reader(self._fileno)
+                self._reading = False
+            elif self._loop:
+                self._loop.remove_writer(self._fileno)
+                self._writing = False
+            return
+
+        self._ready |= state
+        if not fut.done():
+            fut.set_result(None)
+
+    @staticmethod
+    def _timeout(fut: Future[None]) -> None:
+        if not fut.done():
+            fut.set_result(None)
+
+
 async def wait_async(gen: PQGen[RV], fileno: int, interval: float | None = None) -> RV:
     """
     Coroutine waiting for a generator to complete.
@@ -115,54 +373,14 @@ async def wait_async(gen: PQGen[RV], fileno: int, interval: float | None = None)
         to allow Ctrl-C. If None, wait indefinitely.
     :return: whatever `!gen` returns on completion.
 
-    Behave like in `wait()`, but exposing an `asyncio` interface.
+    Behave like in `wait()`, but exposing an `asyncio` interface. Use an
+    `AsyncWaiter` to keep the file descriptor registered across several calls.
     """
-    # Use an event to block and restart after the fd state changes.
-    # Not sure this is the best implementation but it's a start.
-    ev = Event()
-    loop = get_event_loop()
-    ready: int
-    s: Wait
-
-    def wakeup(state: Ready) -> None:
-        nonlocal ready
-        ready |= state
-        ev.set()
-
+    waiter = AsyncWaiter()
     try:
-        s = next(gen)
-        while True:
-            reader = s & WAIT_R
-            writer = s & WAIT_W
-            if not reader and not writer:
-                raise e.InternalError(f"bad poll status: {s}")
-            ev.clear()
-            ready = 0
-            if reader:
-                loop.add_reader(fileno, wakeup, READY_R)
-            if writer:
-                loop.add_writer(fileno, wakeup, READY_W)
-            try:
-                if interval is not None:
-                    try:
-                        await wait_for(ev.wait(), interval)
-                    except TimeoutError:
-                        pass
-                else:
-                    await ev.wait()
-            finally:
-                if reader:
-                    loop.remove_reader(fileno)
-                if writer:
-                    loop.remove_writer(fileno)
-            s = gen.send(ready)
-
-    except OSError as ex:
-        # Assume the connection was closed
-        raise e.OperationalError(str(ex))
-    except StopIteration as ex:
-        rv: RV = ex.value
-        return rv
+        return await waiter.wait(gen, fileno, interval)
+    finally:
+        waiter.close()
 
 
 async def wait_conn_async(gen: PQGenConn[RV], interval: float | None = None) -> RV:
@@ -178,49 +396,11 @@ async def wait_conn_async(gen: PQGenConn[RV], interval: float | None = None) ->
     Behave like in `wait()`, but take the fileno to wait from the generator
     itself, which might change during processing.
     """
-    # Use an event to block and restart after the fd state changes.
-    # Not sure this is the best implementation but it's a start.
-    ev = Event()
-    loop = get_event_loop()
-    ready: Ready
-    s: Wait
-
-    def wakeup(state: Ready) -> None:
-        nonlocal ready
-        ready = state
-        ev.set()
-
+    waiter = AsyncWaiter()
     try:
-        fileno, s = next(gen)
-        while True:
-            reader = s & WAIT_R
-            writer = s & WAIT_W
-            if not reader and not writer:
-                raise e.InternalError(f"bad poll status: {s}")
-            ev.clear()
-            ready = 0  # type: ignore[assignment]
-            if reader:
-                loop.add_reader(fileno, wakeup, READY_R)
-            if writer:
-                loop.add_writer(fileno, wakeup, READY_W)
-            try:
-                if interval:
-                    try:
-                        await wait_for(ev.wait(), interval)
-                    except TimeoutError:
-                        pass
-                else:
-                    await ev.wait()
-            finally:
-                if reader:
-                    loop.remove_reader(fileno)
-                if writer:
-                    loop.remove_writer(fileno)
-            fileno, s = gen.send(ready)
-
-    except StopIteration as ex:
-        rv: RV = ex.value
-        return rv
+        return await waiter.wait_conn(gen, interval)
+    finally:
+        waiter.close()
 
 
 # Specialised implementation of wait functions.
@@ -364,6 +544,85 @@ def wait_poll(gen: PQGen[RV], fileno: int, interval: float | None = None) -> RV:
         return rv
 
 
+class Waiter:
+    """
+    Object waiting for generators on a file descriptor, reusing its poller.
+
+    If the wait function chosen for the platform is `wait_poll()`, the
+    :sql:`poll` object is created once and the file descriptor is registered
+    on it until it changes, saving the setup of a new poller on every wait.
+    Otherwise every wait is delegated to the `wait()` function.
+
+    The object is used by `~gaussdb.Connection` to wait for all the
+    operations on its socket.
+    """
+
+    __slots__ = ("_poll", "_fileno", "_evmask")
+
+    def __init__(self) -> None:
+        self._poll: select.poll | None = None
+        self._fileno = -1
+        self._evmask = 0
+
+    def wait(self, gen: PQGen[RV], fileno: int, interval: float | None = None) -> RV:
+        """
+        Consume `!gen` waiting on `!fileno`; return what `!gen` returns.
+
+        The parameters are the same of `wait()`.
+        """
+        if wait is not wait_poll:
+            return wait(gen, fileno, interval)
+
+        try:
+            s = next(gen)
+
+            if interval is None or interval < 0:
+                interval = 0
+            else:
+                interval = int(interval * 1000.0)
+
+            poll = self._poll
+            if poll is None or fileno != self._fileno:
+                poll = self._bind(fileno)
+            while True:
+                evmask = _poll_evmasks[s]
+                if evmask != self._evmask:
+                    poll.modify(fileno, evmask)
+                    self._evmask = evmask
+
+                fileevs = poll.poll(interval)
+                if not fileevs:
+                    gen.send(READY_NONE)
+                    continue
+
+                ev = fileevs[0][1]
+                ready = 0
+                if ev & ~select.POLLOUT:
+                    ready = READY_R
+                if ev & ~select.POLLIN:
+                    ready |= READY_W
+                s = gen.send(ready)
+
+        except StopIteration as ex:
+            rv: RV = ex.value
+            return rv
+
+    def close(self) -> None:
+        """
+        Release the poller.
+        """
+        self._poll = None
+        self._fileno = -1
+        self._evmask = 0
+
+    def _bind(self, fileno: int) -> select.poll:
+        self._poll = poll = select.poll()
+        self._evmask = _poll_evmasks[WAIT_R]
+        poll.register(fileno, self._evmask)
+        self._fileno = fileno
+        return poll
+
+
 def _is_select_patched() -> bool:
     """
     Detect if some greenlet library has patched the select library.
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Any
 from collections import Counter, deque
 
 from gaussdb import errors as e
+from gaussdb._preparing import SharedStatementCache
 
 from .errors import PoolClosed
 
@@ -56,6 +57,8 @@ class BasePool:
         max_idle: float,
         reconnect_timeout: float,
         num_workers: int,
+        share_prepared: bool = False,
+        defer_deallocate: bool = False,
     ):
         min_size, max_size = self._check_size(min_size, max_size)
 
@@ -78,6 +81,12 @@ class BasePool:
         self.max_idle = max_idle
         self.num_workers = num_workers
 
+        # Statements prepared by any connection, to be prepared by all of them.
+        self._prepared_cache: SharedStatementCache | None = None
+        if share_prepared:
+            self._prepared_cache = SharedStatementCache()
+        self._defer_deallocate = defer_deallocate
+
         self._nconns = min_size  # currently in the pool, out, being prepared
         self._pool = deque()
         self._stats = Counter[str]()
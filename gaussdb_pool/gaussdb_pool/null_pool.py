@@ -47,6 +47,8 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: ConnectFailedCB | None = None,
         num_workers: int = 3,
+        share_prepared: bool = False,
+        defer_deallocate: bool = False,
     ):  # Note: min_size default value changed to 0.
 
         super().__init__(
@@ -66,6 +68,8 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            share_prepared=share_prepared,
+            defer_deallocate=defer_deallocate,
         )
 
     def wait(self, timeout: float = 30.0) -> None:
@@ -43,6 +43,8 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: AsyncConnectFailedCB | None = None,
         num_workers: int = 3,
+        share_prepared: bool = False,
+        defer_deallocate: bool = False,
     ):
         super().__init__(
             conninfo,
@@ -61,6 +63,8 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            share_prepared=share_prepared,
+            defer_deallocate=defer_deallocate,
         )
 
     async def wait(self, timeout: float = 30.0) -> None:
@@ -58,6 +58,8 @@ class ConnectionPool(Generic[CT], BasePool):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: ConnectFailedCB | None = None,
         num_workers: int = 3,
+        share_prepared: bool = False,
+        defer_deallocate: bool = False,
     ):
         self.connection_class = connection_class
         self._check = check
@@ -92,6 +94,8 @@ class ConnectionPool(Generic[CT], BasePool):
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            share_prepared=share_prepared,
+            defer_deallocate=defer_deallocate,
         )
 
         if open is None:
@@ -615,6 +619,14 @@ class ConnectionPool(Generic[CT], BasePool):
                     f"connection left in status {sname} by configure function {self._configure}: discarded"
                 )
 
+        if self._prepared_cache:
+            conn._prepared.shared = self._prepared_cache
+            try:
+                conn._maintain_prepared()
+            except Exception as ex:
+                logger.warning(f"error preparing shared statements: {ex}")
+        conn._prepared.defer_flush = self._defer_deallocate
+
         # Set an expiry date, with some randomness to avoid mass reconnection
         self._set_connection_expiry_date(conn)
         return conn
@@ -676,6 +688,8 @@ class ConnectionPool(Generic[CT], BasePool):
         Return a connection to the pool after usage.
         """
         self._reset_connection(conn)
+        if self._prepared_cache or self._defer_deallocate:
+            self._maintain_prepared(conn)
         if from_getconn:
             if conn.pgconn.transaction_status == TransactionStatus.UNKNOWN:
                 self._stats[self._CONNECTIONS_LOST] += 1
@@ -750,6 +764,12 @@ class ConnectionPool(Generic[CT], BasePool):
         """
         Bring a connection to IDLE state or close it.
         """
+        if conn._pipeline and conn._auto_pipeline:
+            try:
+                conn._exit_auto_pipeline()
+            except Exception as ex:
+                logger.warning("error syncing returned connection: %s", ex)
+
         status = conn.pgconn.transaction_status
         if status == TransactionStatus.IDLE:
             pass
@@ -787,6 +807,20 @@ class ConnectionPool(Generic[CT], BasePool):
                 logger.warning(f"error resetting connection: {ex}")
                 conn.close()
 
+    def _maintain_prepared(self, conn: CT) -> None:
+        """
+        Deallocate the statements evicted while the connection was in use and
+        prepare the statements prepared by other connections.
+        """
+        if conn.pgconn.transaction_status != TransactionStatus.IDLE:
+            return
+
+        try:
+            conn._maintain_prepared()
+        except Exception as ex:
+            logger.warning(f"error maintaining prepared statements: {ex}")
+            conn.close()
+
     def _shrink_pool(self) -> None:
         to_close: CT | None = None
 
@@ -58,6 +58,8 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: AsyncConnectFailedCB | None = None,
         num_workers: int = 3,
+        share_prepared: bool = False,
+        defer_deallocate: bool = False,
     ):
         self.connection_class = connection_class
         self._check = check
@@ -92,6 +94,8 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            share_prepared=share_prepared,
+            defer_deallocate=defer_deallocate,
         )
 
         if True:  # ASYNC
@@ -668,6 +672,14 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                     f" {self._configure}: discarded"
                 )
 
+        if self._prepared_cache:
+            conn._prepared.shared = self._prepared_cache
+            try:
+                await conn._maintain_prepared()
+            except Exception as ex:
+                logger.warning(f"error preparing shared statements: {ex}")
+        conn._prepared.defer_flush = self._defer_deallocate
+
         # Set an expiry date, with some randomness to avoid mass reconnection
         self._set_connection_expiry_date(conn)
         return conn
@@ -729,6 +741,8 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         Return a connection to the pool after usage.
         """
         await self._reset_connection(conn)
+        if self._prepared_cache or self._defer_deallocate:
+            await self._maintain_prepared(conn)
         if from_getconn:
             if conn.pgconn.transaction_status == TransactionStatus.UNKNOWN:
                 self._stats[self._CONNECTIONS_LOST] += 1
@@ -807,6 +821,12 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         """
         Bring a connection to IDLE state or close it.
         """
+        if conn._pipeline and conn._auto_pipeline:
+            try:
+                await conn._exit_auto_pipeline()
+            except Exception as ex:
+                logger.warning("error syncing returned connection: %s", ex)
+
         status = conn.pgconn.transaction_status
         if status == TransactionStatus.IDLE:
             pass
@@ -848,6 +868,20 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                 logger.warning(f"error resetting connection: {ex}")
                 await conn.close()
 
+    async def _maintain_prepared(self, conn: ACT) -> None:
+        """
+        Deallocate the statements evicted while the connection was in use and
+        prepare the statements prepared by other connections.
+        """
+        if conn.pgconn.transaction_status != TransactionStatus.IDLE:
+            return
+
+        try:
+            await conn._maintain_prepared()
+        except Exception as ex:
+            logger.warning(f"error maintaining prepared statements: {ex}")
+            await conn.close()
+
     async def _shrink_pool(self) -> None:
         to_close: ACT | None = None
 
@@ -339,6 +339,13 @@ class Faker:
     def make_bool(self, spec):
         return spec(choice((True, False)))
 
+    def make_BoolVector(self, spec):
+        length = randrange(1, self.list_max_length)
+        return spec([choice((True, False)) for i in range(length)])
+
+    def match_BoolVector(self, spec, got, want):
+        assert got == list(want.obj)
+
     def make_bytearray(self, spec):
         return self.make_bytes(spec)
 
@@ -446,9 +453,20 @@ class Faker:
 
     match_Float8 = match_float
 
+    def make_FloatVector(self, spec):
+        # Use values exactly representable as float4
+        length = randrange(1, self.list_max_length)
+        return spec([randrange(-(1 << 20), 1 << 20) / 64 for i in range(length)])
+
+    def match_FloatVector(self, spec, got, want):
+        assert list(got) == list(want.obj)
+
     def make_int(self, spec):
         return randrange(-(1 << 90), 1 << 90)
 
+    def make_Int1(self, spec):
+        return spec(randrange(0, 1 << 8))
+
     def make_Int2(self, spec):
         return spec(randrange(-(1 << 15), 1 << 15))
 
@@ -461,6 +479,9 @@ class Faker:
     def make_IntNumeric(self, spec):
         return spec(randrange(-(1 << 100), 1 << 100))
 
+    def make_Int16(self, spec):
+        return spec(randrange(-(1 << 127), 1 << 127))
+
     def make_IPv4Address(self, spec):
         return ipaddress.IPv4Address(bytes(randrange(256) for _ in range(4)))
 
@@ -647,6 +668,18 @@ class Faker:
     def make_Oid(self, spec):
         return spec(randrange(1 << 32))
 
+    def make_UInt1(self, spec):
+        return spec(randrange(1 << 8))
+
+    def make_UInt2(self, spec):
+        return spec(randrange(1 << 16))
+
+    def make_UInt4(self, spec):
+        return spec(randrange(1 << 32))
+
+    def make_UInt8(self, spec):
+        return spec(randrange(1 << 64))
+
     def schema_Range(self, cls):
         subtypes = [
             Decimal,
@@ -905,14 +938,12 @@ class Faker:
         return self.make_Float8(spec)
 
     def match_numpy_ulonglong(self, spec, got, want):
-        return self._match_numpy_with_decimal(spec, got, want)
+        return self.match_numpy_uint64(spec, got, want)
 
     def match_numpy_uint64(self, spec, got, want):
-        return self._match_numpy_with_decimal(spec, got, want)
-
-    def _match_numpy_with_decimal(self, spec, got, want):
-        assert isinstance(got, Decimal)
-        return self.match_any(spec, int(got), want)
+        # Loaded back from uint8, as int
+        assert isinstance(got, int)
+        return self.match_any(spec, got, want)
 
     def match_numpy_float16(self, spec, got, want):
         return self.match_float(spec, got, want, rel=1e-3)
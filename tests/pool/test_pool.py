@@ -200,6 +200,34 @@ def test_configure(dsn):
             assert res.fetchone()[0] == "on"
 
 
+def test_share_prepared(dsn):
+    with pool.ConnectionPool(dsn, min_size=2, share_prepared=True) as p:
+        p.wait()
+        with p.connection() as conn1, p.connection() as conn2:
+            conn1.execute("select 1", prepare=True)
+            assert not conn2._prepared._names
+
+        p.wait()
+        key = (b"select 1", ())
+        assert key in conn1._prepared._names
+        assert key in conn2._prepared._names
+
+
+def test_share_prepared_error(dsn):
+    with pool.ConnectionPool(dsn, min_size=2, share_prepared=True) as p:
+        p.wait()
+        with p.connection() as conn1, p.connection() as conn2:
+            conn1.execute("select 1", prepare=True)
+            conn1.execute("create temp table tmp (x int)")
+            # The most recent statement fails to prepare on conn2
+            conn1.execute("select * from tmp", prepare=True)
+
+        p.wait()
+        assert (b"select 1", ()) in conn2._prepared._names
+        assert (b"select * from tmp", ()) not in conn2._prepared._names
+        assert conn2.pgconn.pipeline_status == 0
+
+
 def test_reset(dsn):
     resets = 0
 
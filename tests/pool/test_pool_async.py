@@ -198,6 +198,34 @@ async def test_configure(dsn):
             assert (await res.fetchone())[0] == "on"
 
 
+async def test_share_prepared(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=2, share_prepared=True) as p:
+        await p.wait()
+        async with p.connection() as conn1, p.connection() as conn2:
+            await conn1.execute("select 1", prepare=True)
+            assert not conn2._prepared._names
+
+        await p.wait()
+        key = (b"select 1", ())
+        assert key in conn1._prepared._names
+        assert key in conn2._prepared._names
+
+
+async def test_share_prepared_error(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=2, share_prepared=True) as p:
+        await p.wait()
+        async with p.connection() as conn1, p.connection() as conn2:
+            await conn1.execute("select 1", prepare=True)
+            await conn1.execute("create temp table tmp (x int)")
+            # The most recent statement fails to prepare on conn2
+            await conn1.execute("select * from tmp", prepare=True)
+
+        await p.wait()
+        assert (b"select 1", ()) in conn2._prepared._names
+        assert (b"select * from tmp", ()) not in conn2._prepared._names
+        assert conn2.pgconn.pipeline_status == 0
+
+
 async def test_reset(dsn):
     resets = 0
 
@@ -179,6 +179,29 @@ def test_get_value(pgconn):
         pytest.skip(f"Database compatibility check failed: {e}")
 
 
+@pytest.mark.parametrize("fmt", (0, 1))
+def test_get_column(pgconn, fmt):
+    res = pgconn.exec_params(
+        b"select * from (values ('a', ''), ('', NULL), (NULL, 'b')) x",
+        [],
+        result_format=fmt,
+    )
+    assert res.status == pq.ExecStatus.TUPLES_OK, res.error_message
+    for col in range(res.nfields):
+        assert res.get_column(col) == [
+            res.get_value(row, col) for row in range(res.ntuples)
+        ]
+    assert res.get_columns() == [[b"a", b"", None], [b"", None, b"b"]]
+    for row in range(res.ntuples):
+        assert res.get_row(row) == [
+            res.get_value(row, col) for col in range(res.nfields)
+        ]
+    res.clear()
+    assert res.get_column(0) == []
+    assert res.get_columns() == []
+    assert res.get_row(0) == []
+
+
 def test_nparams_types(pgconn):
     res = pgconn.prepare(b"", b"select $1::int4, $2::text")
     assert res.status == pq.ExecStatus.COMMAND_OK, res.error_message
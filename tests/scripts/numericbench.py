@@ -0,0 +1,113 @@
+"""
+Measure the time to load binary numeric values into Python objects.
+
+Compare the numeric binary loaders with the previous implementation of
+`NumericBinaryLoader`, which computed the `Decimal` with context arithmetic.
+"""
+
+# Copyright (C) 2025 The Psycopg Team
+
+from __future__ import annotations
+
+import logging
+from random import randrange
+from timeit import timeit
+from decimal import Context, Decimal, DefaultContext
+from argparse import ArgumentParser, Namespace
+
+from gaussdb.types import numeric
+from gaussdb.types.numeric import dump_decimal_to_numeric_binary
+
+logger = logging.getLogger()
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+
+def main() -> None:
+    args = parse_cmdline()
+
+    values = [
+        bytes(dump_decimal_to_numeric_binary(make_decimal(args)))
+        for i in range(args.nvalues)
+    ]
+
+    funcs = {
+        "previous Decimal": load_numeric_previous,
+        "Decimal": numeric.NumericBinaryLoader(0).load,
+        "int": numeric.NumericIntBinaryLoader(0).load,
+        "float": numeric.NumericFloatBinaryLoader(0).load,
+    }
+    for name, func in funcs.items():
+        t = timeit(lambda: [func(v) for v in values], number=args.ntests)
+        logger.info(
+            "%s: %.3f usec per value", name, t / args.ntests / args.nvalues * 1e6
+        )
+
+
+def make_decimal(args: Namespace) -> Decimal:
+    return Decimal(randrange(-(10**args.precision), 10**args.precision)).scaleb(
+        -args.scale
+    )
+
+
+_contexts: dict[int, Context] = {}
+
+
+def load_numeric_previous(data: bytes) -> Decimal:
+    ndigits, weight, sign, dscale = numeric._unpack_numeric_head(data)
+    if sign == numeric.NUMERIC_POS or sign == numeric.NUMERIC_NEG:
+        val = 0
+        for i in range(8, len(data), 2):
+            val = val * 10_000 + data[i] * 0x100 + data[i + 1]
+
+        shift = dscale - (ndigits - weight - 1) * numeric.DEC_DIGITS
+        prec = (weight + 2) * numeric.DEC_DIGITS + dscale
+        try:
+            ctx = _contexts[prec]
+        except KeyError:
+            ctx = _contexts[prec] = (
+                Context(prec=prec) if prec >= DefaultContext.prec else DefaultContext
+            )
+        return (
+            Decimal(val if sign == numeric.NUMERIC_POS else -val)
+            .scaleb(-dscale, ctx)
+            .shift(shift, ctx)
+        )
+    else:
+        return numeric._decimal_special[sign]
+
+
+def parse_cmdline() -> Namespace:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--nvalues",
+        "-n",
+        type=int,
+        default=10_000,
+        help="number of values to load [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--ntests",
+        "-t",
+        type=int,
+        default=10,
+        help="number of times to load the values [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--precision",
+        "-p",
+        type=int,
+        default=10,
+        help="number of digits of the values [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--scale",
+        "-s",
+        type=int,
+        default=2,
+        help="number of fractional digits of the values [default: %(default)s]",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Measure the overhead of waiting for many small operations on a socket.
+
+Compare the `waiting` functions, creating a new poller on every wait, with a
+`waiting.Waiter`, reusing the same poller, as a `Connection` does.
+"""
+
+# Copyright (C) 2025 The Psycopg Team
+
+from __future__ import annotations
+
+import socket
+import logging
+from timeit import timeit
+from argparse import ArgumentParser, Namespace
+
+from gaussdb import waiting
+from gaussdb.abc import PQGen
+
+logger = logging.getLogger()
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+
+def main() -> None:
+    args = parse_cmdline()
+
+    lsock, rsock = socket.socketpair()
+    with lsock, rsock:
+
+        def gen() -> PQGen[None]:
+            # Simulate a tiny query: wait to read a one-byte response.
+            rsock.send(b"x")
+            yield waiting.Wait.R
+            lsock.recv(1)
+
+        fileno = lsock.fileno()
+        funcs = {
+            name: getattr(waiting, name)
+            for name in ("wait_poll", "wait_epoll", "wait_select")
+            if hasattr(waiting, name)
+        }
+        waiter = waiting.Waiter()
+        funcs["Waiter.wait"] = waiter.wait
+
+        for name, func in funcs.items():
+            t = timeit(lambda: func(gen(), fileno, 0.1), number=args.ntests)
+            logger.info("%s: %.2f usec per wait", name, t / args.ntests * 1e6)
+
+
+def parse_cmdline() -> Namespace:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--ntests",
+        "-n",
+        type=int,
+        default=100_000,
+        help="number of waits to perform [default: %(default)s]",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
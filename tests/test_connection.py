@@ -549,6 +549,34 @@ def test_execute_binary(conn):
     assert cur.pgresult.fformat(0) == 1
 
 
+def test_compile(conn):
+    query = conn.compile("select %(a)s, %(b)s, %(a)s")
+    assert isinstance(query, gaussdb.sql.Compiled)
+    for i in range(3):
+        cur = conn.execute(query, {"a": i, "b": str(i)})
+        assert (cur.fetchone()) == (i, str(i), i)
+    assert cur._query.query == b"select $1, $2, $1"
+
+
+def test_compile_types(conn):
+    query = conn.compile("select %s, %t, %s", types=["int8", "numeric", "text"])
+    cur = conn.execute(query, [1, 2, None])
+    assert (cur.fetchone()) == (1, 2, None)
+    assert cur._query.types == (20, 1700, 25)
+    assert cur._query.formats == [pq.Format.BINARY, pq.Format.TEXT, pq.Format.BINARY]
+
+    cur = conn.cursor()
+    cur.executemany(query, [(3, 4, "a"), (5, 6, "b")], returning=True)
+    assert (cur.fetchone()) == (3, 4, "a")
+
+
+def test_compile_bad_types(conn):
+    with pytest.raises(e.ProgrammingError):
+        conn.compile("select %s, %s", types=["int4"])
+    with pytest.raises(e.ProgrammingError):
+        conn.compile("select %s", types=["int4", "int4"])
+
+
 def test_row_factory(conn_cls, dsn):
     defaultconn = conn_cls.connect(dsn)
     assert defaultconn.row_factory is tuple_row
@@ -548,6 +548,34 @@ async def test_execute_binary(aconn):
     assert cur.pgresult.fformat(0) == 1
 
 
+async def test_compile(aconn):
+    query = aconn.compile("select %(a)s, %(b)s, %(a)s")
+    assert isinstance(query, gaussdb.sql.Compiled)
+    for i in range(3):
+        cur = await aconn.execute(query, {"a": i, "b": str(i)})
+        assert (await cur.fetchone()) == (i, str(i), i)
+    assert cur._query.query == b"select $1, $2, $1"
+
+
+async def test_compile_types(aconn):
+    query = aconn.compile("select %s, %t, %s", types=["int8", "numeric", "text"])
+    cur = await aconn.execute(query, [1, 2, None])
+    assert (await cur.fetchone()) == (1, 2, None)
+    assert cur._query.types == (20, 1700, 25)
+    assert cur._query.formats == [pq.Format.BINARY, pq.Format.TEXT, pq.Format.BINARY]
+
+    cur = aconn.cursor()
+    await cur.executemany(query, [(3, 4, "a"), (5, 6, "b")], returning=True)
+    assert (await cur.fetchone()) == (3, 4, "a")
+
+
+async def test_compile_bad_types(aconn):
+    with pytest.raises(e.ProgrammingError):
+        aconn.compile("select %s, %s", types=["int4"])
+    with pytest.raises(e.ProgrammingError):
+        aconn.compile("select %s", types=["int4", "int4"])
+
+
 async def test_row_factory(aconn_cls, dsn):
     defaultconn = await aconn_cls.connect(dsn)
     assert defaultconn.row_factory is tuple_row
@@ -125,6 +125,42 @@ def test_rows(conn, format):
     assert conn.info.transaction_status == pq.TransactionStatus.INTRANS
 
 
+@pytest.mark.parametrize("size", [1, 10])
+def test_read_batches(size, conn):
+    np = pytest.importorskip("numpy")
+    cur = conn.cursor()
+    with cur.copy(f"copy ({sample_values}) to stdout (format binary)") as copy:
+        copy.set_types(["int4", "int4", "text"])
+        batches = list(copy.read_batches(size))
+        assert copy.read_batch() is None
+
+    assert len(batches) == (2 if size == 1 else 1)
+    columns = [np.ma.concatenate(cols) for cols in list(zip(*batches))[:2]]
+    assert columns[0].tolist() == [40010, 40040]
+    assert columns[1].tolist() == [40020, None]
+    texts = [v for batch in batches for v in batch[2].values()]
+    assert texts == [b"hello", b"world"]
+    assert conn.info.transaction_status == pq.TransactionStatus.INTRANS
+
+
+def test_read_batch_no_types(conn):
+    pytest.importorskip("numpy")
+    cur = conn.cursor()
+    with cur.copy(f"copy ({sample_values}) to stdout (format binary)") as copy:
+        (col1, col2, data) = copy.read_batch()
+
+    assert col2.values() == [(40020).to_bytes(4, "big"), None]
+    assert data.values() == [b"hello", b"world"]
+
+
+def test_read_batch_text(conn):
+    cur = conn.cursor()
+    with cur.copy(f"copy ({sample_values}) to stdout") as copy:
+        with pytest.raises(e.NotSupportedError):
+            copy.read_batch()
+        assert len(list(copy)) == 2
+
+
 def test_set_custom_type(conn, hstore):
     command = """copy (select '"a"=>"1", "b"=>"2"'::hstore) to stdout"""
     cur = conn.cursor()
@@ -479,6 +515,38 @@ def test_copy_in_records_binary(conn, format):
     assert data == [(1, None, "hello"), (2, None, "world")]
 
 
+@pytest.mark.parametrize("use_types", [True, False])
+def test_copy_in_columns(use_types, conn):
+    np = pytest.importorskip("numpy")
+    cur = conn.cursor()
+    ensure_table(cur, "col1 int primary key, col2 bigint, data text, f float8")
+
+    cols = {
+        "col1": np.arange(1, 4, dtype="int32"),
+        "col2": np.ma.masked_array(np.array([10, 20, 30]), mask=[0, 1, 0]),
+        "data": ["hello", None, "world"],
+        "f": np.array([0.5, 1.5, 2.5]),
+    }
+    with cur.copy("copy copy_in from stdin (format binary)") as copy:
+        if use_types:
+            copy.set_types(["int4", "int8", "text", "float8"])
+        copy.write_columns(cols)
+
+    cur.execute("select * from copy_in order by 1")
+    data = cur.fetchall()
+    assert data == [(1, 10, "hello", 0.5), (2, None, None, 1.5), (3, 30, "world", 2.5)]
+
+
+def test_copy_in_columns_text(conn):
+    pytest.importorskip("numpy")
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+
+    with cur.copy("copy copy_in from stdin") as copy:
+        with pytest.raises(e.NotSupportedError):
+            copy.write_columns([[1], [2], ["x"]])
+
+
 def test_copy_in_allchars(conn):
     cur = conn.cursor()
     ensure_table(cur, sample_tabledef)
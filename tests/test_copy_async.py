@@ -129,6 +129,42 @@ async def test_rows(aconn, format):
     assert aconn.info.transaction_status == pq.TransactionStatus.INTRANS
 
 
+@pytest.mark.parametrize("size", [1, 10])
+async def test_read_batches(size, aconn):
+    np = pytest.importorskip("numpy")
+    cur = aconn.cursor()
+    async with cur.copy(f"copy ({sample_values}) to stdout (format binary)") as copy:
+        copy.set_types(["int4", "int4", "text"])
+        batches = await alist(copy.read_batches(size))
+        assert (await copy.read_batch()) is None
+
+    assert len(batches) == (2 if size == 1 else 1)
+    columns = [np.ma.concatenate(cols) for cols in list(zip(*batches))[:2]]
+    assert columns[0].tolist() == [40010, 40040]
+    assert columns[1].tolist() == [40020, None]
+    texts = [v for batch in batches for v in batch[2].values()]
+    assert texts == [b"hello", b"world"]
+    assert aconn.info.transaction_status == pq.TransactionStatus.INTRANS
+
+
+async def test_read_batch_no_types(aconn):
+    pytest.importorskip("numpy")
+    cur = aconn.cursor()
+    async with cur.copy(f"copy ({sample_values}) to stdout (format binary)") as copy:
+        (col1, col2, data) = await copy.read_batch()
+
+    assert col2.values() == [(40020).to_bytes(4, "big"), None]
+    assert data.values() == [b"hello", b"world"]
+
+
+async def test_read_batch_text(aconn):
+    cur = aconn.cursor()
+    async with cur.copy(f"copy ({sample_values}) to stdout") as copy:
+        with pytest.raises(e.NotSupportedError):
+            await copy.read_batch()
+        assert len(await alist(copy)) == 2
+
+
 async def test_set_custom_type(aconn, hstore):
     command = """copy (select '"a"=>"1", "b"=>"2"'::hstore) to stdout"""
     cur = aconn.cursor()
@@ -493,6 +529,40 @@ async def test_copy_in_records_binary(aconn, format):
     assert data == [(1, None, "hello"), (2, None, "world")]
 
 
+@pytest.mark.parametrize("use_types", [True, False])
+async def test_copy_in_columns(use_types, aconn):
+    np = pytest.importorskip("numpy")
+    cur = aconn.cursor()
+    await ensure_table_async(
+        cur, "col1 int primary key, col2 bigint, data text, f float8"
+    )
+
+    cols = {
+        "col1": np.arange(1, 4, dtype="int32"),
+        "col2": np.ma.masked_array(np.array([10, 20, 30]), mask=[0, 1, 0]),
+        "data": ["hello", None, "world"],
+        "f": np.array([0.5, 1.5, 2.5]),
+    }
+    async with cur.copy("copy copy_in from stdin (format binary)") as copy:
+        if use_types:
+            copy.set_types(["int4", "int8", "text", "float8"])
+        await copy.write_columns(cols)
+
+    await cur.execute("select * from copy_in order by 1")
+    data = await cur.fetchall()
+    assert data == [(1, 10, "hello", 0.5), (2, None, None, 1.5), (3, 30, "world", 2.5)]
+
+
+async def test_copy_in_columns_text(aconn):
+    pytest.importorskip("numpy")
+    cur = aconn.cursor()
+    await ensure_table_async(cur, sample_tabledef)
+
+    async with cur.copy("copy copy_in from stdin") as copy:
+        with pytest.raises(e.NotSupportedError):
+            await copy.write_columns([[1], [2], ["x"]])
+
+
 async def test_copy_in_allchars(aconn):
     cur = aconn.cursor()
     await ensure_table_async(cur, sample_tabledef)
@@ -183,12 +183,12 @@ def test_query_parse_cache_size(conn):
     tests = [
         (f"select 1 -- {'x' * 3500}", (), h0, m0 + 1),
         (f"select 1 -- {'x' * 3500}", (), h0 + 1, m0 + 1),
-        (f"select 1 -- {'x' * 4500}", (), h0 + 1, m0 + 1),
-        (f"select 1 -- {'x' * 4500}", (), h0 + 1, m0 + 1),
-        (f"select 1 -- {'%s' * 40}", ("x",) * 40, h0 + 1, m0 + 2),
-        (f"select 1 -- {'%s' * 40}", ("x",) * 40, h0 + 2, m0 + 2),
-        (f"select 1 -- {'%s' * 60}", ("x",) * 60, h0 + 2, m0 + 2),
-        (f"select 1 -- {'%s' * 60}", ("x",) * 60, h0 + 2, m0 + 2),
+        (f"select 1 -- {'x' * 4500}", (), h0 + 1, m0 + 2),
+        (f"select 1 -- {'x' * 4500}", (), h0 + 2, m0 + 2),
+        (f"select 1 -- {'%s' * 40}", ("x",) * 40, h0 + 2, m0 + 3),
+        (f"select 1 -- {'%s' * 40}", ("x",) * 40, h0 + 3, m0 + 3),
+        (f"select 1 -- {'%s' * 60}", ("x",) * 60, h0 + 3, m0 + 3),
+        (f"select 1 -- {'%s' * 60}", ("x",) * 60, h0 + 3, m0 + 3),
     ]
     for i, (query, params, hits, misses) in enumerate(tests):
         pq = cur._query_cls(gaussdb.adapt.Transformer())
@@ -290,6 +290,48 @@ def test_binary_cursor_execute(conn):
     assert cur.pgresult.get_value(0, 0) == b"\x00\x01"
 
 
+def test_fetch_columns(conn):
+    cur = conn.cursor()
+    cur.execute("select x as n, x::text as s from generate_series(1, 3) x")
+    assert cur.fetchone() == (1, "1")
+    assert cur.fetch_columns() == {"n": [2, 3], "s": ["2", "3"]}
+    assert cur.fetch_columns() == {"n": [], "s": []}
+
+
+def test_fetch_columns_duplicate_names(conn):
+    cur = conn.cursor()
+    cur.execute("select 1 as x, 2 as x, 3 as y")
+    with pytest.raises(gaussdb.ProgrammingError, match="duplicate column names: x"):
+        cur.fetch_columns()
+    assert cur.fetchone() == (1, 2, 3)
+
+
+@pytest.mark.numpy
+@pytest.mark.parametrize("binary", [False, True])
+def test_fetch_columns_numpy(conn, binary):
+    np = pytest.importorskip("numpy")
+    if binary and conn.cursor_factory is gaussdb.ClientCursor:
+        pytest.skip("binary not supported by client-side cursors")
+
+    cur = conn.cursor(binary=binary)
+    cur.execute(
+        "select x::int4 as i, x / 2.0::float8 as f, x = 2 as b,"
+        " '2020-01-01'::date + x as d, nullif(x, 2) as n"
+        " from generate_series(1, 3) x"
+    )
+    cols = cur.fetch_columns(numpy=True)
+    assert cols["i"].dtype == np.int32
+    assert cols["i"].tolist() == [1, 2, 3]
+    assert cols["f"].dtype == np.float64
+    assert cols["f"].tolist() == [0.5, 1.0, 1.5]
+    assert cols["b"].dtype == np.bool_
+    assert cols["b"].tolist() == [False, True, False]
+    assert cols["d"].dtype == np.dtype("datetime64[D]")
+    assert cols["d"].tolist() == [dt.date(2020, 1, d) for d in (2, 3, 4)]
+    assert cols["n"].dtype == object
+    assert cols["n"].tolist() == [1, None, 3]
+
+
 def test_execute_binary(conn):
     cur = conn.cursor()
     with raiseif(
@@ -424,6 +466,99 @@ def test_executemany_rowcount_no_hit(conn, execmany):
     assert cur.rowcount == 0
 
 
+@pytest.mark.parametrize("batch_size", [1, 4, 100])
+def test_executemany_batch_size(conn, execmany, batch_size):
+    cur = conn.cursor()
+    query = ph(cur, "insert into execmany(num, data) values (%s, %s)")
+    records = [(i, str(i)) for i in range(13)]
+    if isinstance(cur, gaussdb.RawCursor):
+        with pytest.raises(gaussdb.NotSupportedError):
+            cur.executemany(query, records, batch_size=batch_size)
+        return
+
+    cur.executemany(query, records, batch_size=batch_size)
+    assert cur.rowcount == 13
+    cur.execute("select num, data from execmany order by 1")
+    assert (cur.fetchall()) == records
+
+
+def test_executemany_batch_size_name(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%(num)s, %(data)s)"),
+        [{"num": i, "data": str(i), "x": 1} for i in range(5)],
+        batch_size=2,
+    )
+    assert cur.rowcount == 5
+    cur.execute("select num, data from execmany order by 1")
+    assert (cur.fetchall()) == [(i, str(i)) for i in range(5)]
+
+
+def test_executemany_batch_size_returning(conn, execmany):
+    cur = conn.cursor()
+    if isinstance(cur, gaussdb.RawCursor):
+        pytest.skip("batch_size not supported by raw cursors")
+    cur.executemany(
+        "insert into execmany(num, data) values (%s, %s) returning num",
+        [(i, str(i)) for i in range(11)],
+        returning=True,
+        batch_size=4,
+    )
+    sets = []
+    while True:
+        sets.append([r[0] for r in (cur.fetchall())])
+        if not cur.nextset():
+            break
+    # 2 full batches, then the remaining records in batches of 2 and 1
+    assert sets == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9], [10]]
+
+
+def test_executemany_batch_size_badquery(conn):
+    cur = conn.cursor()
+    if isinstance(cur, gaussdb.RawCursor):
+        pytest.skip("batch_size not supported by raw cursors")
+    with pytest.raises(gaussdb.ProgrammingError, match="VALUES"):
+        cur.executemany("select %s", [(1,), (2,)], batch_size=2)
+
+
+@pytest.mark.parametrize("batch_size", [None, 4])
+def test_executemany_unnest(conn, execmany, batch_size):
+    cur = conn.cursor()
+    query = ph(cur, "insert into execmany(num, data) values (%s::int, %s)")
+    records = [(i, str(i) if i % 3 else None) for i in range(10)]
+    if isinstance(cur, gaussdb.RawCursor):
+        with pytest.raises(gaussdb.NotSupportedError):
+            cur.executemany(query, records, mode="unnest")
+        return
+
+    cur.executemany(query, records, mode="unnest", batch_size=batch_size)
+    assert cur.rowcount == 10
+    cur.execute("select num, data from execmany order by 1")
+    assert (cur.fetchall()) == records
+
+
+def test_executemany_unnest_returning(conn, execmany):
+    cur = conn.cursor()
+    if isinstance(cur, gaussdb.RawCursor):
+        pytest.skip("mode not supported by raw cursors")
+    cur.executemany(
+        "insert into execmany(num, data) values (%(num)s, %(data)s::text)"
+        " returning num",
+        [{"num": i, "data": str(i)} for i in range(5)],
+        returning=True,
+        mode="unnest",
+    )
+    assert cur.rowcount == 5
+    assert (cur.fetchall()) == [(i,) for i in range(5)]
+    assert cur.nextset() is None
+
+
+def test_executemany_bad_mode(conn):
+    cur = conn.cursor()
+    with pytest.raises(ValueError):
+        cur.executemany("insert into t values (%s)", [(1,)], mode="wat")
+
+
 @pytest.mark.parametrize(
     "query",
     [
@@ -308,6 +308,13 @@ def test_executemany(conn):
     cur.close()
 
 
+def test_fetch_columns(conn):
+    cur = conn.cursor("foo")
+    with pytest.raises(e.NotSupportedError):
+        cur.fetch_columns()
+    cur.close()
+
+
 def test_fetchone(conn):
     with conn.cursor("foo") as cur:
         cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (2,))
@@ -314,6 +314,13 @@ async def test_executemany(aconn):
     await cur.close()
 
 
+async def test_fetch_columns(aconn):
+    cur = aconn.cursor("foo")
+    with pytest.raises(e.NotSupportedError):
+        await cur.fetch_columns()
+    await cur.close()
+
+
 async def test_fetchone(aconn):
     async with aconn.cursor("foo") as cur:
         await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (2,))
@@ -0,0 +1,66 @@
+import time
+
+import pytest
+
+import gaussdb
+from gaussdb import pq
+
+
+@pytest.fixture
+def conns(conn_cls, dsn):
+    conns = [conn_cls.connect(dsn) for i in range(3)]
+    yield conns
+    for conn in conns:
+        conn.close()
+
+
+def test_execute_many_conns(conns):
+    curs = list(gaussdb.execute_many_conns(conns, "select %s", [42]))
+    assert len(curs) == 3
+    assert {id(cur.connection) for cur in curs} == {id(conn) for conn in conns}
+    for cur in curs:
+        assert cur.fetchone() == (42,)
+    for conn in conns:
+        assert not conn.lock.locked()
+
+
+def test_execute_many_conns_error(conns):
+    curs = []
+    with pytest.raises(gaussdb.errors.DivisionByZero):
+        for cur in gaussdb.execute_many_conns(conns, "select 1 / %s", [0]):
+            curs.append(cur)
+    assert not curs
+    for conn in conns:
+        assert not conn.lock.locked()
+        assert conn.info.transaction_status == pq.TransactionStatus.INERROR
+
+
+def test_execute_many_conns_partial_error(conns):
+    for i, conn in enumerate(conns):
+        conn.execute("create temp table t as select %s::int as x", [int(i != 1)])
+    curs = []
+    with pytest.raises(gaussdb.errors.DivisionByZero):
+        for cur in gaussdb.execute_many_conns(conns, "select 1 / x from t"):
+            curs.append(cur)
+    assert sorted(conns.index(cur.connection) for cur in curs) == [0, 2]
+    for cur in curs:
+        assert cur.fetchone() == (1,)
+
+
+def test_execute_many_conns_early_exit(conns):
+    for i, conn in enumerate(conns):
+        conn.execute("create temp table t as select %s::int as x", [0 if i else 10])
+        conn.commit()
+
+    t0 = time.time()
+    gen = gaussdb.execute_many_conns(conns, "select pg_sleep(x) from t")
+    cur = next(gen)
+    assert cur.connection is not conns[0]
+    gen.close()
+    assert time.time() - t0 < 5
+
+    for conn in conns:
+        assert not conn.lock.locked()
+    assert conns[0].info.transaction_status == pq.TransactionStatus.INERROR
+    conns[0].rollback()
+    assert conns[0].execute("select 1").fetchone() == (1,)
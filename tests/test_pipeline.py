@@ -3,6 +3,7 @@
 # DO NOT CHANGE! Change the original file instead.
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 from operator import attrgetter
@@ -14,7 +15,7 @@ import gaussdb
 from gaussdb import errors as e
 from gaussdb import pq
 
-from .acompat import is_async
+from .acompat import gather, is_async, skip_sync, sleep, spawn
 
 pytestmark = [
     pytest.mark.pipeline,
@@ -361,6 +362,35 @@ def test_executemany_no_returning(conn):
         assert cur.nextset() is None
 
 
+@pytest.mark.parametrize(
+    "policy",
+    [{"max_batch": 10}, {"max_bytes": 100}, {"max_delay": 60}, {"max_batch": 1000}],
+)
+def test_executemany_flush_policy(conn, policy, monkeypatch):
+    conn.set_autocommit(True)
+    conn.execute("create temp table flushpolicy (id int)")
+    ncomms = 0
+    communicate_gen = gaussdb.Pipeline._communicate_gen
+
+    def counting_communicate_gen(self):
+        nonlocal ncomms
+        ncomms += 1
+        return (yield from communicate_gen(self))
+
+    monkeypatch.setattr(gaussdb.Pipeline, "_communicate_gen", counting_communicate_gen)
+    with conn.pipeline(**policy) as p, conn.cursor() as cur:
+        assert getattr(p, list(policy)[0]) == list(policy.values())[0]
+        cur.executemany(
+            "insert into flushpolicy (id) values (%s)", [(i,) for i in range(100)]
+        )
+        assert ncomms < 20
+        cur.execute("select count(*) from flushpolicy")
+        assert cur.fetchone() == (100,)
+    assert p.max_batch is None
+    assert p.max_bytes is None
+    assert p.max_delay is None
+
+
 @pytest.mark.crdb("skip", reason="temp tables")
 def test_executemany_trace(conn, trace):
     conn.set_autocommit(True)
@@ -611,3 +641,171 @@ def test_execute_nextset(conn):
         assert cur.fetchall() == [(2,)]
         assert not cur.nextset()
         assert cur.fetchall() == []
+
+
+def test_auto_pipeline(conn_cls, dsn):
+    with conn_cls.connect(dsn, autocommit=True, auto_pipeline=True) as conn:
+        assert conn.auto_pipeline
+        assert not conn._pipeline
+        cur1 = conn.execute("select 1")
+        cur2 = conn.execute("select 2")
+        assert conn.pgconn.pipeline_status
+        assert cur2.fetchone() == (2,)
+        assert cur1.fetchone() == (1,)
+        assert conn.pgconn.pipeline_status
+
+
+def test_auto_pipeline_error(conn_cls, dsn):
+    with conn_cls.connect(dsn, autocommit=True, auto_pipeline=True) as conn:
+        # Where the error is raised depends on when the results are received.
+        errors = []
+        for query in [
+            "create temp table autopipe (id int primary key)",
+            "insert into autopipe values (1)",
+            "insert into autopipe values (1)",
+            "insert into autopipe values (2)",
+            "select id from autopipe order by id",
+        ]:
+            try:
+                cur = conn.execute(query)
+            except e.UniqueViolation as ex:
+                errors.append(ex)
+        try:
+            cur.fetchall()
+        except e.UniqueViolation as ex:
+            errors.append(ex)
+        assert len(errors) == 1
+        cur = conn.execute("select id from autopipe order by id")
+        assert cur.fetchall() == [(1,), (2,)]
+
+
+def test_auto_pipeline_transaction(conn_cls, dsn):
+    with conn_cls.connect(dsn, auto_pipeline=True) as conn:
+        conn.execute("create temp table autopipe (id int)")
+        conn.execute("insert into autopipe values (1)")
+        conn.commit()
+        assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+        conn.execute("insert into autopipe values (2)")
+        conn.rollback()
+        cur = conn.execute("select id from autopipe")
+        assert cur.fetchall() == [(1,)]
+
+
+def test_auto_pipeline_exit(conn_cls, dsn):
+    with conn_cls.connect(dsn, autocommit=True, auto_pipeline=True) as conn:
+        conn.execute("create temp table autopipe (id int)")
+        assert conn.pgconn.pipeline_status
+        cur = conn.cursor()
+        with cur.copy("copy autopipe from stdin") as copy:
+            copy.write_row([10])
+        assert not conn._pipeline
+        cur.execute("select id from autopipe")
+        assert conn.pgconn.pipeline_status
+        assert cur.fetchone() == (10,)
+
+        rows = []
+        for row in cur.stream("select 1"):
+            rows.append(row)
+        assert rows == [(1,)]
+        assert not conn.pgconn.pipeline_status
+
+
+def test_auto_pipeline_close_busy(conn_cls, dsn, caplog):
+    with conn_cls.connect(dsn, autocommit=True, auto_pipeline=True) as conn:
+        conn.execute("select 1")
+        assert conn._pipeline
+        with conn.lock:
+            # Don't wait for the lock to sync: another thread or task may own it.
+            conn.close()
+        assert conn.closed
+        assert "not synced on close" in caplog.text
+
+
+@skip_sync
+def test_auto_pipeline_close_unregister(conn_cls, dsn):
+    selector = getattr(asyncio.get_running_loop(), "_selector", None)
+    if selector is None:
+        pytest.skip("the event loop doesn't expose its selector")
+
+    with conn_cls.connect(dsn, autocommit=True, auto_pipeline=True) as conn:
+        fileno = conn.pgconn.socket
+        conn.execute("select 1")
+        conn.execute("select 2")
+        assert conn._pipeline
+        conn.close()
+        # Syncing the pipeline on close doesn't leave the socket on the loop.
+        assert fileno not in selector.get_map()
+
+
+def test_auto_pipeline_explicit(conn_cls, dsn):
+    with conn_cls.connect(dsn, autocommit=True, auto_pipeline=True) as conn:
+        with conn.pipeline():
+            conn.execute("select 1")
+        assert not conn._pipeline
+        conn.execute("select 1")
+        with conn.pipeline() as p:
+            assert p._auto
+            assert p.level == 2
+        assert conn._pipeline is p
+
+
+@skip_sync
+def test_submit(conn):
+    conn.set_autocommit(True)
+    with conn.pipeline() as p:
+        futs = [p.submit("select %s::int", [i]) for i in range(10)]
+        curs = [fut for fut in futs]
+    assert [cur.fetchone() for cur in curs] == [(i,) for i in range(10)]
+
+
+@skip_sync
+def test_submit_error(conn):
+    conn.set_autocommit(True)
+    with conn.pipeline() as p:
+        fut1 = p.submit("select 1")
+        fut2 = p.submit("select 1 / 0")
+        fut3 = p.submit("select 3")
+        with pytest.raises(e.DivisionByZero):
+            fut2
+        assert fut1.fetchone() == (1,)
+        assert fut3.fetchone() == (3,)
+
+
+@skip_sync
+def test_submit_tasks(conn):
+    conn.set_autocommit(True)
+
+    def worker(n):
+        for i in range(5):
+            cur = p.submit("select %s::int, pg_sleep(0.01)", [n * 10 + i])
+            assert cur.fetchone()[0] == n * 10 + i
+
+    with conn.pipeline() as p:
+        ts = [spawn(worker, args=(n,)) for n in range(4)]
+        gather(*ts)
+
+
+@skip_sync
+def test_submit_while_fetching(conn):
+    conn.set_autocommit(True)
+    with conn.pipeline() as p:
+        fut1 = p.submit("select pg_sleep(0.5)")
+        sleep(0.1)
+        fut2 = p.submit("select 2")
+        sleep(0.1)
+        # The second query is sent before the result of the first one arrives.
+        assert not fut1.done()
+        assert not p._submitted
+        assert len(p.result_queue) == 4
+        fut1
+        assert fut2.fetchone() == (2,)
+
+
+@skip_sync
+def test_submit_leave_block(conn):
+    conn.set_autocommit(True)
+    with conn.pipeline() as p:
+        fut = p.submit("select 1")
+    assert fut.fetchone() == (1,)
+    with pytest.raises(e.ProgrammingError):
+        p.submit("select 1")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 from operator import attrgetter
@@ -11,7 +12,7 @@ import gaussdb
 from gaussdb import errors as e
 from gaussdb import pq
 
-from .acompat import anext, is_async
+from .acompat import anext, asleep, gather, is_async, skip_sync, spawn
 
 pytestmark = [
     pytest.mark.pipeline,
@@ -358,6 +359,37 @@ async def test_executemany_no_returning(aconn):
         assert cur.nextset() is None
 
 
+@pytest.mark.parametrize(
+    "policy",
+    [{"max_batch": 10}, {"max_bytes": 100}, {"max_delay": 60}, {"max_batch": 1000}],
+)
+async def test_executemany_flush_policy(aconn, policy, monkeypatch):
+    await aconn.set_autocommit(True)
+    await aconn.execute("create temp table flushpolicy (id int)")
+    ncomms = 0
+    communicate_gen = gaussdb.AsyncPipeline._communicate_gen
+
+    def counting_communicate_gen(self):
+        nonlocal ncomms
+        ncomms += 1
+        return (yield from communicate_gen(self))
+
+    monkeypatch.setattr(
+        gaussdb.AsyncPipeline, "_communicate_gen", counting_communicate_gen
+    )
+    async with aconn.pipeline(**policy) as p, aconn.cursor() as cur:
+        assert getattr(p, list(policy)[0]) == list(policy.values())[0]
+        await cur.executemany(
+            "insert into flushpolicy (id) values (%s)", [(i,) for i in range(100)]
+        )
+        assert ncomms < 20
+        await cur.execute("select count(*) from flushpolicy")
+        assert (await cur.fetchone()) == (100,)
+    assert p.max_batch is None
+    assert p.max_bytes is None
+    assert p.max_delay is None
+
+
 @pytest.mark.crdb("skip", reason="temp tables")
 async def test_executemany_trace(aconn, trace):
     await aconn.set_autocommit(True)
@@ -620,3 +652,183 @@ async def test_execute_nextset(aconn):
         assert (await cur.fetchall()) == [(2,)]
         assert not cur.nextset()
         assert (await cur.fetchall()) == []
+
+
+async def test_auto_pipeline(aconn_cls, dsn):
+    async with await aconn_cls.connect(
+        dsn, autocommit=True, auto_pipeline=True
+    ) as conn:
+        assert conn.auto_pipeline
+        assert not conn._pipeline
+        cur1 = await conn.execute("select 1")
+        cur2 = await conn.execute("select 2")
+        assert conn.pgconn.pipeline_status
+        assert (await cur2.fetchone()) == (2,)
+        assert (await cur1.fetchone()) == (1,)
+        assert conn.pgconn.pipeline_status
+
+
+async def test_auto_pipeline_error(aconn_cls, dsn):
+    async with await aconn_cls.connect(
+        dsn, autocommit=True, auto_pipeline=True
+    ) as conn:
+        # Where the error is raised depends on when the results are received.
+        errors = []
+        for query in [
+            "create temp table autopipe (id int primary key)",
+            "insert into autopipe values (1)",
+            "insert into autopipe values (1)",
+            "insert into autopipe values (2)",
+            "select id from autopipe order by id",
+        ]:
+            try:
+                cur = await conn.execute(query)
+            except e.UniqueViolation as ex:
+                errors.append(ex)
+        try:
+            await cur.fetchall()
+        except e.UniqueViolation as ex:
+            errors.append(ex)
+        assert len(errors) == 1
+        cur = await conn.execute("select id from autopipe order by id")
+        assert (await cur.fetchall()) == [(1,), (2,)]
+
+
+async def test_auto_pipeline_transaction(aconn_cls, dsn):
+    async with await aconn_cls.connect(dsn, auto_pipeline=True) as conn:
+        await conn.execute("create temp table autopipe (id int)")
+        await conn.execute("insert into autopipe values (1)")
+        await conn.commit()
+        assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+        await conn.execute("insert into autopipe values (2)")
+        await conn.rollback()
+        cur = await conn.execute("select id from autopipe")
+        assert (await cur.fetchall()) == [(1,)]
+
+
+async def test_auto_pipeline_exit(aconn_cls, dsn):
+    async with await aconn_cls.connect(
+        dsn, autocommit=True, auto_pipeline=True
+    ) as conn:
+        await conn.execute("create temp table autopipe (id int)")
+        assert conn.pgconn.pipeline_status
+        cur = conn.cursor()
+        async with cur.copy("copy autopipe from stdin") as copy:
+            await copy.write_row([10])
+        assert not conn._pipeline
+        await cur.execute("select id from autopipe")
+        assert conn.pgconn.pipeline_status
+        assert (await cur.fetchone()) == (10,)
+
+        rows = []
+        async for row in cur.stream("select 1"):
+            rows.append(row)
+        assert rows == [(1,)]
+        assert not conn.pgconn.pipeline_status
+
+
+async def test_auto_pipeline_close_busy(aconn_cls, dsn, caplog):
+    async with await aconn_cls.connect(
+        dsn, autocommit=True, auto_pipeline=True
+    ) as conn:
+        await conn.execute("select 1")
+        assert conn._pipeline
+        async with conn.lock:
+            # Don't wait for the lock to sync: another thread or task may own it.
+            await conn.close()
+        assert conn.closed
+        assert "not synced on close" in caplog.text
+
+
+@skip_sync
+async def test_auto_pipeline_close_unregister(aconn_cls, dsn):
+    selector = getattr(asyncio.get_running_loop(), "_selector", None)
+    if selector is None:
+        pytest.skip("the event loop doesn't expose its selector")
+
+    async with await aconn_cls.connect(
+        dsn, autocommit=True, auto_pipeline=True
+    ) as conn:
+        fileno = conn.pgconn.socket
+        await conn.execute("select 1")
+        await conn.execute("select 2")
+        assert conn._pipeline
+        await conn.close()
+        # Syncing the pipeline on close doesn't leave the socket on the loop.
+        assert fileno not in selector.get_map()
+
+
+async def test_auto_pipeline_explicit(aconn_cls, dsn):
+    async with await aconn_cls.connect(
+        dsn, autocommit=True, auto_pipeline=True
+    ) as conn:
+        async with conn.pipeline():
+            await conn.execute("select 1")
+        assert not conn._pipeline
+        await conn.execute("select 1")
+        async with conn.pipeline() as p:
+            assert p._auto
+            assert p.level == 2
+        assert conn._pipeline is p
+
+
+@skip_sync
+async def test_submit(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline() as p:
+        futs = [p.submit("select %s::int", [i]) for i in range(10)]
+        curs = [await fut for fut in futs]
+    assert [(await cur.fetchone()) for cur in curs] == [(i,) for i in range(10)]
+
+
+@skip_sync
+async def test_submit_error(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline() as p:
+        fut1 = p.submit("select 1")
+        fut2 = p.submit("select 1 / 0")
+        fut3 = p.submit("select 3")
+        with pytest.raises(e.DivisionByZero):
+            await fut2
+        assert (await (await fut1).fetchone()) == (1,)
+        assert (await (await fut3).fetchone()) == (3,)
+
+
+@skip_sync
+async def test_submit_tasks(aconn):
+    await aconn.set_autocommit(True)
+
+    async def worker(n):
+        for i in range(5):
+            cur = await p.submit("select %s::int, pg_sleep(0.01)", [n * 10 + i])
+            assert (await cur.fetchone())[0] == n * 10 + i
+
+    async with aconn.pipeline() as p:
+        ts = [spawn(worker, args=(n,)) for n in range(4)]
+        await gather(*ts)
+
+
+@skip_sync
+async def test_submit_while_fetching(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline() as p:
+        fut1 = p.submit("select pg_sleep(0.5)")
+        await asleep(0.1)
+        fut2 = p.submit("select 2")
+        await asleep(0.1)
+        # The second query is sent before the result of the first one arrives.
+        assert not fut1.done()
+        assert not p._submitted
+        assert len(p.result_queue) == 4
+        await fut1
+        assert (await (await fut2).fetchone()) == (2,)
+
+
+@skip_sync
+async def test_submit_leave_block(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline() as p:
+        fut = p.submit("select 1")
+    assert (await (await fut).fetchone()) == (1,)
+    with pytest.raises(e.ProgrammingError):
+        p.submit("select 1")
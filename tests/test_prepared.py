@@ -8,6 +8,8 @@ Prepared statements tests
 import sys
 import logging
 import datetime as dt
+from time import monotonic
+from typing import Any, cast
 from decimal import Decimal
 
 import pytest
@@ -15,6 +17,7 @@ import pytest
 import gaussdb
 from gaussdb.rows import namedtuple_row
 from gaussdb.pq._debug import PGconnDebug
+from gaussdb._preparing import PrepareManager, SharedStatementCache, StatementStats
 
 
 @pytest.mark.parametrize("value", [None, 0, 3])
@@ -205,6 +208,78 @@ def test_evict_lru_deallocate(conn):
         pytest.skip(f"Database compatibility check failed: {e}")
 
 
+def test_evict_lfu(conn):
+    conn.prepared_max = 2
+    conn.prepare_threshold = 0
+    conn.prepare_policy = gaussdb.LFUPreparePolicy()
+    for i in range(3):
+        conn.execute("select 'a'")
+    for i in range(5):
+        conn.execute(f"select {i}")
+
+    assert list(conn._prepared._names) == [(b"select 'a'", ()), (b"select 4", ())]
+
+
+def test_lfu_policy():
+    policy = gaussdb.LFUPreparePolicy()
+    now = monotonic()
+    stats = [
+        gaussdb.StatementStats(b"a", (), executions=3, last_used=now),
+        gaussdb.StatementStats(b"b", (), executions=1, last_used=now),
+        gaussdb.StatementStats(b"c", (), executions=1, last_used=now),
+        gaussdb.StatementStats(b"d", (), executions=0, last_used=now),
+    ]
+    assert policy.choose_victim(stats).query == b"b"
+    assert gaussdb.PreparePolicy().choose_victim(stats).query == b"a"
+
+
+def test_lfu_policy_aging():
+    policy = gaussdb.LFUPreparePolicy(half_life=10)
+    now = monotonic()
+    stats = [
+        gaussdb.StatementStats(b"a", (), executions=3, last_used=now - 5),
+        gaussdb.StatementStats(b"b", (), executions=10, last_used=now - 30),
+        gaussdb.StatementStats(b"c", (), executions=1, last_used=now),
+    ]
+    # b counts as 10 / 2 ** 3 executions
+    assert policy.choose_victim(stats).query == b"b"
+    policy.half_life = 100
+    assert policy.choose_victim(stats).query == b"a"
+
+    with pytest.raises(ValueError):
+        gaussdb.LFUPreparePolicy(half_life=0)
+
+
+def test_prepared_stats(conn):
+    conn.prepared_timing = True
+    for i in range(7):
+        conn.execute("select %s::int", [i])
+    conn.execute("select 'a'")
+
+    stats = {s.query: s for s in conn.prepared_stats()}
+    assert len(stats) == 2
+    s = stats[b"select $1::int"]
+    assert s.executions == 7
+    assert s.prepared_executions == 2
+    assert s.name.startswith(b"_pg3_")
+    assert s.unprepared_time > 0
+    assert s.prepared_time > 0
+    s = stats[b"select 'a'"]
+    assert (s.executions, s.prepared_executions, s.name) == (1, 0, b"")
+
+    # The stats returned are a copy
+    s.executions = 100
+    assert conn.prepared_stats()[1].executions == 1
+
+
+def test_prepared_stats_no_timing(conn):
+    for i in range(2):
+        conn.execute("select 1")
+    (s,) = conn.prepared_stats()
+    assert s.executions == 2
+    assert s.unprepared_time == s.prepared_time == 0
+
+
 @pytest.mark.skipif("gaussdb._cmodule._gaussdb", reason="Python-only debug conn")
 def test_deallocate_or_close(conn, caplog):
     conn.pgconn = PGconnDebug(conn.pgconn)
@@ -226,6 +301,66 @@ def test_deallocate_or_close(conn, caplog):
         assert "DEALLOCATE" in msgs
 
 
+def test_deallocate_deferred(conn):
+    conn.prepare_threshold = 0
+    conn.prepared_max = 5
+    conn._prepared.defer_flush = True
+    for i in range(9):
+        conn.execute(f"select {i}")
+
+    assert len(conn._prepared._to_flush) == 4
+    assert len(get_prepared_statements(conn)) == 9
+
+    conn._maintain_prepared()
+    assert not conn._prepared._to_flush
+    assert len(get_prepared_statements(conn)) == 5
+
+
+def test_rotate_resized():
+    manager = PrepareManager()
+    for i in range(5):
+        key = (f"select {i}".encode(), ())
+        manager._names[key] = f"_pg3_{i}".encode()
+        manager._stats[key] = StatementStats(*key)
+
+    manager.prepared_max = 2
+    manager._rotate()
+    assert list(manager._to_flush) == [b"_pg3_0", b"_pg3_1", b"_pg3_2"]
+    assert len(manager._names) == len(manager._stats) == 2
+
+
+def test_maintain_batch():
+    calls = []
+
+    class MockConn:
+        def _deallocate(self, name):
+            calls.append(name)
+            yield from ()
+
+        def _deallocate_many(self, names):
+            calls.append(names)
+            yield from ()
+
+    conn = cast("gaussdb.Connection[Any]", MockConn())
+    manager = PrepareManager()
+    manager._to_flush.extend([b"a", b"b"])
+    list(manager.maintain_gen(conn))
+    assert calls == [[b"a", b"b"]]
+    assert not manager._to_flush
+
+    manager.defer_flush = True
+    manager._to_flush.append(b"c")
+    list(manager.maintain_gen(conn))
+    assert manager._to_flush
+
+    # DEALLOCATE ALL is never deferred
+    manager._names[b"x", ()] = b"x"
+    manager.clear()
+    list(manager.maintain_gen(conn))
+    assert calls == [[b"a", b"b"], None]
+    assert not manager._to_flush
+
+
 def test_prepared_max_none(conn):
     conn.prepared_max = 42
     assert conn.prepared_max == 42
@@ -338,6 +473,14 @@ def test_change_type_savepoint(conn):
                     raise ZeroDivisionError()
 
 
+def test_shared_cache():
+    cache = SharedStatementCache(maxsize=2)
+    for query in (b"a", b"b", b"a", b"c"):
+        cache.add((query, ()))
+    assert cache.keys() == [(b"c", ()), (b"a", ())]
+    assert cache.generation == 3
+
+
 def get_prepared_statements(conn):
     cur = conn.cursor(row_factory=namedtuple_row)
     # CRDB has 'PREPARE name AS' in the statement.
@@ -5,6 +5,8 @@ Prepared statements tests
 import sys
 import logging
 import datetime as dt
+from time import monotonic
+from typing import Any, cast
 from decimal import Decimal
 
 import pytest
@@ -12,6 +14,7 @@ import pytest
 import gaussdb
 from gaussdb.rows import namedtuple_row
 from gaussdb.pq._debug import PGconnDebug
+from gaussdb._preparing import PrepareManager, SharedStatementCache, StatementStats
 
 
 @pytest.mark.parametrize("value", [None, 0, 3])
@@ -204,6 +207,78 @@ async def test_evict_lru_deallocate(aconn):
         pytest.skip(f"Database compatibility check failed: {e}")
 
 
+async def test_evict_lfu(aconn):
+    aconn.prepared_max = 2
+    aconn.prepare_threshold = 0
+    aconn.prepare_policy = gaussdb.LFUPreparePolicy()
+    for i in range(3):
+        await aconn.execute("select 'a'")
+    for i in range(5):
+        await aconn.execute(f"select {i}")
+
+    assert list(aconn._prepared._names) == [(b"select 'a'", ()), (b"select 4", ())]
+
+
+def test_lfu_policy():
+    policy = gaussdb.LFUPreparePolicy()
+    now = monotonic()
+    stats = [
+        gaussdb.StatementStats(b"a", (), executions=3, last_used=now),
+        gaussdb.StatementStats(b"b", (), executions=1, last_used=now),
+        gaussdb.StatementStats(b"c", (), executions=1, last_used=now),
+        gaussdb.StatementStats(b"d", (), executions=0, last_used=now),
+    ]
+    assert policy.choose_victim(stats).query == b"b"
+    assert gaussdb.PreparePolicy().choose_victim(stats).query == b"a"
+
+
+def test_lfu_policy_aging():
+    policy = gaussdb.LFUPreparePolicy(half_life=10)
+    now = monotonic()
+    stats = [
+        gaussdb.StatementStats(b"a", (), executions=3, last_used=now - 5),
+        gaussdb.StatementStats(b"b", (), executions=10, last_used=now - 30),
+        gaussdb.StatementStats(b"c", (), executions=1, last_used=now),
+    ]
+    # b counts as 10 / 2 ** 3 executions
+    assert policy.choose_victim(stats).query == b"b"
+    policy.half_life = 100
+    assert policy.choose_victim(stats).query == b"a"
+
+    with pytest.raises(ValueError):
+        gaussdb.LFUPreparePolicy(half_life=0)
+
+
+async def test_prepared_stats(aconn):
+    aconn.prepared_timing = True
+    for i in range(7):
+        await aconn.execute("select %s::int", [i])
+    await aconn.execute("select 'a'")
+
+    stats = {s.query: s for s in aconn.prepared_stats()}
+    assert len(stats) == 2
+    s = stats[b"select $1::int"]
+    assert s.executions == 7
+    assert s.prepared_executions == 2
+    assert s.name.startswith(b"_pg3_")
+    assert s.unprepared_time > 0
+    assert s.prepared_time > 0
+    s = stats[b"select 'a'"]
+    assert (s.executions, s.prepared_executions, s.name) == (1, 0, b"")
+
+    # The stats returned are a copy
+    s.executions = 100
+    assert aconn.prepared_stats()[1].executions == 1
+
+
+async def test_prepared_stats_no_timing(aconn):
+    for i in range(2):
+        await aconn.execute("select 1")
+    (s,) = aconn.prepared_stats()
+    assert s.executions == 2
+    assert s.unprepared_time == s.prepared_time == 0
+
+
 @pytest.mark.skipif("gaussdb._cmodule._gaussdb", reason="Python-only debug conn")
 async def test_deallocate_or_close(aconn, caplog):
     aconn.pgconn = PGconnDebug(aconn.pgconn)
@@ -225,6 +300,66 @@ async def test_deallocate_or_close(aconn, caplog):
         assert "DEALLOCATE" in msgs
 
 
+async def test_deallocate_deferred(aconn):
+    aconn.prepare_threshold = 0
+    aconn.prepared_max = 5
+    aconn._prepared.defer_flush = True
+    for i in range(9):
+        await aconn.execute(f"select {i}")
+
+    assert len(aconn._prepared._to_flush) == 4
+    assert len(await get_prepared_statements(aconn)) == 9
+
+    await aconn._maintain_prepared()
+    assert not aconn._prepared._to_flush
+    assert len(await get_prepared_statements(aconn)) == 5
+
+
+def test_rotate_resized():
+    manager = PrepareManager()
+    for i in range(5):
+        key = (f"select {i}".encode(), ())
+        manager._names[key] = f"_pg3_{i}".encode()
+        manager._stats[key] = StatementStats(*key)
+
+    manager.prepared_max = 2
+    manager._rotate()
+    assert list(manager._to_flush) == [b"_pg3_0", b"_pg3_1", b"_pg3_2"]
+    assert len(manager._names) == len(manager._stats) == 2
+
+
+def test_maintain_batch():
+    calls = []
+
+    class MockConn:
+        def _deallocate(self, name):
+            calls.append(name)
+            yield from ()
+
+        def _deallocate_many(self, names):
+            calls.append(names)
+            yield from ()
+
+    conn = cast("gaussdb.AsyncConnection[Any]", MockConn())
+    manager = PrepareManager()
+    manager._to_flush.extend([b"a", b"b"])
+    list(manager.maintain_gen(conn))
+    assert calls == [[b"a", b"b"]]
+    assert not manager._to_flush
+
+    manager.defer_flush = True
+    manager._to_flush.append(b"c")
+    list(manager.maintain_gen(conn))
+    assert manager._to_flush
+
+    # DEALLOCATE ALL is never deferred
+    manager._names[b"x", ()] = b"x"
+    manager.clear()
+    list(manager.maintain_gen(conn))
+    assert calls == [[b"a", b"b"], None]
+    assert not manager._to_flush
+
+
 def test_prepared_max_none(conn):
     conn.prepared_max = 42
     assert conn.prepared_max == 42
@@ -341,6 +476,14 @@ async def test_change_type_savepoint(aconn):
                     raise ZeroDivisionError()
 
 
+def test_shared_cache():
+    cache = SharedStatementCache(maxsize=2)
+    for query in (b"a", b"b", b"a", b"c"):
+        cache.add((query, ()))
+    assert cache.keys() == [(b"c", ()), (b"a", ())]
+    assert cache.generation == 3
+
+
 async def get_prepared_statements(aconn):
     cur = aconn.cursor(row_factory=namedtuple_row)
     # CRDB has 'PREPARE name AS' in the statement.
@@ -1,9 +1,11 @@
+from typing import Any
+
 import pytest
 
 import gaussdb
 from gaussdb import pq
 from gaussdb.adapt import PyFormat, Transformer
-from gaussdb._queries import GaussDBQuery, _split_query
+from gaussdb._queries import GaussDBQuery, _split_query, batch_values, unnest_values
 
 
 @pytest.mark.parametrize(
@@ -160,3 +162,216 @@ def test_pq_query_badprog(query, params):
     pq = GaussDBQuery(Transformer())
     with pytest.raises(gaussdb.ProgrammingError):
         pq.convert(query, params)
+
+
+@pytest.mark.parametrize(
+    "query, want",
+    [
+        (
+            b"insert into t values (%s, %s)",
+            b"insert into t values (%s, %s), (%s, %s)",
+        ),
+        (
+            b"INSERT INTO t (a, b) VALUES(%t, lower(%b)) ON CONFLICT DO NOTHING",
+            b"INSERT INTO t (a, b) VALUES(%t, lower(%b)), (%t, lower(%b))"
+            b" ON CONFLICT DO NOTHING",
+        ),
+        (
+            b"insert into t values (%s, '(%%', %s) returning a",
+            b"insert into t values (%s, '(%%', %s), (%s, '(%%', %s) returning a",
+        ),
+        (
+            b"insert into t values (%(a)s, %(b)s, %(a)s) returning '%%)'",
+            b"insert into t values (%s, %s, %s), (%s, %s, %s) returning '%%)'",
+        ),
+    ],
+)
+def test_batch_values(query, want):
+    records: list[Any] = [{"a": 1, "b": 2}] * 2 if b"%(" in query else [[1, 2]] * 2
+    ((bquery, params),) = batch_values(query, records, 2, "utf-8")
+    assert bquery == want
+    assert params == [1, 2, 1] * 2 if b"%(" in query else [1, 2] * 2
+
+
+def test_batch_values_sizes():
+    batches = list(batch_values(b"values (%s)", [[i] for i in range(29)], 8, "ascii"))
+    assert [len(params) for _, params in batches] == [8, 8, 8, 4, 1]
+    assert [p for _, params in batches for p in params] == list(range(29))
+    # Batches of the same size use the same query object
+    assert batches[0][0] is batches[1][0] is batches[2][0]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        b"select %s",
+        b"insert into t values (1) returning %s",
+        b"insert into t values (%s) returning %s",
+        b"insert into t values (%s",
+        b"insert into t values (%s, ')'",
+        b"insert into t values (%s), (%s)",
+    ],
+)
+def test_batch_values_badprog(query):
+    with pytest.raises(gaussdb.ProgrammingError):
+        list(batch_values(query, [[1]], 2, "utf-8"))
+
+
+def test_batch_values_too_many_params():
+    with pytest.raises(gaussdb.ProgrammingError, match="batch_size"):
+        list(batch_values(b"values (%s, %s)", [[1, 2]], 40000, "utf-8"))
+
+
+@pytest.mark.parametrize(
+    "query, want",
+    [
+        (
+            b"insert into t values (%s, %t)",
+            b"insert into t select * from unnest(%b, %t)",
+        ),
+        (
+            b"INSERT INTO t (a, b) VALUES (%s::int, %s :: numeric(10, 2))"
+            b" ON CONFLICT (a) DO NOTHING",
+            b"INSERT INTO t (a, b) select * from unnest(%b::int[],"
+            b" %b::numeric(10, 2)[]) ON CONFLICT (a) DO NOTHING",
+        ),
+        (
+            b"insert into t values (%(a)s::timestamp with time zone, %(b)s)",
+            b"insert into t select * from unnest("
+            b"%b::timestamp with time zone[], %b)",
+        ),
+    ],
+)
+def test_unnest_values(query, want):
+    records: list[Any] = (
+        [{"a": 1, "b": 2}, {"a": 3, "b": 4}] if b"%(" in query else [[1, 2], [3, 4]]
+    )
+    ((bquery, params),) = unnest_values(query, records, None, "utf-8")
+    assert bquery == want
+    assert params == [[1, 3], [2, 4]]
+
+
+def test_unnest_values_batch_size():
+    batches = list(unnest_values(b"values (%s)", [[i] for i in range(10)], 4, "ascii"))
+    assert [params for _, params in batches] == [
+        [[0, 1, 2, 3]],
+        [[4, 5, 6, 7]],
+        [[8, 9]],
+    ]
+    assert batches[0][0] is batches[1][0] is batches[2][0]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        b"select %s",
+        b"insert into t values (%s, lower(%s))",
+        b"insert into t values (1, %s)",
+        b"insert into t values (%s, 1)",
+        b"insert into t values (%s::int[], %s)",
+    ],
+)
+def test_unnest_values_badprog(query):
+    with pytest.raises(gaussdb.ProgrammingError):
+        list(unnest_values(query, [[1, 2]], None, "utf-8"))
+
+
+@pytest.fixture
+def query_cache():
+    cache = gaussdb._queries._query2pg
+    saved = (cache.maxsize, cache.max_bytes, cache.max_length, cache.max_params)
+    cache.cache_clear()
+    yield cache
+    maxsize, max_bytes, max_length, max_params = saved
+    gaussdb.set_query_cache(
+        maxsize=maxsize,
+        max_bytes=max_bytes,
+        max_length=max_length,
+        max_params=max_params,
+    )
+
+
+def test_query_cache_long_query(query_cache):
+    query = f"select %s -- {'x' * 5000}".encode()
+    for i in range(3):
+        GaussDBQuery(Transformer()).convert(query, [i])
+    assert query_cache.cache_info()[:2] == (2, 1)
+    # The long query is not a key of the cache
+    assert all(query not in key for key in query_cache._cache)
+
+
+def test_query_cache_max_bytes(query_cache):
+    gaussdb.set_query_cache(max_bytes=25_000)
+    queries = [f"select %s + {i} -- {'x' * 5000}" for i in range(3)]
+    for query in queries:
+        GaussDBQuery(Transformer()).convert(query, [1])
+    # Only two queries fit in the cache
+    assert query_cache.cache_info().currsize == 2
+    assert query_cache._nbytes <= 25_000
+    GaussDBQuery(Transformer()).convert(queries[0], [1])
+    assert query_cache.cache_info()[:2] == (0, 4)
+
+    # A query longer than the cache is not cached
+    GaussDBQuery(Transformer()).convert(f"select %s -- {'x' * 20_000}", [1])
+    assert query_cache.cache_info().currsize == 2
+
+    gaussdb.set_query_cache(max_bytes=15_000)
+    assert query_cache.cache_info().currsize == 1
+    GaussDBQuery(Transformer()).convert(queries[0], [1])
+    assert query_cache.cache_info()[:2] == (1, 4)
+
+
+def test_set_query_cache(query_cache):
+    gaussdb.set_query_cache(maxsize=2, max_params=1)
+    for i in range(4):
+        GaussDBQuery(Transformer()).convert(f"select %s + {i}", [i])
+    GaussDBQuery(Transformer()).convert("select %s + 3", [3])
+    GaussDBQuery(Transformer()).convert("select %s, %s", [1, 2])
+    info = query_cache.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 4, 2, 2)
+    assert gaussdb.query_cache_info().hits >= 1
+
+    gaussdb.set_query_cache(maxsize=0)
+    GaussDBQuery(Transformer()).convert("select %s + 3", [3])
+    assert query_cache.cache_info().currsize == 0
+
+
+def test_query_cache_info(query_cache):
+    gaussdb.set_query_cache(maxsize=10)
+    GaussDBQuery(Transformer()).convert("select %s", [1])
+    info = gaussdb.query_cache_info()
+    assert info.maxsize == 10
+    assert info.currsize >= 1
+
+
+@pytest.mark.parametrize("param", ["maxsize", "max_bytes", "max_length", "max_params"])
+def test_set_query_cache_bad(query_cache, param):
+    with pytest.raises(ValueError, match=param):
+        gaussdb.set_query_cache(**{param: -1})
+    assert query_cache.maxsize >= 0
+
+
+def test_compiled():
+    bquery = b"select %(a)s, %(b)t"
+    converted = gaussdb._queries._query2pg_nocache(bquery, "utf-8")
+    pq = GaussDBQuery(Transformer())
+    pq.convert(gaussdb.sql.Compiled(bquery, "utf-8", converted), {"a": 1, "b": "x"})
+    assert pq.query == b"select $1, $2"
+    assert pq.params == [b"\x00\x01", b"x"]
+
+
+def test_compiled_dumpers():
+    tx = Transformer()
+    bquery = b"select %(a)s, %(b)s"
+    converted = gaussdb._queries._query2pg_nocache(bquery, "utf-8")
+    dumpers = [tx.get_dumper_by_oid(20, gaussdb.pq.Format.TEXT)] * 2
+    query = gaussdb.sql.Compiled(bquery, "utf-8", converted, dumpers)
+    pq = GaussDBQuery(tx)
+    pq.convert(query, {"a": 1, "b": None})
+    assert pq.query == b"select $1, $2"
+    assert pq.params == [b"1", None]
+    assert pq.types == (20, 20)
+
+    # Without parameters the query is not converted
+    pq.convert(query, None)
+    assert pq.query == bquery
@@ -112,9 +112,113 @@ def test_scalar_row(conn):
         cur.execute("select")
 
 
+def test_slots_row(conn):
+    rows._make_slots_row.cache_clear()
+    cur = conn.cursor(row_factory=rows.slots_row)
+    cur.execute("select 'bob' as name, 3 as id, 4 as class")
+    (row,) = cur.fetchall()
+    assert isinstance(row, rows.SlotsRow)
+    assert not hasattr(row, "__dict__")
+    assert row.name == row["name"] == "bob"
+    assert row.id == row["id"] == 3
+    assert row.class_ == row["class"] == 4
+    assert row == {"name": "bob", "id": 3, "class": 4}
+    assert list(row) == ["name", "id", "class"]
+    assert repr(row) == "Row(name='bob', id=3, class_=4)"
+
+    cur2 = conn.cursor(row_factory=rows.slots_row)
+    cur2.execute("select 'alice' as name, 4 as id, 5 as class")
+    assert type(cur2.fetchone()) is type(row)
+    ci = rows._make_slots_row.cache_info()
+    assert ci.hits == 1 and ci.misses == 1
+
+
+def test_slots_row_names():
+    cls = rows._make_slots_row("utf8", b"a", b"keys", b"1x", b"a", b"_b")
+    row = cls([1, 2, 3, 4, 5])
+    assert cls._fields == ("a", "keys_", "f1x", "a_", "f_b")
+    assert row.keys_ == 2
+    assert row.f1x == 3
+    assert dict(row) == {"a": 4, "keys": 2, "1x": 3, "_b": 5}
+    assert list(row.keys()) == ["a", "keys", "1x", "_b"]
+
+    empty = rows._make_slots_row("utf8")
+    assert len(empty([])) == 0
+
+
+def test_lazy_row(conn):
+    from gaussdb.types.string import TextLoader
+
+    loaded = []
+
+    class CountingLoader(TextLoader):
+        def load(self, data):
+            loaded.append(bytes(data))
+            return super().load(data)
+
+    cur = conn.cursor(row_factory=rows.lazy_row)
+    cur.adapters.register_loader("text", CountingLoader)
+    cur.execute(
+        "select 'a'::text, null::text, 'c'::text union all select 'd', 'e', 'f'"
+    )
+    row1, row2 = cur.fetchall()
+    assert isinstance(row1, rows.LazyRow)
+    assert len(row1) == 3
+    assert not loaded
+
+    assert row1[2] == "c"
+    assert row1[-1] == "c"
+    assert row1[1] is None
+    assert loaded == [b"c"]
+
+    assert row2 == ("d", "e", "f")
+    assert row2[1:] == ("e", "f")
+    assert loaded == [b"c", b"d", b"e", b"f"]
+    with pytest.raises(IndexError):
+        row2[3]
+
+    assert row1 == ("a", None, "c")
+    assert repr(row1) == "LazyRow('a', None, 'c')"
+    assert loaded[-1] == b"a"
+
+
+def test_lazy_row_one(conn):
+    cur = conn.cursor(row_factory=rows.lazy_row)
+    cur.execute("select 1 as a, 'hello' as b")
+    row = cur.fetchone()
+    assert row == (1, "hello")
+    assert list(row) == [1, "hello"]
+    assert hash(row) == hash((1, "hello"))
+    assert cur.fetchone() is None
+
+
+def test_result_row_maker(conn):
+    class RawRowMaker:
+        def __call__(self, values):
+            assert False, "from_result() should be used"
+
+        def from_result(self, pgresult, row, loaders):
+            return (row, pgresult.get_value(row, 0), len(loaders))
+
+    cur = conn.cursor(row_factory=lambda cur: RawRowMaker())
+    cur.execute("select 'a'::text union all select 'b'")
+    assert cur.fetchone() == (0, b"a", 1)
+    assert cur.fetchall() == [(1, b"b", 1)]
+
+
+def test_make_lazy_row():
+    row = rows.make_lazy_row([1, None, "x"])
+    assert isinstance(row, rows.LazyRow)
+    assert row == (1, None, "x")
+    assert row[::-1] == ("x", None, 1)
+
+
 @pytest.mark.parametrize(
     "factory",
-    "tuple_row dict_row namedtuple_row class_row args_row kwargs_row".split(),
+    """
+    tuple_row dict_row namedtuple_row class_row args_row kwargs_row
+    lazy_row slots_row
+    """.split(),
 )
 def test_no_result(factory, conn):
     cur = conn.cursor(row_factory=factory_from_name(factory))
@@ -125,7 +229,8 @@ def test_no_result(factory, conn):
 
 @pytest.mark.crdb_skip("no col query")
 @pytest.mark.parametrize(
-    "factory", "tuple_row dict_row namedtuple_row args_row".split()
+    "factory",
+    "tuple_row dict_row namedtuple_row args_row lazy_row slots_row".split(),
 )
 def test_no_column(factory, conn):
     cur = conn.cursor(row_factory=factory_from_name(factory))
@@ -1,7 +1,9 @@
 import sys
+import asyncio
 import time
-import select  # noqa: used in pytest.mark.skipif
+import select
 import socket
+import threading
 
 import pytest
 
@@ -192,3 +194,199 @@ async def test_wait_async_bad(pgconn):
     pgconn.finish()
     with pytest.raises(gaussdb.OperationalError):
         await waiting.wait_async(gen, socket)
+
+
+@pytest.mark.anyio
+@skip_if_not_linux
+async def test_async_waiter_register_once(monkeypatch):
+    loop = asyncio.get_running_loop()
+    calls = []
+    add_reader = loop.add_reader
+
+    def add_reader_(*args):
+        calls.append(args)
+        add_reader(*args)
+
+    monkeypatch.setattr(loop, "add_reader", add_reader_)
+
+    def gen():
+        for i in range(10):
+            r = yield waiting.Wait.R
+            assert r & waiting.Ready.R
+            assert rsock.recv(1) == b"x"
+        return i
+
+    waiter = waiting.AsyncWaiter()
+    rsock, wsock = socket.socketpair()
+    with rsock, wsock:
+        for _ in range(3):
+            wsock.send(b"x" * 10)
+            assert await waiter.wait(gen(), rsock.fileno()) == 9
+        assert len(calls) == 1
+
+        # A notification while not waiting drops the registration.
+        wsock.send(b"x")
+        await asyncio.sleep(0.01)
+        assert not waiter._reading
+        waiter.close()
+
+
+@pytest.mark.anyio
+@skip_if_not_linux
+async def test_async_waiter_fd_reused():
+    def gen(sock):
+        r = yield waiting.Wait.R
+        assert r & waiting.Ready.R
+        return sock.recv(1)
+
+    waiter1 = waiting.AsyncWaiter()
+    waiter2 = waiting.AsyncWaiter()
+    rsock, wsock = socket.socketpair()
+    with rsock, wsock:
+        wsock.send(b"x")
+        assert await waiter1.wait(gen(rsock), rsock.fileno()) == b"x"
+        assert waiter1._reading
+
+        # Another waiter takes over the same fd number, as if the socket of
+        # the first one was closed and the number reused.
+        wsock.send(b"y")
+        assert await waiter2.wait(gen(rsock), rsock.fileno()) == b"y"
+
+        # Closing the first waiter doesn't affect the second one.
+        waiter1.close()
+        assert waiter2._owns(waiting.Ready.R)
+        wsock.send(b"z")
+        assert await waiter2.wait(gen(rsock), rsock.fileno(), 5.0) == b"z"
+        waiter2.close()
+        assert not waiter2._owns(waiting.Ready.R)
+
+
+@pytest.mark.anyio
+async def test_async_waiter_interrupt():
+    def gen():
+        r = yield waiting.Wait.R
+        assert not r
+        return 1
+
+    waiter = waiting.AsyncWaiter()
+    rsock, wsock = socket.socketpair()
+    with rsock, wsock:
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, waiter.interrupt)
+        t0 = time.time()
+        assert await waiter.wait(gen(), rsock.fileno(), 5.0) == 1
+        assert time.time() - t0 < 1.0
+        waiter.close()
+
+
+@pytest.mark.anyio
+@skip_if_not_linux
+async def test_async_waiter_close_threadsafe():
+    rsock, wsock = socket.socketpair()
+    with rsock, wsock:
+
+        def gen():
+            yield waiting.Wait.R
+            return rsock.recv(1)
+
+        waiter = waiting.AsyncWaiter()
+        wsock.send(b"x")
+        await waiter.wait(gen(), rsock.fileno())
+        thread = threading.Thread(target=waiter.close_threadsafe)
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0)
+        assert not waiter._reading
+        assert waiter._loop is None
+
+
+@skip_if_not_linux
+def test_wait_many():
+    def gen(sock, n):
+        for i in range(n):
+            r = yield waiting.Wait.R
+            assert r & waiting.Ready.R
+            assert sock.recv(1) == b"x"
+        return n
+
+    pairs = [socket.socketpair() for i in range(3)]
+    try:
+        gens = [(gen(r, n), r.fileno()) for n, (r, w) in enumerate(pairs, 1)]
+        for r, w in pairs:
+            w.send(b"x" * 3)
+        assert sorted(waiting.wait_many(gens)) == [(0, 1), (1, 2), (2, 3)]
+    finally:
+        for r, w in pairs:
+            r.close()
+            w.close()
+
+
+@skip_if_not_linux
+def test_wait_many_error():
+    def gen(sock, fail):
+        yield waiting.Wait.R
+        if fail:
+            raise gaussdb.OperationalError("boom")
+        return sock.recv(1)
+
+    pairs = [socket.socketpair() for i in range(3)]
+    try:
+        gens = [(gen(r, i == 0), r.fileno()) for i, (r, w) in enumerate(pairs)]
+        for r, w in pairs:
+            w.send(b"x")
+        got = []
+        with pytest.raises(gaussdb.OperationalError, match="boom"):
+            for item in waiting.wait_many(gens):
+                got.append(item)
+        assert sorted(got) == [(1, b"x"), (2, b"x")]
+    finally:
+        for r, w in pairs:
+            r.close()
+            w.close()
+
+
+def test_wait_many_conns(dsn):
+    pgconns = [gaussdb.pq.PGconn.connect(dsn.encode()) for i in range(3)]
+    try:
+        gens = []
+        for i, pgconn in enumerate(pgconns):
+            pgconn.send_query(b"select %d" % i)
+            gens.append((generators.execute(pgconn), pgconn.socket))
+        got = {i: res[0].get_value(0, 0) for i, res in waiting.wait_many(gens)}
+        assert got == {0: b"0", 1: b"1", 2: b"2"}
+    finally:
+        for pgconn in pgconns:
+            pgconn.finish()
+
+
+@pytest.mark.skipif("not hasattr(select, 'poll')")
+def test_waiter_reuse_poll(monkeypatch):
+    monkeypatch.setattr(waiting, "wait", waiting.wait_poll)
+    polls = []
+    poll = select.poll
+
+    def poll_():
+        polls.append(1)
+        return poll()
+
+    monkeypatch.setattr(select, "poll", poll_)
+
+    def gen(sock):
+        for i in range(3):
+            r = yield waiting.Wait.W
+            assert r & waiting.Ready.W
+            sock.send(b"x")
+            r = yield waiting.Wait.R
+            assert r & waiting.Ready.R
+            assert sock.recv(1) == b"y"
+        return i
+
+    waiter = waiting.Waiter()
+    lsock, rsock = socket.socketpair()
+    with lsock, rsock:
+        for _ in range(3):
+            rsock.send(b"y" * 3)
+            assert waiter.wait(gen(lsock), lsock.fileno(), 1.0) == 2
+            assert rsock.recv(10) == b"xxx"
+        assert len(polls) == 1
+        waiter.close()
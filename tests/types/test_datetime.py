@@ -5,6 +5,9 @@ import pytest
 
 from gaussdb import DataError, pq, sql
 from gaussdb.adapt import PyFormat
+from gaussdb.types import TypeInfo
+from gaussdb.types import datetime as datetime_
+from gaussdb.types.datetime import DateLoader, TimestampLoader, TimestamptzLoader
 
 crdb_skip_datestyle = pytest.mark.crdb("skip", reason="set datestyle/intervalstyle")
 crdb_skip_negative_interval = pytest.mark.crdb("skip", reason="negative interval")
@@ -127,6 +130,15 @@ class TestDate:
         except Exception as e:
             pytest.skip(f"Database compatibility check failed: {e}")
 
+    @pytest.mark.parametrize(
+        "data",
+        [b"2000-01-02", b"0001-01-01", b"9999-12-31", b"2000-02-30", b"infinity"]
+        + [b"-infinity", b"10000-01-01", b"2000-01-02 BC"],
+    )
+    def test_load_iso_fast_path(self, data):
+        # No connection: DateStyle is ISO
+        assert_load_iso(DateLoader, data)
+
     @pytest.mark.parametrize("val, msg", overflow_samples)
     def test_load_overflow_message_binary(self, conn, val, msg):
         try:
@@ -297,6 +309,12 @@ class TestDatetime:
             cur.fetchone()[0]
         assert msg in str(excinfo.value)
 
+    @pytest.mark.parametrize("fmt_out", pq.Format)
+    def test_load_smalldatetime(self, conn, fmt_out):
+        cur = conn.cursor(binary=fmt_out)
+        cur.execute("select '2020-03-04 12:34:56'::smalldatetime")
+        assert cur.fetchone()[0] == dt.datetime(2020, 3, 4, 12, 35)
+
     @crdb_skip_datestyle
     def test_load_all_month_names(self, conn):
         cur = conn.cursor(binary=False)
@@ -306,6 +324,15 @@ class TestDatetime:
             cur.execute("select %s", [d])
             assert cur.fetchone()[0] == d
 
+    @pytest.mark.parametrize(
+        "data",
+        [b"2000-01-02 03:04:05", b"2000-01-02 03:04:05.5"]
+        + [b"2000-01-02 03:04:05.123456", b"0001-01-01 00:00:00"]
+        + [b"2000-02-30 00:00:00", b"infinity", b"2000-01-02 03:04:05 BC"],
+    )
+    def test_load_iso_fast_path(self, data):
+        assert_load_iso(TimestampLoader, data)
+
 
 class TestDateTimeTz:
     @pytest.mark.parametrize(
@@ -529,6 +556,16 @@ class TestDateTimeTz:
             )
             got = cur.fetchone()[0]
 
+    @pytest.mark.parametrize(
+        "data",
+        [b"2000-01-02 03:04:05+02", b"2000-01-02 03:04:05.5-07"]
+        + [b"2000-01-02 03:04:05+05:30", b"1900-01-02 03:04:05+00:09:21"]
+        + [b"0001-01-01 00:00:00+05", b"9999-12-31 23:59:59.999999-05"]
+        + [b"2000-02-30 00:00:00+00", b"infinity"],
+    )
+    def test_load_iso_fast_path(self, data, monkeypatch):
+        assert_load_iso(TimestamptzLoader, data, monkeypatch)
+
 
 class TestTime:
     @pytest.mark.parametrize(
@@ -791,11 +828,42 @@ class TestInterval:
         assert rec[1] == "foo bar"
 
 
+class TestYear:
+    @pytest.mark.parametrize("fmt_out", pq.Format)
+    def test_load_year(self, conn, fmt_out):
+        if not TypeInfo.fetch(conn, "year"):
+            pytest.skip("year type not available")
+        cur = conn.cursor(binary=fmt_out)
+        cur.execute("select '2020'::year")
+        assert cur.fetchone()[0] == 2020
+
+
 #
 # Support
 #
 
 
+def assert_load_iso(cls, data, monkeypatch=None):
+    """Check that a loader returns the same with and without the ISO fast path."""
+
+    def load(loader):
+        try:
+            return loader.load(data)
+        except DataError as ex:
+            return str(ex)
+
+    got = load(cls(0))
+    slow = cls(0)
+    if monkeypatch:
+        monkeypatch.setattr(datetime_, "_fromisoformat_pg", False)
+    else:
+        slow._iso = False
+    want = load(slow)
+    assert got == want
+    if isinstance(want, dt.datetime) and want.tzinfo:
+        assert got.utcoffset() == want.utcoffset()
+
+
 def as_date(s):
     return dt.date(*map(int, s.split(","))) if "," in s else getattr(dt.date, s)
 
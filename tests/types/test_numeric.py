@@ -11,6 +11,9 @@ from gaussdb import pq, sql
 from gaussdb.abc import Buffer
 from gaussdb.adapt import PyFormat, Transformer
 from gaussdb.types.numeric import FloatLoader, Int8, Int8BinaryDumper, Int8Dumper
+from gaussdb.types.numeric import NumericBinaryLoader, NumericFloatBinaryLoader
+from gaussdb.types.numeric import NumericIntBinaryLoader, NumericIntLoader
+from gaussdb.types.numeric import dump_decimal_to_numeric_binary
 
 from ..fix_crdb import is_crdb
 
@@ -152,6 +155,13 @@ def test_quote_int(conn, val, expr):
         ("-9223372036854775808", "bigint", -9223372036854775808),
         ("9223372036854775807", "bigint", 9223372036854775807),
         ("4294967295", "oid", 4294967295),
+        ("255", "int1", 255),
+        ("-170141183460469231731687303715884105728", "int16", -(2**127)),
+        ("170141183460469231731687303715884105727", "int16", 2**127 - 1),
+        ("255", "uint1", 255),
+        ("65535", "uint2", 65535),
+        ("4294967295", "uint4", 4294967295),
+        ("18446744073709551615", "uint8", 18446744073709551615),
     ],
 )
 @pytest.mark.parametrize("fmt_out", pq.Format)
@@ -488,6 +498,69 @@ def test_load_numeric_binary(conn, expr):
             assert str(res) == str(val)
 
 
+@pytest.mark.parametrize(
+    "val",
+    ["0", "0.00", "1", "-1", "123.45", "-0.001", "1e30", "1.5e-30", "1E+4"]
+    + ["10000", "0.0001", "-12.3400", "1.0e-1000", "1e1000", "nan", "inf", "-inf"]
+    + ["12345678901234567890.123456789", "1000000000000000000000000000.001"],
+)
+def test_load_numeric_binary_no_db(val):
+    val = Decimal(val)
+    data = dump_decimal_to_numeric_binary(val)
+    got = NumericBinaryLoader(0).load(data)
+    if not val.is_finite():
+        assert str(got) == str(val)
+    else:
+        assert got == val
+        assert got.as_tuple().exponent == min(val.as_tuple().exponent, 0)
+
+    fgot = NumericFloatBinaryLoader(0).load(data)
+    assert type(fgot) is float
+    if val.is_nan():
+        assert isnan(fgot)
+    else:
+        assert fgot == float(val)
+
+    igot = NumericIntBinaryLoader(0).load(data)
+    if got.is_finite() and got.as_tuple().exponent == 0:
+        assert type(igot) is int
+        assert igot == val
+    else:
+        assert type(igot) is Decimal
+        assert str(igot) == str(got)
+    assert str(NumericIntLoader(0).load(str(got).encode())) == str(igot)
+
+
+@pytest.mark.parametrize("fmt_out", pq.Format)
+def test_numeric_as_int(conn, fmt_out):
+    cur = conn.cursor(binary=fmt_out)
+    cur.adapters.register_loader("numeric", NumericIntLoader)
+    cur.adapters.register_loader("numeric", NumericIntBinaryLoader)
+    cur.execute(
+        "select 12345678901234567890::numeric(20, 0), -10000::numeric(8, 0),"
+        " 1.50::numeric(8, 2), 'nan'::numeric"
+    )
+    rec = cur.fetchone()
+    assert rec[:3] == (12345678901234567890, -10000, Decimal("1.50"))
+    assert type(rec[0]) is type(rec[1]) is int
+    assert type(rec[2]) is Decimal
+    assert rec[3].is_nan()
+
+
+@pytest.mark.parametrize("val", ["0", "0.000000000000000000001", "-12.5", "nan"])
+def test_numeric_as_float_binary(conn, val):
+    cur = conn.cursor(binary=True)
+    cur.adapters.register_loader("numeric", NumericFloatBinaryLoader)
+    val = Decimal(val)
+    cur.execute("select %s::numeric", (val,))
+    result = cur.fetchone()[0]
+    assert isinstance(result, float)
+    if val.is_nan():
+        assert isnan(result)
+    else:
+        assert result == float(val)
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize("fmt_out", pq.Format)
 def test_load_numeric_exhaustive(conn, fmt_out):
@@ -574,7 +647,12 @@ def test_minus_minus_quote(conn, pgtype):
     assert result == 1
 
 
-@pytest.mark.parametrize("wrapper", "Int2 Int4 Int8 Oid Float4 Float8".split())
+_wrappers = (
+    "Int1 Int2 Int4 Int8 Int16 UInt1 UInt2 UInt4 UInt8 Oid Float4 Float8"
+).split()
+
+
+@pytest.mark.parametrize("wrapper", _wrappers)
 @pytest.mark.parametrize("fmt_in", PyFormat)
 def test_dump_wrapper(conn, wrapper, fmt_in):
     wrapper = getattr(gaussdb.types.numeric, wrapper)
@@ -586,7 +664,7 @@ def test_dump_wrapper(conn, wrapper, fmt_in):
     assert rec[0], rec[1]
 
 
-@pytest.mark.parametrize("wrapper", "Int2 Int4 Int8 Oid Float4 Float8".split())
+@pytest.mark.parametrize("wrapper", _wrappers)
 def test_dump_wrapper_oid(wrapper):
     wrapper = getattr(gaussdb.types.numeric, wrapper)
     base = wrapper.__mro__[1]
@@ -596,8 +674,34 @@ def test_dump_wrapper_oid(wrapper):
     assert repr(wrapper(n)) == f"{wrapper.__name__}({n})"
 
 
+@pytest.mark.parametrize(
+    "wrapper, val",
+    [
+        ("Int1", 255),
+        ("Int16", -(2**127)),
+        ("Int16", 2**127 - 1),
+        ("UInt1", 255),
+        ("UInt2", 2**16 - 1),
+        ("UInt4", 2**32 - 1),
+        ("UInt8", 2**64 - 1),
+    ],
+)
+@pytest.mark.parametrize("fmt_in", [PyFormat.TEXT, PyFormat.BINARY])
+def test_roundtrip_wrapper_no_db(wrapper, val, fmt_in):
+    wrapper = getattr(gaussdb.types.numeric, wrapper)
+    tx = Transformer()
+    dumper = tx.get_dumper(wrapper(val), fmt_in)
+    assert dumper.oid == gaussdb.gaussdb_.types[wrapper.__name__.lower()].oid
+    loader = tx.get_loader(dumper.oid, dumper.format)
+    data = dumper.dump(wrapper(val))
+    assert data is not None
+    got = loader.load(data)
+    assert got == val
+    assert type(got) is int
+
+
 @pytest.mark.crdb("skip", reason="all types returned as bigint? TODOCRDB")
-@pytest.mark.parametrize("wrapper", "Int2 Int4 Int8 Oid Float4 Float8".split())
+@pytest.mark.parametrize("wrapper", _wrappers)
 @pytest.mark.parametrize("fmt_in", PyFormat)
 def test_repr_wrapper(conn, wrapper, fmt_in):
     wrapper = getattr(gaussdb.types.numeric, wrapper)
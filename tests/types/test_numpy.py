@@ -87,16 +87,16 @@ def test_special_values(name, equiv):
         ("longlong", 2**63 - 1, f"'{2**63 - 1}'::int8"),
         ("bool_", True, "'t'::bool"),
         ("bool_", False, "'f'::bool"),
-        ("uint8", 0, "'0'::int2"),
-        ("uint8", 255, "'255'::int2"),
-        ("uint16", 0, "'0'::int4"),
-        ("uint16", 65_535, "'65535'::int4"),
-        ("uint32", 0, "'0'::int8"),
-        ("uint32", (2**32 - 1), f"'{2**32 - 1}'::int8"),
-        ("uint64", 0, "'0'::numeric"),
-        ("uint64", (2**64 - 1), f"'{2**64 - 1}'::numeric"),
-        ("ulonglong", 0, "'0'::numeric"),
-        ("ulonglong", (2**64 - 1), f"'{2**64 - 1}'::numeric"),
+        ("uint8", 0, "'0'::uint1"),
+        ("uint8", 255, "'255'::uint1"),
+        ("uint16", 0, "'0'::uint2"),
+        ("uint16", 65_535, "'65535'::uint2"),
+        ("uint32", 0, "'0'::uint4"),
+        ("uint32", (2**32 - 1), f"'{2**32 - 1}'::uint4"),
+        ("uint64", 0, "'0'::uint8"),
+        ("uint64", (2**64 - 1), f"'{2**64 - 1}'::uint8"),
+        ("ulonglong", 0, "'0'::uint8"),
+        ("ulonglong", (2**64 - 1), f"'{2**64 - 1}'::uint8"),
     ],
 )
 @pytest.mark.parametrize("fmt_in", PyFormat)
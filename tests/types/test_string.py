@@ -5,6 +5,8 @@ from gaussdb import Binary
 from gaussdb import errors as e
 from gaussdb import pq, sql
 from gaussdb.adapt import PyFormat
+from gaussdb.types.string import Blob, BlobBinaryLoader, BlobLoader, Clob
+from gaussdb.types.string import ClobBinaryLoader, ClobLoader, RawLoader
 
 from ..utils import eur
 from ..fix_crdb import crdb_encoding, crdb_scs_off
@@ -310,3 +312,81 @@ def test_bytea_array(conn, fmt_in, fmt_out):
     a = [bytes(range(0, 256))]
     (res,) = cur.execute(f"select %{fmt_in.value}::bytea[]", (a,)).fetchone()
     assert res == a
+
+
+#
+# tests with raw, blob, clob
+#
+
+
+@pytest.mark.parametrize("fmt_out", pq.Format)
+def test_load_raw(conn, fmt_out):
+    cur = conn.cursor(binary=fmt_out)
+    cur.execute("select 'DEADbeef'::raw")
+    assert cur.fetchone()[0] == b"\xde\xad\xbe\xef"
+
+
+@pytest.mark.parametrize("fmt_out", pq.Format)
+def test_load_blob(conn, fmt_out):
+    data = bytes(range(256)) * 100
+    cur = conn.cursor(binary=fmt_out)
+    cur.execute("select %s::raw::blob", (data.hex(),))
+    got = cur.fetchone()[0]
+    assert isinstance(got, Blob)
+    assert bytes(got) == data
+    assert got.view == data
+
+
+@pytest.mark.parametrize("fmt_out", pq.Format)
+def test_load_clob(conn, fmt_out):
+    cur = conn.cursor(binary=fmt_out)
+    cur.execute("select %s::clob", ("hello" + eur,))
+    got = cur.fetchone()[0]
+    assert isinstance(got, Clob)
+    assert str(got) == "hello" + eur
+
+
+@pytest.mark.parametrize("data", [b"DEADbeef", b"\\xdeadbeef"])
+def test_raw_loader(data):
+    assert RawLoader(0).load(data) == b"\xde\xad\xbe\xef"
+
+
+def test_raw_loader_bad():
+    with pytest.raises(e.DataError):
+        RawLoader(0).load(b"xyz")
+
+
+@pytest.mark.parametrize(
+    "loader, data", [(BlobLoader, b"00ff10"), (BlobBinaryLoader, b"\x00\xff\x10")]
+)
+def test_blob_loader(loader, data):
+    got = loader(0).load(data)
+    assert len(got) == 3
+    assert got == b"\x00\xff\x10"
+    assert bytes(got) == b"\x00\xff\x10"
+    assert got.view.tobytes() == b"\x00\xff\x10"
+    assert got == loader(0).load(data)
+    assert got != b"\x00"
+
+
+def test_blob_no_copy():
+    data = b"\x00\xff" * 1000
+    got = BlobBinaryLoader(0).load(data)
+    assert got.view.obj is data
+    assert bytes(got) is data
+
+
+@pytest.mark.parametrize("loader", [ClobLoader, ClobBinaryLoader])
+def test_clob_loader(loader):
+    got = loader(0).load(("hello" + eur).encode())
+    assert got == "hello" + eur
+    assert str(got) == "hello" + eur
+    assert len(got) == 6
+    assert got.view.tobytes() == ("hello" + eur).encode()
+
+
+def test_blob_slice():
+    data = memoryview(b"abcdef")[2:4]
+    got = BlobBinaryLoader(0).load(data)
+    assert bytes(got) == b"cd"
+    assert len(got) == 2
@@ -0,0 +1,113 @@
+from array import array
+
+import pytest
+
+from gaussdb import pq
+from gaussdb.adapt import Loader, PyFormat, Transformer
+from gaussdb.types import TypeInfo
+from gaussdb.types.vector import BoolVector, FloatVector
+
+samples_float = [[], [1.0], [1.0, -2.5, 3.25]]
+samples_bool = [[], [True], [True, False, True]]
+
+
+@pytest.fixture
+def vector_types(conn):
+    if not TypeInfo.fetch(conn, "floatvector"):
+        pytest.skip("vector types not available")
+
+
+@pytest.mark.parametrize("fmt_in", [PyFormat.TEXT, PyFormat.BINARY])
+@pytest.mark.parametrize("val", samples_float)
+@pytest.mark.parametrize("wrap", [list, lambda x: array("f", x)])
+def test_float_roundtrip(fmt_in, val, wrap):
+    tx = Transformer()
+    obj = FloatVector(wrap(val))
+    dumper = tx.get_dumper(obj, fmt_in)
+    loader = tx.get_loader(dumper.oid, dumper.format)
+    data = dumper.dump(obj)
+    assert data is not None
+    got = loader.load(data)
+    assert isinstance(got, array)
+    assert got.tolist() == val
+
+
+@pytest.mark.parametrize("fmt_in", [PyFormat.TEXT, PyFormat.BINARY])
+@pytest.mark.parametrize("val", samples_bool)
+def test_bool_roundtrip(fmt_in, val):
+    tx = Transformer()
+    obj = BoolVector(val)
+    dumper = tx.get_dumper(obj, fmt_in)
+    loader = tx.get_loader(dumper.oid, dumper.format)
+    data = dumper.dump(obj)
+    assert data is not None
+    assert loader.load(data) == val
+
+
+@pytest.mark.parametrize("data", [b"{1,2.5}", b"[1, 2.5]", b"{ 1 , 2.5 }"])
+def test_float_load_text(data):
+    oid = Transformer().adapters.types["floatvector"].oid
+    loader = Transformer().get_loader(oid, pq.Format.TEXT)
+    assert loader.load(data).tolist() == [1.0, 2.5]
+
+
+@pytest.mark.numpy
+@pytest.mark.parametrize("fmt_in", [PyFormat.TEXT, PyFormat.BINARY])
+@pytest.mark.parametrize("val", samples_float)
+def test_float_numpy(fmt_in, val):
+    np = pytest.importorskip("numpy")
+    from gaussdb.types.numpy import NPFloatVectorBinaryLoader, NPFloatVectorLoader
+
+    tx = Transformer()
+    obj = FloatVector(np.array(val, dtype="float64"))
+    dumper = tx.get_dumper(obj, fmt_in)
+    loader: Loader
+    if dumper.format == pq.Format.TEXT:
+        loader = NPFloatVectorLoader(dumper.oid)
+    else:
+        loader = NPFloatVectorBinaryLoader(dumper.oid)
+    data = dumper.dump(obj)
+    assert data is not None
+    got = loader.load(data)
+    assert got.dtype == np.float32
+    assert got.tolist() == val
+
+
+@pytest.mark.numpy
+@pytest.mark.parametrize("fmt_in", [PyFormat.TEXT, PyFormat.BINARY])
+@pytest.mark.parametrize("val", samples_bool)
+def test_bool_numpy(fmt_in, val):
+    np = pytest.importorskip("numpy")
+    from gaussdb.types.numpy import NPBoolVectorBinaryLoader, NPBoolVectorLoader
+
+    tx = Transformer()
+    obj = BoolVector(np.array(val, dtype="bool"))
+    dumper = tx.get_dumper(obj, fmt_in)
+    loader: Loader
+    if dumper.format == pq.Format.TEXT:
+        loader = NPBoolVectorLoader(dumper.oid)
+    else:
+        loader = NPBoolVectorBinaryLoader(dumper.oid)
+    data = dumper.dump(obj)
+    assert data is not None
+    got = loader.load(data)
+    assert got.dtype == np.bool_
+    assert got.tolist() == val
+
+
+@pytest.mark.parametrize("fmt_in", [PyFormat.TEXT, PyFormat.BINARY])
+@pytest.mark.parametrize("fmt_out", pq.Format)
+@pytest.mark.parametrize("val", samples_float[1:])
+def test_float_db(conn, vector_types, fmt_in, fmt_out, val):
+    cur = conn.cursor(binary=fmt_out)
+    cur.execute(f"select %{fmt_in.value}", (FloatVector(val),))
+    assert cur.fetchone()[0].tolist() == val
+
+
+@pytest.mark.parametrize("fmt_in", [PyFormat.TEXT, PyFormat.BINARY])
+@pytest.mark.parametrize("fmt_out", pq.Format)
+@pytest.mark.parametrize("val", samples_bool[1:])
+def test_bool_db(conn, vector_types, fmt_in, fmt_out, val):
+    cur = conn.cursor(binary=fmt_out)
+    cur.execute(f"select %{fmt_in.value}", (BoolVector(val),))
+    assert cur.fetchone()[0] == val
@@ -300,6 +300,7 @@ class RenameAsyncToSync(ast.NodeTransformer):  # type: ignore
         "AsyncScheduler": "Scheduler",
         "AsyncServerCursor": "ServerCursor",
         "AsyncTransaction": "Transaction",
+        "AsyncWaiter": "Waiter",
         "AsyncWriter": "Writer",
         "__aenter__": "__enter__",
         "__aexit__": "__exit__",